@@ -6,6 +6,37 @@ SCREEN_HEIGHT = 720
 SCREEN_TITLE = "Topdown Game"
 FPS = 60
 
+# Rendering - the world is drawn at 1/RENDER_SCALE resolution and scaled up once
+# per frame (4 draws it at 320x180); text and the HUD stay at full resolution
+RENDER_SCALE = 1
+
+# Dirty-rect display - the menu sends only the areas that changed instead of
+# flipping the whole frame (menu only: the level redraws the world and flips
+# every frame either way)
+DIRTY_RECT_DISPLAY = False
+
+# Logging - records go to an in-memory ring buffer (F6 or a crash writes it to
+# logs/); set a level name ('WARNING') to also print records at or above it
+LOG_ECHO_LEVEL = None
+
+# Memory audit - diff live surfaces and Python objects (gc, tracemalloc) across
+# chunk and interior transitions and log what was left behind (slow: tracemalloc
+# traces every allocation from the first transition on)
+MEMORY_AUDIT = False
+
+# Garbage collector policy - 'default' (Python's automatic collection) or
+# 'frame_loop' (opt-in: automatic collection off for the whole process, collect
+# at transitions, fades and between frames instead; F8 switches in the level)
+GC_POLICY = 'default'
+
+# Sampling profiler - seconds a capture runs (F9 in the level starts/stops one;
+# collapsed stacks are written to logs/)
+PROFILE_SECONDS = 10
+
+# Blit audit - render through a surface that reports blits of unconverted
+# surfaces, per-pixel alpha on opaque art and per-frame scaling (slow)
+BLIT_AUDIT = False
+
 # Game settings
 DEBUG_MODE = False
 
@@ -1,11 +1,20 @@
 """Simple game framework for pygame"""
 
+from game.log import Logger, log
+from game.memory import SurfaceAccountant, surface_memory, track_surface, TransitionAudit, transition_audit
+from game.frame_monitor import HitchDetector, hitch_detector, GCPolicy, gc_policy, transition
+from game.profiler import SamplingProfiler, profiler
+from game.blit_audit import BlitAudit, blit_audit, AuditedSurface, format_kind
 from game.entity import Entity
 from game.game_object import GameObject
 from game.ui_element import UIElement
+from game.render_target import RenderTarget, view_pos, view_size, view_rect, view_points
 from game.scene import Scene
 from game.level import Level
 from game.game import Game
 
-__all__ = ['Entity', 'GameObject', 'UIElement', 'Scene', 'Level', 'Game']
-
+__all__ = ['Logger', 'log', 'SurfaceAccountant', 'surface_memory', 'track_surface', 'TransitionAudit',
+           'transition_audit', 'HitchDetector', 'hitch_detector', 'GCPolicy', 'gc_policy', 'transition',
+           'SamplingProfiler', 'profiler', 'BlitAudit', 'blit_audit', 'AuditedSurface', 'format_kind',
+           'Entity', 'GameObject', 'UIElement', 'RenderTarget', 'view_pos', 'view_size', 'view_rect',
+           'view_points', 'Scene', 'Level', 'Game']
@@ -0,0 +1,193 @@
+"""Blit format audit - reports blits whose source surface makes them slow"""
+
+import functools
+import os
+import sys
+import weakref
+
+import pygame
+
+from config.settings import BLIT_AUDIT
+from game.log import log
+
+
+BLIT_AUDIT_SCALE_FRAMES = 3  # Frames a call site must blit freshly scaled surfaces in before it is reported
+AUDITED_TRANSFORMS = ('scale', 'smoothscale', 'scale_by', 'smoothscale_by', 'rotozoom')
+
+
+def format_kind(surface):
+    """Describe how a surface blits: 'opaque', 'colorkey' or 'alpha', plus ' rle'"""
+    flags = surface.get_flags()
+    if flags & pygame.SRCALPHA:
+        kind = 'alpha'
+    elif surface.get_colorkey() is not None:
+        kind = 'colorkey'
+    else:
+        kind = 'opaque'
+    return kind + ' rle' if flags & (pygame.RLEACCEL | pygame.RLEACCELOK) else kind
+
+
+def _site(frame):
+    """Get 'file:line' of a stack frame"""
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+
+class AuditedSurface(pygame.Surface):
+    """Render surface whose blit() and blits() report their sources to the audit"""
+
+    def blit(self, source, *args, **kwargs):
+        blit_audit.check(source, sys._getframe(1))
+        return super().blit(source, *args, **kwargs)
+
+    def blits(self, blit_sequence, *args, **kwargs):
+        blit_sequence = list(blit_sequence)
+        caller = sys._getframe(1)
+        for item in blit_sequence:
+            blit_audit.check(item[0], caller)
+        return super().blits(blit_sequence, *args, **kwargs)
+
+
+class BlitAudit:
+    """Finds blits that make SDL convert, blend or resample pixels it need not
+
+    When enabled, the game renders into an AuditedSurface (see wrap()) and
+    every blit onto it is checked for three problems:
+
+    - 'not display format': the source was never converted, so SDL converts
+      its pixels on every blit
+    - 'alpha on opaque art': per-pixel alpha with every pixel opaque - a
+      blend per pixel where a copy would do
+    - 'scaled every frame': the source came out of a pygame.transform scale
+      in the same frame, at the same call site for BLIT_AUDIT_SCALE_FRAMES
+      frames (transforms are wrapped while the audit is installed)
+
+    Each problem is logged once per blit call site and counted for
+    report_lines(). The first two are judged once per source surface, so a
+    surface redrawn with different contents keeps its first verdict.
+
+    Checking costs a few microseconds per blit plus a full-screen copy per
+    frame, so it is off unless BLIT_AUDIT is set.
+    """
+
+    def __init__(self, enabled=BLIT_AUDIT):
+        """Create the audit (install() puts it into effect)
+
+        Args:
+            enabled: Audit blits
+        """
+        self.enabled = enabled
+        self.checked = 0
+        self._sites = {}  # (problem, site) -> [blits, frames seen, last frame, source description]
+        self._verdicts = weakref.WeakKeyDictionary()  # source -> tuple of format problems
+        self._scaled = weakref.WeakKeyDictionary()  # transform result -> (frame, call site)
+        self._originals = {}  # transform name -> original function
+        self._display_format = None
+        self._alpha_format = None
+
+    def install(self):
+        """Record the display formats and wrap the scaling transforms (needs a display)"""
+        display = pygame.display.get_surface()
+        if not self.enabled or display is None or self._originals:
+            return
+        self._display_format = (display.get_bitsize(), display.get_masks())
+        reference = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        self._alpha_format = (reference.get_bitsize(), reference.get_masks())
+        for name in AUDITED_TRANSFORMS:
+            original = getattr(pygame.transform, name, None)
+            if original is not None:
+                self._originals[name] = original
+                setattr(pygame.transform, name, self._wrap_transform(original))
+        log.info('blit', "🔍 Blit audit installed")
+
+    def uninstall(self):
+        """Restore the original transforms"""
+        for name, original in self._originals.items():
+            setattr(pygame.transform, name, original)
+        self._originals.clear()
+
+    def wrap(self, surface):
+        """Get an audited surface with the same size and format as a surface
+
+        Args:
+            surface: Surface to imitate (the display, a render target...)
+
+        Returns:
+            AuditedSurface, or the surface itself if the audit is disabled
+        """
+        if not self.enabled:
+            return surface
+        self.install()
+        return AuditedSurface(surface.get_size(), surface.get_flags() & pygame.SRCALPHA, surface)
+
+    def check(self, source, caller):
+        """Check the source of one blit
+
+        Args:
+            source: Surface being blitted
+            caller: Stack frame of the code doing the blit
+        """
+        self.checked += 1
+        problems = self._verdicts.get(source)
+        if problems is None:
+            problems = self._verdicts[source] = self._judge(source)
+        scaled = self._scaled.get(source)
+        if scaled is not None and scaled[0] == log.frame:
+            problems += (f"scaled every frame (at {scaled[1]})",)
+        if not problems:
+            return
+
+        site = _site(caller)
+        for problem in problems:
+            stats = self._sites.get((problem, site))
+            if stats is None:
+                stats = self._sites[(problem, site)] = [0, 0, None, self._describe(source)]
+            stats[0] += 1
+            if stats[2] != log.frame:
+                stats[1] += 1
+                stats[2] = log.frame
+                report_at = BLIT_AUDIT_SCALE_FRAMES if problem.startswith('scaled') else 1
+                if stats[1] == report_at:
+                    log.warning('blit', "🔍 %s: %s (%s)", site, problem, stats[3])
+
+    def _judge(self, source):
+        """Get the format problems of a source surface"""
+        problems = ()
+        fmt = (source.get_bitsize(), source.get_masks())
+        if source.get_flags() & pygame.SRCALPHA:
+            if fmt != self._alpha_format:
+                problems += ('not display format',)
+            if source.get_width() and source.get_height() and pygame.surfarray.array_alpha(source).min() == 255:
+                problems += ('alpha on opaque art',)
+        elif fmt != self._display_format:
+            problems += ('not display format',)
+        return problems
+
+    @staticmethod
+    def _describe(source):
+        """Describe a source surface for reports"""
+        width, height = source.get_size()
+        return f"{width}x{height} {source.get_bitsize()}-bit {format_kind(source)}"
+
+    def _wrap_transform(self, original):
+        """Wrap a pygame.transform function to remember the surfaces it returns"""
+        @functools.wraps(original)
+        def wrapper(surface, *args, **kwargs):
+            result = original(surface, *args, **kwargs)
+            # Scaling into a given destination (the render target upscale) is intended
+            into = kwargs.get('dest_surface') or (args[1] if len(args) > 1 else None)
+            if not isinstance(into, pygame.Surface):
+                self._scaled[result] = (log.frame, _site(sys._getframe(1)))
+            return result
+        return wrapper
+
+    def report_lines(self):
+        """Get the problem blit sites as lines of text"""
+        lines = [f"🔍 Blit audit: {self.checked} blits checked, {len(self._sites)} problem sites"]
+        for (problem, site), (blits, frames, _, source) in sorted(self._sites.items(),
+                                                                  key=lambda item: -item[1][0]):
+            lines.append(f"   {blits:>8} blits {frames:>6} frames  {site:<24} {problem} ({source})")
+        return lines
+
+
+# Shared instance the game loop renders through in debug builds
+blit_audit = BlitAudit()
@@ -0,0 +1,212 @@
+"""Frame hitch detection and garbage collector scheduling"""
+
+import functools
+import gc
+import time
+from collections import Counter
+
+from config.settings import FPS, GC_POLICY
+from game.log import log
+from game.memory import transition_audit
+
+
+HITCH_BUDGET_MS = 1000 / FPS  # Frames whose update + render take longer are hitches
+HITCH_CAUSE_MS = 2.0  # Time a cause must take in a frame to be blamed for its hitch
+
+# Collector thresholds under the 'frame_loop' policy, checked between frames
+# instead of on allocation: young objects allowed before a generation 0
+# collection, generation 0 collections before a generation 1 one, and
+# generation 1 collections before a generation 2 one (so cycles that outlive
+# the young generations are still freed in a session without transitions)
+GC_FRAME_THRESHOLDS = (20000, 20, 10)
+GC_FULL_COLLECT_EVERY = 8  # Safe points between collections that include the frozen world
+
+
+class HitchDetector:
+    """Flags frames over budget and says what they spent the time on
+
+    The game loop brackets each frame with begin_frame()/end_frame(). Time
+    spent inside garbage collections (per generation, from gc.callbacks),
+    asset loads and scene transitions is added up per frame; a hitch is
+    blamed on every cause that took at least HITCH_CAUSE_MS of it, or on
+    'frame work' if none did. Counts are kept per GC policy, so switching
+    policy shows hitch counts before and after.
+    """
+
+    def __init__(self, budget_ms=HITCH_BUDGET_MS):
+        """Create the detector and hook into the garbage collector
+
+        Args:
+            budget_ms: Frame time over which a frame is a hitch
+        """
+        self.budget_ms = budget_ms
+        self.segment = GC_POLICY  # Name the current counts are kept under
+        self._segments = {}  # name -> {'frames', 'hitches', 'worst_ms', 'causes': Counter}
+        self._frame_start = None
+        self._causes = {}  # cause -> ms spent in the current frame
+        self._gc_start = None
+        gc.callbacks.append(self._on_gc)
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        self._frame_start = time.perf_counter()
+        self._causes.clear()
+
+    def note(self, cause, ms):
+        """Add time spent on a known cause to the current frame
+
+        Args:
+            cause: Short description ('asset load', 'enter_interior'...)
+            ms: Milliseconds spent
+        """
+        self._causes[cause] = self._causes.get(cause, 0.0) + ms
+
+    def end_frame(self):
+        """Finish timing a frame and record it if it was a hitch
+
+        Returns:
+            Frame time in milliseconds
+        """
+        if self._frame_start is None:
+            return 0.0
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000
+        self._frame_start = None
+
+        stats = self._segments.get(self.segment)
+        if stats is None:
+            stats = self._segments[self.segment] = {'frames': 0, 'hitches': 0, 'worst_ms': 0.0,
+                                                    'causes': Counter()}
+        stats['frames'] += 1
+        if frame_ms > self.budget_ms:
+            blamed = [cause for cause, ms in self._causes.items() if ms >= HITCH_CAUSE_MS] or ['frame work']
+            stats['hitches'] += 1
+            stats['worst_ms'] = max(stats['worst_ms'], frame_ms)
+            stats['causes'].update(blamed)
+            log.debug('frame', "🐢 Hitch: %.1f ms (%s)", frame_ms,
+                      ', '.join(f"{cause} {self._causes.get(cause, 0.0):.1f} ms" for cause in blamed))
+        return frame_ms
+
+    def _on_gc(self, phase, info):
+        """gc.callbacks hook timing each collection"""
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self.note(f"gc gen {info['generation']}", (time.perf_counter() - self._gc_start) * 1000)
+            self._gc_start = None
+
+    def report_lines(self):
+        """Get the hitch counts of every segment as lines of text"""
+        lines = [f"🐢 Hitches (budget {self.budget_ms:.1f} ms):"]
+        for name, stats in self._segments.items():
+            causes = ', '.join(f"{cause} x{count}" for cause, count in stats['causes'].most_common())
+            rate = stats['hitches'] / stats['frames'] if stats['frames'] else 0.0
+            lines.append(f"   {name:<12}{stats['hitches']:>6} / {stats['frames']} frames ({rate:.1%}), "
+                         f"worst {stats['worst_ms']:.1f} ms{': ' + causes if causes else ''}")
+        return lines
+
+
+class GCPolicy:
+    """When the cyclic garbage collector may run
+
+    'default' leaves Python's automatic collection alone. 'frame_loop'
+    turns automatic collection off, so a collection never starts in the
+    middle of a frame. Instead the loaded world is collected and frozen
+    (gc.freeze) at safe points - after loading and after each transition -
+    so later collections skip it; young objects are collected while the
+    screen is fading, and every generation between frames once
+    GC_FRAME_THRESHOLDS is reached. It is opt-in: the collector stays off
+    for the whole process, including code that is not driven by the frame
+    loop.
+    """
+
+    POLICIES = ('default', 'frame_loop')
+
+    def __init__(self, name=GC_POLICY):
+        """Create the policy (apply() puts it into effect)
+
+        Args:
+            name: 'default' or 'frame_loop'
+        """
+        self.name = name
+        self._safe_points = 0
+
+    def apply(self, name=None):
+        """Put a policy into effect
+
+        Args:
+            name: Policy to switch to, or None to apply the current one
+        """
+        if name is not None:
+            self.name = name
+        if self.name == 'frame_loop':
+            gc.disable()
+            self.safe_point()
+        else:
+            gc.unfreeze()
+            gc.enable()
+        hitch_detector.segment = self.name
+        log.info('frame', "♻️ GC policy: %s", self.name)
+
+    def toggle(self):
+        """Switch to the next policy"""
+        self.apply(self.POLICIES[(self.POLICIES.index(self.name) + 1) % len(self.POLICIES)])
+
+    def safe_point(self):
+        """Collect and freeze what survives (after loading or a transition)
+
+        Frozen objects are skipped by collections, so this only walks what
+        was allocated since the last safe point. Every GC_FULL_COLLECT_EVERY
+        safe points everything is unfrozen and collected, so cycles dropped
+        from the frozen world (old chunks and interiors) are freed too.
+        """
+        if self.name != 'frame_loop':
+            return
+        self._safe_points += 1
+        if self._safe_points % GC_FULL_COLLECT_EVERY == 0:
+            gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+
+    def fade_point(self):
+        """Collect young objects while the screen is fading"""
+        if self.name == 'frame_loop':
+            gc.collect(0)
+
+    def end_of_frame(self):
+        """Run the collections the thresholds call for, between frames"""
+        if self.name != 'frame_loop':
+            return
+        young, collections, older_collections = gc.get_count()
+        if young <= GC_FRAME_THRESHOLDS[0]:
+            return
+        if older_collections >= GC_FRAME_THRESHOLDS[2]:
+            gc.collect(2)
+        else:
+            gc.collect(1 if collections >= GC_FRAME_THRESHOLDS[1] else 0)
+
+
+# Shared instances driven by the game loop
+hitch_detector = HitchDetector()
+gc_policy = GCPolicy()
+
+
+def transition(name):
+    """Decorator for level transition methods (chunk switches, entering houses...)
+
+    Times the transition for the hitch detector, audits memory across it
+    (see TransitionAudit) and then runs the GC policy's safe point.
+
+    Args:
+        name: Transition name used in reports
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            with transition_audit.audit(name):
+                result = method(*args, **kwargs)
+            hitch_detector.note(name, (time.perf_counter() - start) * 1000)
+            gc_policy.safe_point()
+            return result
+        return wrapper
+    return decorate
@@ -1,9 +1,16 @@
 """Main game engine class"""
 
+import traceback
+
 import pygame
 from typing import Optional
 from game.level import Level
 from game.scene import Scene
+from game.log import log
+from game.frame_monitor import hitch_detector, gc_policy
+from game.profiler import profiler
+from game.blit_audit import blit_audit
+from config.settings import DIRTY_RECT_DISPLAY
 
 
 class Game:
@@ -13,6 +20,8 @@ class Game:
         pygame.init()
         pygame.mixer.init()  # Initialize audio mixer
         self.screen = pygame.display.set_mode((width, height))
+        # Frames are drawn here - the screen itself, or an audited copy (see BLIT_AUDIT)
+        self.render_surface = blit_audit.wrap(self.screen)
         pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
         self.running = True
@@ -27,6 +36,9 @@ class Game:
         # Menu state
         self.menu_scene: Optional[Scene] = None
         self.game_state = 'MENU'  # MENU or PLAYING
+        
+        # Keep garbage collection out of the frame loop (see GC_POLICY)
+        gc_policy.apply()
     
     def set_menu(self, menu_scene: Scene):
         """Set the menu scene
@@ -36,7 +48,7 @@ class Game:
         """
         self.menu_scene = menu_scene
         self.game_state = 'MENU'
-        print("📋 Menu scene loaded")
+        log.info('engine', "📋 Menu scene loaded")
     
     def set_level(self, level: Level):
         """Set the current level
@@ -53,40 +65,42 @@ class Game:
     def start_game(self):
         """Transition from menu to game"""
         if self.initial_level_class:
-            print("🎮 Starting game...")
+            log.info('engine', "🎮 Starting game...")
             self.current_level = self.initial_level_class()
             self.current_level.game = self
             self.game_state = 'PLAYING'
-            print("✅ Game started!")
+            gc_policy.safe_point()  # Level loaded - freeze it out of later collections
+            log.info('engine', "✅ Game started!")
     
     def request_return_to_menu(self):
         """Request return to main menu (called by level on game over)"""
         self.return_to_menu_requested = True
-        print("🔙 Return to menu requested...")
+        log.info('engine', "🔙 Return to menu requested...")
     
     def return_to_menu(self):
         """Return to main menu"""
-        print("📋 Returning to main menu...")
+        log.info('engine', "📋 Returning to main menu...")
         if self.menu_scene:
             self.menu_scene.reset()  # Reset menu state
         self.current_level = None
         self.game_state = 'MENU'
         self.return_to_menu_requested = False
-        print("✅ Returned to menu!")
+        log.info('engine', "✅ Returned to menu!")
     
     def request_restart(self):
         """Request a game restart (called by level when game over)"""
         self.restart_requested = True
-        print("🔄 Game restart requested...")
+        log.info('engine', "🔄 Game restart requested...")
     
     def restart_game(self):
         """Restart the game by creating a fresh level instance"""
         if self.initial_level_class:
-            print("🎮 Restarting game from scratch...")
+            log.info('engine', "🎮 Restarting game from scratch...")
             # Create a completely new level instance
             self.current_level = self.initial_level_class()
             self.restart_requested = False
-            print("✅ Game restarted successfully!")
+            gc_policy.safe_point()
+            log.info('engine', "✅ Game restarted successfully!")
     
     def handle_events(self):
         """Handle pygame events"""
@@ -98,6 +112,9 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                # DEBUG: F6 writes the log buffer to logs/
+                elif event.key == pygame.K_F6:
+                    log.dump()
             
             # Pass events to current scene/level based on state
             if self.game_state == 'MENU' and self.menu_scene:
@@ -137,22 +154,47 @@ class Game:
                 self.current_level.update(dt)
     
     def render(self):
-        """Render everything"""
+        """Render everything
+        
+        Scenes and levels return None when the whole screen changed, or a
+        list of the rects that changed; with DIRTY_RECT_DISPLAY only those
+        are sent to the display. Only the menu returns rects - the level
+        redraws the world every frame.
+        """
+        dirty_rects = None
         if self.game_state == 'MENU' and self.menu_scene:
-            self.menu_scene.render(self.screen)
+            dirty_rects = self.menu_scene.render(self.render_surface)
         elif self.game_state == 'PLAYING' and self.current_level:
-            self.current_level.render(self.screen)
+            dirty_rects = self.current_level.render(self.render_surface)
+        if self.render_surface is not self.screen:
+            self.screen.blit(self.render_surface, (0, 0))
         
-        pygame.display.flip()
+        if DIRTY_RECT_DISPLAY and dirty_rects is not None:
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
     
     def run(self):
-        """Main game loop"""
-        while self.running:
-            dt = self.clock.tick(self.fps) / 1000.0  # Delta time in seconds
-            
-            self.handle_events()
-            self.update(dt)
-            self.render()
-        
-        pygame.quit()
+        """Main game loop (the log buffer is written to logs/ if it crashes)"""
+        try:
+            while self.running:
+                dt = self.clock.tick(self.fps) / 1000.0  # Delta time in seconds
+                log.frame += 1
+                
+                hitch_detector.begin_frame()
+                self.handle_events()
+                self.update(dt)
+                self.render()
+                gc_policy.end_of_frame()
+                hitch_detector.end_frame()
+                profiler.poll()
+        except Exception:
+            log.error('engine', "💥 Crash:\n%s", traceback.format_exc())
+            path = log.dump('crash')
+            if path:
+                print(f"📝 Crash log written to {path}")
+            raise
+        finally:
+            pygame.quit()
 
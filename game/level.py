@@ -3,6 +3,10 @@
 import pygame
 from typing import List, Optional
 from game.scene import Scene
+from game.render_target import RenderTarget
+from game.log import log
+from game.memory import track_surface
+from game.frame_monitor import gc_policy
 
 
 class Level:
@@ -22,6 +26,9 @@ class Level:
         self.last_fade_speed = 3  # Remember last fade speed for matching
         self.fade_surface = None  # Will be initialized when we know screen size
         self.fade_initialized = False
+        
+        # Low-resolution surface the world is drawn into (the screen itself at RENDER_SCALE 1)
+        self.render_target = RenderTarget()
     
     def add_scene(self, scene: Scene):
         """Add a scene to the level
@@ -50,6 +57,47 @@ class Level:
         if 0 <= index < len(self.scenes):
             self.current_scene_index = index
     
+    def push_scene(self, scene: Scene):
+        """Suspend the current scene and make a new one current
+        
+        The suspended scene keeps all of its state but gets no updates or
+        renders until pop_scene brings it back.
+        
+        Args:
+            scene: Scene instance to make current
+        """
+        current = self.get_current_scene()
+        if current:
+            current.active = False
+        scene.active = True
+        self.scenes.append(scene)
+        self.current_scene_index = len(self.scenes) - 1
+    
+    def pop_scene(self) -> Optional[Scene]:
+        """Remove the current scene and resume the one below it
+        
+        Returns:
+            The removed Scene instance, or None if there are no scenes
+        """
+        if not self.scenes:
+            return None
+        scene = self.scenes.pop()
+        scene.active = False
+        self.current_scene_index = len(self.scenes) - 1
+        resumed = self.get_current_scene()
+        if resumed:
+            resumed.active = True
+        return scene
+    
+    def replace_scenes(self, scene: Scene):
+        """Drop every scene (suspended ones included) and start over from one
+        
+        Args:
+            scene: Scene instance to make current
+        """
+        self.scenes.clear()
+        self.push_scene(scene)
+    
     def fade_to_black(self, speed=3):
         """Start a fade to black effect over the current scene
         
@@ -62,7 +110,7 @@ class Level:
         self.fade_speed = speed
         self.fade_direction = 1  # Fading TO black
         self.last_fade_speed = speed  # Remember for matching fade in
-        print(f"🎬 Fade to black started (speed: {speed})")
+        log.debug('engine', "🎬 Fade to black started (speed: %s)", speed)
     
     def fade_in_from_black(self, speed=3):
         """Start a fade in from black effect (revealing the scene)
@@ -76,13 +124,13 @@ class Level:
         self.fade_speed = speed
         self.fade_direction = -1  # Fading FROM black
         self.last_fade_speed = speed  # Remember for future fades
-        print(f"🎬 Fade in from black started (speed: {speed})")
+        log.debug('engine', "🎬 Fade in from black started (speed: %s)", speed)
     
     def reset_fade(self):
         """Reset the fade effect back to fully visible"""
         self.is_fading = False
         self.fade_alpha = 0
-        print("🎬 Fade reset")
+        log.debug('engine', "🎬 Fade reset")
     
     def update(self, dt):
         """Update the current scene
@@ -90,22 +138,21 @@ class Level:
         Args:
             dt: Delta time in seconds since last update
         """
-        # Update fade effect
+        # Update fade effect (a good time to collect garbage)
         if self.is_fading:
+            gc_policy.fade_point()
             self.fade_alpha += self.fade_speed * self.fade_direction
             
             if self.fade_direction == 1:  # Fading TO black
                 if self.fade_alpha >= 255:
-                    self.fade_alpha = 255
-                    print("🎬 Fade to black complete!")
-                    # Optionally stop fading once complete
-                    # self.is_fading = False
+                    self.fade_alpha = 255  # Stays black until faded back in or reset
+                    self.is_fading = False
+                    log.debug('engine', "🎬 Fade to black complete!")
             else:  # Fading FROM black (fade_direction == -1)
                 if self.fade_alpha <= 0:
                     self.fade_alpha = 0
-                    print("🎬 Fade in complete!")
-                    # Optionally stop fading once complete
-                    # self.is_fading = False
+                    self.is_fading = False
+                    log.debug('engine', "🎬 Fade in complete!")
         
         scene = self.get_current_scene()
         if scene:
@@ -120,7 +167,7 @@ class Level:
         # Initialize fade surface on first render (when we know screen size)
         if not self.fade_initialized:
             screen_size = screen.get_size()
-            self.fade_surface = pygame.Surface(screen_size)
+            self.fade_surface = track_surface(pygame.Surface(screen_size), self)
             self.fade_surface.fill((0, 0, 0))  # Black surface
             self.fade_initialized = True
         
@@ -134,10 +181,15 @@ class Level:
         
         Args:
             screen: pygame.Surface to render to
+        
+        Returns:
+            None - the world is redrawn every frame, so the whole screen changed
         """
         scene = self.get_current_scene()
         if scene:
-            scene.render(screen)
+            scene.render(self.render_target.begin(screen))
+            self.render_target.present(screen)
+            scene.render_overlay(screen)
         
         # Render fade overlay on top
         self._render_fade_overlay(screen)
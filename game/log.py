@@ -0,0 +1,150 @@
+"""Ring-buffer logger - categorized records kept in memory and written out on demand"""
+
+import os
+import time
+
+from config.settings import LOG_ECHO_LEVEL
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+LEVELS_BY_NAME = {name: level for level, name in LEVEL_NAMES.items()}
+
+LOG_CAPACITY = 4096  # Records kept (oldest overwritten first)
+LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+
+
+class Logger:
+    """Fixed-size in-memory log with per-category levels
+
+    A record is a tuple of (time, frame, category, level, message, args)
+    stored into a preallocated slot - nothing is formatted or printed while
+    the game runs. Messages use %-style placeholders and are only formatted
+    when the buffer is dumped, so a record costs one tuple; a call for a
+    category below its level returns after one dict lookup. Records at or
+    above echo_level are also printed; echoing is off by default, so a warning
+    in the middle of a frame costs no console write.
+
+    The buffer is only touched from the game thread: each write is a list
+    store and an integer increment, so there is no lock.
+    """
+
+    def __init__(self, capacity=LOG_CAPACITY, level=DEBUG, echo_level=LOG_ECHO_LEVEL):
+        """Create an empty log
+
+        Args:
+            capacity: Records kept
+            level: Default minimum level for categories without their own
+            echo_level: Name of the minimum level also printed to the console
+                ('WARNING'...), or None to print nothing
+        """
+        self.capacity = capacity
+        self.level = level
+        self.echo_level = ERROR + 1 if echo_level is None else LEVELS_BY_NAME[echo_level]
+        self.frame = 0  # Advanced by the game loop, stored with each record
+        self._levels = {}  # category -> minimum level
+        self._records = [None] * capacity
+        self._written = 0  # Records ever written (next slot is _written % capacity)
+
+    def set_level(self, category, level):
+        """Set the minimum level recorded for a category
+
+        Args:
+            category: Category name
+            level: DEBUG, INFO, WARNING or ERROR (ERROR + 1 disables it)
+        """
+        self._levels[category] = level
+
+    def enabled(self, category, level):
+        """Check whether a record would be kept (to skip building expensive args)"""
+        return level >= self._levels.get(category, self.level)
+
+    def log(self, category, level, message, *args):
+        """Record a message
+
+        Args:
+            category: Category name ('engine', 'level', 'spawn'...)
+            level: DEBUG, INFO, WARNING or ERROR
+            message: Message with %-style placeholders
+            *args: Values for the placeholders (formatted only when dumped)
+        """
+        if level < self._levels.get(category, self.level):
+            return
+        record = (time.perf_counter(), self.frame, category, level, message, args)
+        self._records[self._written % self.capacity] = record
+        self._written += 1
+        if level >= self.echo_level:
+            print(f"[{category}] {self.format_message(message, args)}")
+
+    def debug(self, category, message, *args):
+        """Record a message at DEBUG level (see log)"""
+        self.log(category, DEBUG, message, *args)
+
+    def info(self, category, message, *args):
+        """Record a message at INFO level (see log)"""
+        self.log(category, INFO, message, *args)
+
+    def warning(self, category, message, *args):
+        """Record a message at WARNING level (see log)"""
+        self.log(category, WARNING, message, *args)
+
+    def error(self, category, message, *args):
+        """Record a message at ERROR level (see log)"""
+        self.log(category, ERROR, message, *args)
+
+    def records(self):
+        """Get the kept records, oldest first
+
+        Returns:
+            List of (time, frame, category, level, message, args)
+        """
+        if self._written <= self.capacity:
+            return self._records[:self._written]
+        start = self._written % self.capacity
+        return self._records[start:] + self._records[:start]
+
+    @staticmethod
+    def format_message(message, args):
+        """Fill in a message's placeholders (never raises)"""
+        try:
+            return message % args if args else message
+        except (TypeError, ValueError):
+            return f"{message} {args!r}"
+
+    @classmethod
+    def format_record(cls, record):
+        """Format a record as one line of text"""
+        timestamp, frame, category, level, message, args = record
+        return (f"{timestamp:10.3f} #{frame:<6} {LEVEL_NAMES.get(level, level):<7} "
+                f"[{category}] {cls.format_message(message, args)}")
+
+    def dump(self, reason='manual'):
+        """Write every kept record to a file in LOG_DIR
+
+        Args:
+            reason: Short tag used in the file name ('manual', 'crash'...)
+
+        Returns:
+            Path of the file written, or None if it could not be written
+        """
+        records = self.records()
+        path = os.path.join(LOG_DIR, f"{reason}-{time.strftime('%Y%m%d-%H%M%S')}.log")
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                dropped = self._written - len(records)
+                if dropped:
+                    f.write(f"({dropped} older records overwritten)\n")
+                f.writelines(self.format_record(record) + '\n' for record in records)
+        except OSError as e:
+            self.warning('engine', "⚠️ Could not write log dump: %s", e)
+            return None
+        self.info('engine', "📝 Dumped %s log records to %s", len(records), path)
+        return path
+
+
+# Shared instance used by the engine and the game
+log = Logger()
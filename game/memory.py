@@ -0,0 +1,257 @@
+"""Surface memory accounting - live pixel bytes per owner and a transition leak audit"""
+
+import gc
+import os
+import time
+import tracemalloc
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+
+from config.settings import MEMORY_AUDIT
+from game.log import log, LOG_DIR
+
+
+AUDIT_TRACE_FRAMES = 8  # Stack depth tracemalloc records while auditing
+AUDIT_TOP = 8  # Lines of each diff logged per transition
+LEAK_STREAK = 3  # Transitions of one kind in a row that all grew before warning
+
+
+def owner_label(owner):
+    """Get the accounting label of an owner
+
+    Args:
+        owner: Label string, or an object - its memory_tag attribute if set
+            (chunks and interiors add their position/layout), else its class name
+
+    Returns:
+        str label
+    """
+    if isinstance(owner, str):
+        return owner
+    return getattr(owner, 'memory_tag', None) or type(owner).__name__
+
+
+def surface_bytes(surface):
+    """Get the pixel memory a surface owns (0 for subsurfaces, which share their parent's)"""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceAccountant:
+    """Live surfaces created through the engine, grouped by owner
+
+    Code that creates a surface passes it through track() with its owner
+    (a scene, entity, UI element or a label string such as 'assets'). The
+    accountant keeps live and peak bytes per owner label, and forgets a
+    surface when pygame frees it. Only long-lived surfaces are tracked:
+    tracking adds a finalizer per surface, so scratch buffers are kept and
+    reused by their owner instead of allocated every frame.
+    """
+
+    def __init__(self):
+        self.live_bytes = 0
+        self.peak_bytes = 0
+        self.live_count = 0
+        self.allocations = 0
+        self._labels = {}  # label -> [live count, live bytes, peak bytes, allocations]
+
+    def track(self, surface, owner):
+        """Record a new surface
+
+        Args:
+            surface: pygame.Surface just created
+            owner: Object or label string it belongs to (see owner_label)
+
+        Returns:
+            The same surface, so creation and tracking can be one expression
+        """
+        size = surface_bytes(surface)
+        label = owner_label(owner)
+        stats = self._labels.get(label)
+        if stats is None:
+            stats = self._labels[label] = [0, 0, 0, 0]
+        stats[0] += 1
+        stats[1] += size
+        stats[2] = max(stats[2], stats[1])
+        stats[3] += 1
+        self.live_count += 1
+        self.live_bytes += size
+        self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+        self.allocations += 1
+        weakref.finalize(surface, self._forget, label, size)
+        return surface
+
+    def _forget(self, label, size):
+        """Remove a freed surface from the totals"""
+        stats = self._labels[label]
+        stats[0] -= 1
+        stats[1] -= size
+        self.live_count -= 1
+        self.live_bytes -= size
+
+    def by_label(self):
+        """Get the statistics of every owner label
+
+        Returns:
+            dict label -> (live count, live bytes, peak bytes, allocations),
+            largest live bytes first
+        """
+        return dict(sorted(((label, tuple(stats)) for label, stats in self._labels.items()),
+                           key=lambda item: -item[1][1]))
+
+    def summary(self):
+        """Get a one-line summary for the debug HUD"""
+        return (f"Surfaces: {self.live_count} live, {self.live_bytes / 1048576:.1f} MB "
+                f"(peak {self.peak_bytes / 1048576:.1f} MB)")
+
+    def report_lines(self):
+        """Get the full report as lines of text"""
+        lines = [self.summary() + f", {self.allocations} created",
+                 f"   {'live':>6}{'KB':>9}{'peak KB':>9}{'created':>9}  owner"]
+        for label, (count, live, peak, created) in self.by_label().items():
+            lines.append(f"   {count:>6}{live // 1024:>9}{peak // 1024:>9}{created:>9}  {label}")
+        return lines
+
+    def write_report(self):
+        """Write the report to a file in LOG_DIR
+
+        Returns:
+            Path of the file written, or None if it could not be written
+        """
+        path = os.path.join(LOG_DIR, f"memory-{time.strftime('%Y%m%d-%H%M%S')}.txt")
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(self.report_lines()) + '\n')
+        except OSError as e:
+            log.warning('memory', "⚠️ Could not write memory report: %s", e)
+            return None
+        log.info('memory', "🧠 Memory report written to %s", path)
+        return path
+
+
+# Shared instance every engine surface is tracked in
+surface_memory = SurfaceAccountant()
+
+
+def track_surface(surface, owner):
+    """Record a surface in the shared accountant (see SurfaceAccountant.track)"""
+    return surface_memory.track(surface, owner)
+
+
+class TransitionAudit:
+    """Diffs live surfaces and Python objects across scene transitions
+
+    Each audited transition takes a snapshot before and after (after a full
+    collection, so only objects that are still reachable count): surfaces per
+    owner, gc-tracked objects per type and, with tracemalloc, allocations
+    per source line. tracemalloc starts with the first audit and keeps
+    running (stopping it can crash while the audio thread allocates); its
+    traces are cleared before each transition, so a snapshot only walks what
+    that transition allocated and does not get slower as the session goes
+    on. The differences are logged in the 'memory' category; a
+    transition that grows live surfaces LEAK_STREAK times in a row is
+    reported as a likely leak.
+
+    Snapshots walk every object, so auditing is off unless MEMORY_AUDIT is set.
+    """
+
+    def __init__(self, enabled=MEMORY_AUDIT):
+        """Create the audit
+
+        Args:
+            enabled: Take snapshots (False makes audit() free)
+        """
+        self.enabled = enabled
+        self._streaks = Counter()  # transition -> consecutive runs that grew
+
+    @contextmanager
+    def audit(self, name):
+        """Context manager wrapping one transition
+
+        Args:
+            name: Transition name ('switch_chunk', 'enter_interior'...)
+        """
+        if not self.enabled:
+            yield
+            return
+        if tracemalloc.is_tracing():
+            tracemalloc.clear_traces()
+        else:
+            tracemalloc.start(AUDIT_TRACE_FRAMES)
+        before = self._snapshot()
+        yield
+        after = self._snapshot(ignore=before)
+        self._report(name, before, after)
+
+    @staticmethod
+    def _snapshot(ignore=None):
+        """Collect garbage, then record surfaces, object types and allocations
+
+        Args:
+            ignore: Earlier snapshot whose own containers are left out of the
+                object counts
+        """
+        gc.collect()
+        skip = {id(ignore)} | {id(value) for value in ignore.values()} if ignore else set()
+        types = {}
+        for obj in gc.get_objects():
+            if id(obj) not in skip:
+                name = type(obj).__name__
+                types[name] = types.get(name, 0) + 1
+        trace = None
+        if tracemalloc.is_tracing():
+            # Plain (file, line) -> bytes, so the snapshot itself is not kept alive
+            trace = {}
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ))
+            for stat in snapshot.statistics('lineno'):
+                frame = stat.traceback[0]
+                trace[(frame.filename, frame.lineno)] = stat.size
+        return {
+            'surfaces': {label: stats[:2] for label, stats in surface_memory.by_label().items()},
+            'surface_bytes': surface_memory.live_bytes,
+            'types': types,
+            'trace': trace,
+        }
+
+    def _report(self, name, before, after):
+        """Log what a transition left behind"""
+        grown = after['surface_bytes'] - before['surface_bytes']
+        log.info('memory', "🧠 %s: surfaces %+d KB (%d KB live)", name, grown // 1024,
+                 after['surface_bytes'] // 1024)
+
+        for label in sorted(set(before['surfaces']) | set(after['surfaces'])):
+            count_before, bytes_before = before['surfaces'].get(label, (0, 0))
+            count_after, bytes_after = after['surfaces'].get(label, (0, 0))
+            if (count_before, bytes_before) != (count_after, bytes_after):
+                log.info('memory', "   %-28s %+4d surfaces %+8d KB", label,
+                         count_after - count_before, (bytes_after - bytes_before) // 1024)
+
+        type_growth = Counter(after['types'])
+        type_growth.subtract(before['types'])
+        for type_name, count in type_growth.most_common(AUDIT_TOP):
+            if count <= 0:
+                break
+            log.info('memory', "   +%-6d %s objects", count, type_name)
+
+        if before['trace'] is not None and after['trace'] is not None:
+            line_growth = Counter(after['trace'])
+            line_growth.subtract(before['trace'])
+            for (filename, lineno), size in line_growth.most_common(AUDIT_TOP):
+                if size < 1024:
+                    break
+                log.info('memory', "   %+8d KB %s:%d", size // 1024, filename, lineno)
+
+        self._streaks[name] = self._streaks[name] + 1 if grown > 0 else 0
+        if self._streaks[name] >= LEAK_STREAK:
+            log.warning('memory', "⚠️ Surfaces grew over %d %s transitions in a row - likely leak",
+                        self._streaks[name], name)
+
+
+# Shared instance used by the level transitions
+transition_audit = TransitionAudit()
@@ -0,0 +1,160 @@
+"""Statistical stack sampler for profiling the game thread while it runs"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from config.settings import PROFILE_SECONDS
+from game.log import log, LOG_DIR
+
+
+PROFILE_SAMPLE_INTERVAL = 0.005  # Seconds between stack samples (200 Hz)
+PROFILE_MAX_DEPTH = 64  # Innermost frames kept per sample
+PROFILE_SWITCH_INTERVAL = 0.0005  # GIL switch interval while capturing (seconds)
+
+
+class SamplingProfiler:
+    """Samples the game thread's call stack from a background thread
+
+    A capture runs for a fixed time (or until stopped): every
+    PROFILE_SAMPLE_INTERVAL the sampler thread reads the game thread's
+    current frame through sys._current_frames() and counts the call stack,
+    rooted at a tag naming what the game was showing (scene type and chunk
+    or interior id). The game thread is never interrupted beyond the GIL
+    handoff, so frame timing stays close to a normal session - unlike
+    cProfile, which hooks every call. The sampler can only run when the game
+    thread hands over the GIL, so the switch interval is shortened for the
+    capture; otherwise samples would pile up on C calls that release it
+    (display flips, clock ticks) and miss pure Python work.
+
+    Stacks are written in the collapsed format ("tag;outer;...;inner count"
+    per line) that flamegraph.pl and speedscope read. Only the game thread
+    writes files and logs: poll() does it once a capture has finished.
+    """
+
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL, max_depth=PROFILE_MAX_DEPTH):
+        """Create an idle profiler
+
+        Args:
+            interval: Seconds between samples
+            max_depth: Innermost frames kept per sample
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks = Counter()  # collapsed stack -> samples
+        self.samples = 0
+        self._thread = None
+        self._stop = threading.Event()
+        self._finished = False
+        self._start_tag = ''
+        self._started = 0.0
+        self._frame_names = {}  # code object -> frame name
+        self._switch_interval = None  # Interpreter setting to restore after the capture
+
+    @property
+    def running(self):
+        """Whether a capture is in progress"""
+        return self._thread is not None
+
+    def start(self, seconds=PROFILE_SECONDS, tag=None):
+        """Start sampling the calling thread (call from the game thread)
+
+        Args:
+            seconds: Capture length
+            tag: Callable returning the current tag, read at every sample,
+                or None for no tag
+        """
+        if self.running:
+            return
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop.clear()
+        self._finished = False
+        tag = tag or (lambda: '')
+        self._start_tag = tag()
+        self._started = time.perf_counter()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(PROFILE_SWITCH_INTERVAL)
+        self._thread = threading.Thread(target=self._sample, name='profiler', daemon=True,
+                                        args=(threading.get_ident(), seconds, tag))
+        self._thread.start()
+        log.info('profile', "⏱️ Profiling %s for %ss", self._start_tag or 'game thread', seconds)
+
+    def stop(self):
+        """End the capture early (the output is written by the next poll())"""
+        self._stop.set()
+
+    def toggle(self, seconds=PROFILE_SECONDS, tag=None):
+        """Start a capture, or end the running one (see start)"""
+        if self.running:
+            self.stop()
+        else:
+            self.start(seconds, tag)
+
+    def poll(self):
+        """Write the output of a finished capture (called once per frame)
+
+        Returns:
+            Path of the file written, or None
+        """
+        if not self._finished:
+            return None
+        self._thread.join()
+        self._thread = None
+        self._finished = False
+        sys.setswitchinterval(self._switch_interval)
+        elapsed = time.perf_counter() - self._started
+        log.info('profile', "⏱️ %s samples over %.1fs (%s distinct stacks)",
+                 self.samples, elapsed, len(self.stacks))
+        return self.write()
+
+    def write(self):
+        """Write the collapsed stacks to a file in LOG_DIR
+
+        Returns:
+            Path of the file written, or None if it could not be written
+        """
+        slug = re.sub(r'[^A-Za-z0-9]+', '-', self._start_tag).strip('-')
+        path = os.path.join(LOG_DIR, f"profile-{slug + '-' if slug else ''}{time.strftime('%Y%m%d-%H%M%S')}.txt")
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.writelines(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+        except OSError as e:
+            log.warning('profile', "⚠️ Could not write profile: %s", e)
+            return None
+        log.info('profile', "⏱️ Profile written to %s", path)
+        return path
+
+    def _sample(self, thread_id, seconds, tag):
+        """Sampler thread body"""
+        deadline = time.perf_counter() + seconds
+        while not self._stop.wait(self.interval) and time.perf_counter() < deadline:
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                break  # Game thread gone
+            names = []
+            while frame is not None and len(names) < self.max_depth:
+                names.append(self._frame_name(frame.f_code))
+                frame = frame.f_back
+            names.append(tag() or 'game')
+            names.reverse()
+            self.stacks[';'.join(names)] += 1
+            self.samples += 1
+        self._finished = True
+
+    def _frame_name(self, code):
+        """Get 'function (file:line)' for a code object, cached"""
+        name = self._frame_names.get(code)
+        if name is None:
+            qualname = getattr(code, 'co_qualname', code.co_name)
+            name = f"{qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._frame_names[code] = name
+        return name
+
+
+# Shared instance started from the debug hotkey
+profiler = SamplingProfiler()
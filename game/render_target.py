@@ -0,0 +1,76 @@
+"""Low-resolution world render target and world-to-view coordinate helpers"""
+
+import pygame
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_SCALE
+from game.memory import track_surface
+from game.blit_audit import blit_audit
+
+
+# Size of the surface the world is drawn into (320x180 at RENDER_SCALE 4)
+VIEW_WIDTH = SCREEN_WIDTH // RENDER_SCALE
+VIEW_HEIGHT = SCREEN_HEIGHT // RENDER_SCALE
+
+
+def view_pos(x, y):
+    """Convert a world position to a position on the world render target"""
+    return (int(x) // RENDER_SCALE, int(y) // RENDER_SCALE)
+
+
+def view_size(width, height):
+    """Convert a world size to a size on the world render target (at least 1x1)"""
+    return (max(1, round(width / RENDER_SCALE)), max(1, round(height / RENDER_SCALE)))
+
+
+def view_rect(rect):
+    """Convert a world rect to a rect on the world render target"""
+    rect = pygame.Rect(rect)
+    return pygame.Rect(view_pos(rect.x, rect.y), view_size(rect.width, rect.height))
+
+
+def view_points(points):
+    """Convert a list of world points to points on the world render target"""
+    return [view_pos(x, y) for x, y in points]
+
+
+class RenderTarget:
+    """Surface the world is drawn into before one integer upscale to the screen
+
+    With RENDER_SCALE 1 the world is drawn straight onto the screen. With a
+    larger scale, world art is kept at 1/RENDER_SCALE size, the world is
+    drawn into a VIEW_WIDTH x VIEW_HEIGHT surface and scaled up once per
+    frame; text and debug overlays are then drawn at full resolution on top.
+    """
+
+    def __init__(self, scale=RENDER_SCALE):
+        """Create the render target
+
+        Args:
+            scale: Integer upscale from the world surface to the screen
+        """
+        self.scale = scale
+        self.surface = None
+        if scale > 1:
+            self.surface = pygame.Surface((SCREEN_WIDTH // scale, SCREEN_HEIGHT // scale))
+            if pygame.display.get_surface():
+                self.surface = blit_audit.wrap(self.surface.convert())
+            track_surface(self.surface, self)
+
+    def begin(self, screen):
+        """Get the surface to draw the world into this frame
+
+        Args:
+            screen: Display surface
+
+        Returns:
+            pygame.Surface in view coordinates
+        """
+        return screen if self.surface is None else self.surface
+
+    def present(self, screen):
+        """Scale the world surface up onto the screen (nothing to do at scale 1)
+
+        Args:
+            screen: Display surface
+        """
+        if self.surface is not None:
+            pygame.transform.scale(self.surface, screen.get_size(), screen)
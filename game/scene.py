@@ -16,6 +16,11 @@ class Scene:
         self.background_color = (0, 0, 0)
         self.active = True
     
+    @property
+    def memory_tag(self):
+        """Label the scene's surfaces are accounted under (see game.memory)"""
+        return self.name
+    
     def add_game_object(self, obj: GameObject):
         """Add a game object to the scene
         
@@ -66,23 +71,47 @@ class Scene:
             ui.update(dt)
     
     def render(self, screen):
-        """Render all entities in the scene
+        """Render the world (game objects) of the scene
         
         Args:
-            screen: pygame.Surface to render to
+            screen: pygame.Surface to render to (the level's world render
+                target - positions go through view_pos and friends)
         """
         screen.fill(self.background_color)
         
-        # Render game objects first (background layer)
+        # Render game objects (background layer)
         for obj in self.game_objects:
             if obj.visible:
                 obj.render(screen)
+    
+    def render_overlay(self, screen):
+        """Render text, UI and debug drawing at full resolution over the world
         
+        Args:
+            screen: Display surface (world coordinates, no view conversion)
+        """
         # Render UI elements on top (foreground layer)
         for ui in self.ui_elements:
             if ui.visible:
                 ui.render(screen)
     
+    def ui_dirty_rects(self):
+        """Get the screen areas the UI elements changed since the last call
+        
+        Returns:
+            List of pygame.Rect, or None if an element can't tell (elements
+            that override render() instead of compose())
+        """
+        rects = []
+        unknown = False
+        for ui in self.ui_elements:
+            rect = ui.take_dirty_rect()
+            if rect is False:
+                unknown = True
+            elif rect is not None:
+                rects.append(rect)
+        return None if unknown else rects
+    
     def handle_event(self, event):
         """Pass events to UI elements
         
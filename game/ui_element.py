@@ -2,23 +2,109 @@
 
 import pygame
 from game.entity import Entity
+from game.memory import track_surface
 
 
 class UIElement(Entity):
-    """UI elements (buttons, text, HUD, etc.)"""
+    """UI elements (buttons, text, HUD, etc.)
+    
+    Elements either override render() to draw themselves, or implement
+    compose() to draw into a surface that is cached and blitted every frame.
+    Composed elements call mark_dirty() when a value they show changes; the
+    surface is only rebuilt then.
+    """
     
     def __init__(self, x=0, y=0):
         super().__init__(x, y)
+        self.dirty = True  # Composed surface must be rebuilt
+        self.compose_offset = (0, 0)  # Top-left of the composed surface relative to (x, y)
+        self._composed = None
+        self._drawn_rect = None  # Screen area covered by the last render
+        self._dirty_area = None  # Screen area changed since take_dirty_rect()
     
     def update(self, dt):
         """UI elements typically don't need physics updates"""
         if self.active:
             pass  # Handle UI logic in subclasses
     
+    def mark_dirty(self):
+        """Rebuild the composed surface before the next render"""
+        self.dirty = True
+    
+    def compose(self):
+        """Draw the element into a new surface (override for cached elements)
+        
+        May set compose_offset when the surface starts above or left of
+        (x, y).
+        
+        Returns:
+            pygame.Surface, or None if the element overrides render() instead
+        """
+        return None
+    
+    def compose_parts(self, parts):
+        """Blit surfaces into one transparent surface just big enough for them
+        
+        Sets compose_offset to where the surface goes relative to (x, y).
+        
+        Args:
+            parts: List of (surface, (x, y)) relative to the element position
+        
+        Returns:
+            pygame.Surface
+        """
+        bounds = pygame.Rect(parts[0][0].get_rect(topleft=parts[0][1])).unionall(
+            [surface.get_rect(topleft=pos) for surface, pos in parts[1:]]
+        )
+        composed = track_surface(pygame.Surface(bounds.size, pygame.SRCALPHA), self)
+        composed.blits([(surface, (x - bounds.x, y - bounds.y)) for surface, (x, y) in parts], doreturn=False)
+        self.compose_offset = bounds.topleft
+        return composed
+    
     def render(self, screen):
-        """Override in subclasses to implement rendering"""
-        if self.visible:
-            pass  # Implement rendering in subclasses
+        """Blit the composed surface, rebuilding it first if dirty
+        
+        Args:
+            screen: pygame.Surface to render to
+        """
+        self._refresh()
+        if self.visible and self._composed is not None:
+            screen.blit(self._composed, self._drawn_rect)
+    
+    def _refresh(self):
+        """Rebuild the composed surface if dirty and track the area it covers
+        
+        Areas whose pixels changed (rebuilt, moved or hidden) are added to
+        the dirty area.
+        """
+        rebuilt = self.dirty and self.visible
+        if rebuilt:
+            self._composed = self.compose()
+            self.dirty = False
+        
+        rect = None
+        if self.visible and self._composed is not None:
+            rect = self._composed.get_rect(topleft=(self.x + self.compose_offset[0],
+                                                    self.y + self.compose_offset[1]))
+        if rebuilt or rect != self._drawn_rect:
+            for area in (self._drawn_rect, rect):
+                if area is not None:
+                    self._dirty_area = area if self._dirty_area is None else self._dirty_area.union(area)
+        self._drawn_rect = rect
+    
+    def take_dirty_rect(self):
+        """Get the screen area the element changed since the last call
+        
+        Only composed elements track this; others always count as changed.
+        
+        Returns:
+            pygame.Rect, None if nothing changed, or False if unknown
+        """
+        self._refresh()
+        if self._composed is None and self.visible:
+            return False
+        area, self._dirty_area = self._dirty_area, None
+        return area
     
     def handle_event(self, event):
         """Handle pygame events (clicks, hover, etc.)
@@ -27,4 +113,3 @@ class UIElement(Entity):
             event: pygame.Event to handle
         """
         pass
-
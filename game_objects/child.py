@@ -2,8 +2,10 @@
 
 import pygame
 import math
-import os
+import random
+from game import log, view_pos, view_size, view_points
 from game_objects.enemy import Enemy
+from utils.assets import assets
 
 
 class Child(Enemy):
@@ -16,59 +18,90 @@ class Child(Enemy):
     CHILD_WIDTH = SPRITE_WIDTH_ON_SHEET * SPRITE_SCALE_FACTOR  # 48px
     CHILD_HEIGHT = SPRITE_HEIGHT_ON_SHEET * SPRITE_SCALE_FACTOR  # 96px
     
-    def __init__(self, x, y, speed=60):
+    # Collision rect at feet (70% width x 20% height)
+    COLLISION_WIDTH = int(CHILD_WIDTH * 0.7)  # ~34px
+    COLLISION_HEIGHT = int(CHILD_HEIGHT * 0.2)  # ~19px
+    COLLISION_X_OFFSET = int(CHILD_WIDTH * 0.25)  # Recenter horizontally
+    COLLISION_Y_OFFSET = int(CHILD_HEIGHT * 0.65)  # Position at feet
+    
+    def __init__(self, x, y, speed=60, rng=None):
         """Initialize child enemy at position
         
         Args:
             x: X position
             y: Y position
             speed: Movement speed (pixels per second, default 60 - slower than adults)
+            rng: random.Random the wandering directions are drawn from (the
+                scene's seeded one keeps an interior reproducible), or None
+                for the random module
         """
         # Call GameObject's __init__ directly to avoid Enemy's __init__
         from game import GameObject
         GameObject.__init__(self, x, y)
         
-        self.speed = speed
         self.width = self.CHILD_WIDTH
         self.height = self.CHILD_HEIGHT
         
-        # Load child sprite animations (character.png)
+        # Load child sprite animations (character.png frames are shared by all children)
         self.sprite_sheet = self._load_sprite_sheet()
-        self.current_state = 'walk_down'
-        self.current_animation = self.sprite_sheet.get(self.current_state, [])
-        
-        # Animation state
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.frame_interval = 10
         
         # Collision rect - much smaller for child (at feet)
-        # Width: 70% of sprite, Height: 20% of sprite
-        collision_width = int(self.CHILD_WIDTH * 0.7)  # ~34px
-        self.collision_height = int(self.CHILD_HEIGHT * 0.2)  # ~19px
+        self.collision_height = self.COLLISION_HEIGHT
         
         # Position collision rect at feet
-        self.x_offset = int(self.CHILD_WIDTH * 0.25)  # Recenter horizontally
-        self.y_offset = int(self.CHILD_HEIGHT * 0.65)  # Position at feet
+        self.x_offset = self.COLLISION_X_OFFSET
+        self.y_offset = self.COLLISION_Y_OFFSET
         
-        self.rect = pygame.Rect(
-            int(self.x) + self.x_offset,
-            int(self.y) + self.y_offset,
-            collision_width,
-            self.collision_height
-        )
+        self.rect = pygame.Rect(0, 0, self.COLLISION_WIDTH, self.collision_height)
         
         # Sight cone properties (slightly longer than base Enemy)
         self.sight_range = 180  # Longer than Enemy's 150
         self.field_of_view = math.radians(60)  # 60 degree cone
-        self.facing_angle = 0.0  # Radians
+        self.move_interval = 90  # Change direction every 1.5 seconds at 60 FPS
+        
+        self.reset(x, y, speed, rng)
+    
+    def reset(self, x, y, speed=60, rng=None):
+        """Put the child back in its just-spawned state (used by object pools)
+        
+        Args:
+            x: X position
+            y: Y position
+            speed: Movement speed (pixels per second)
+            rng: random.Random the wandering directions are drawn from, or
+                None for the random module
+        """
+        self.x = x
+        self.y = y
+        self.active = True
+        self.visible = True
+        self.speed = speed
+        self.rng = rng or random
+        
+        # Animation state
+        self.current_state = 'walk_down'
+        self.current_animation = self.sprite_sheet.get(self.current_state, [])
+        self.frame_index = 0
+        self.frame_timer = 0
+        self.frame_interval = 10
+        
+        self.rect.x = int(self.x) + self.x_offset
+        self.rect.y = int(self.y) + self.y_offset
         
         # Movement AI
+        self.facing_angle = 0.0  # Radians
         self.move_timer = 0
-        self.move_interval = 90  # Change direction every 1.5 seconds at 60 FPS
         self.last_moving_dx = 1
         self.last_moving_dy = 0
         
+        # Patrol navigation (set by the scene via set_patrol)
+        self.nav_grid = None
+        self.patrol_route = None
+        self.patrol_index = 0
+        self.sidestep_timer = 0
+        self.sidestep_dx = 0.0
+        self.sidestep_dy = 0.0
+        
         # Set initial random direction
         self.set_random_direction()
         
@@ -76,61 +109,19 @@ class Child(Enemy):
         self.debug_los_clear = False
     
     def _load_sprite_sheet(self):
-        """Load child sprite sheet from character.png"""
-        try:
-            # Load from assets/character.png (root assets folder)
-            assets_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets')
-            sprite_path = os.path.join(assets_dir, 'character.png')
-            
-            sheet = pygame.image.load(sprite_path).convert_alpha()
-            sheet_width = sheet.get_width()
-            num_sprites = sheet_width // self.SPRITE_WIDTH_ON_SHEET
-            
-            print(f"✅ Child sprite sheet loaded: {num_sprites} frames at {self.CHILD_WIDTH}x{self.CHILD_HEIGHT}")
-            
-            # Split sprite sheet into individual frames
-            sprites = []
-            for i in range(num_sprites):
-                frame = pygame.Surface(
-                    (self.SPRITE_WIDTH_ON_SHEET, self.SPRITE_HEIGHT_ON_SHEET),
-                    pygame.SRCALPHA
-                )
-                frame.blit(
-                    sheet,
-                    (0, 0),
-                    (i * self.SPRITE_WIDTH_ON_SHEET, 0, 
-                     self.SPRITE_WIDTH_ON_SHEET, self.SPRITE_HEIGHT_ON_SHEET)
-                )
-                # Scale up
-                scaled_frame = pygame.transform.scale(
-                    frame,
-                    (self.CHILD_WIDTH, self.CHILD_HEIGHT)
-                )
-                sprites.append(scaled_frame)
-            
-            # Map sprites to animation states
-            if len(sprites) >= 12:
-                return {
-                    'idle_down': [sprites[0]],
-                    'walk_down': [sprites[1], sprites[2]],
-                    'idle_up': [sprites[3]],
-                    'walk_up': [sprites[4], sprites[5]],
-                    'idle_right': [sprites[6]],
-                    'walk_right': [sprites[7], sprites[6], sprites[8]],
-                    'idle_left': [sprites[9]],
-                    'walk_left': [sprites[10], sprites[9], sprites[11]]
-                }
-            else:
-                # Fallback
-                return self._create_fallback_sprites()
-                
-        except Exception as e:
-            print(f"⚠️ Failed to load child sprites: {e}")
-            return self._create_fallback_sprites()
+        """Get the child animations (character.png) from the character atlas"""
+        # Frames and animations come from the shared character atlas
+        atlas = assets.atlas('characters', self)
+        if 'child' in atlas:
+            return atlas.animation_set('child')
+        # Sheet missing from the atlas - one fallback set shared by every child
+        return assets.fallback('child', self, self._create_fallback_sprites)
     
-    def _create_fallback_sprites(self):
+    @classmethod
+    def _create_fallback_sprites(cls):
         """Create fallback colored rectangles for child sprites"""
-        fallback = pygame.Surface((self.CHILD_WIDTH, self.CHILD_HEIGHT))
+        log.warning('entity', "⚠️ Failed to load child sprites")
+        fallback = pygame.Surface(view_size(cls.CHILD_WIDTH, cls.CHILD_HEIGHT))
         fallback.fill((200, 100, 100))  # Reddish color
         
         return {
@@ -199,15 +190,16 @@ class Child(Enemy):
         
         # Draw sight cone
         cone_points = [center, current_point_a, current_point_b]
-        s = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-        pygame.draw.polygon(s, (255, 100, 50, 50), cone_points)  # Translucent red-orange
-        screen.blit(s, (0, 0))
+        cone_surface = self.cone_surface(screen.get_size())
+        cone_area = pygame.draw.polygon(cone_surface, (255, 100, 50, 50), view_points(cone_points))  # Translucent red-orange
+        screen.blit(cone_surface, cone_area, cone_area)
+        cone_surface.fill((0, 0, 0, 0), cone_area)
         
         # Draw child sprite (adjusted for smaller size)
         if self.current_animation:
             current_frame = self.current_animation[self.frame_index]
             frame_rect = current_frame.get_rect()
-            frame_rect.midbottom = self.rect.midbottom
+            frame_rect.midbottom = view_pos(*self.rect.midbottom)
             screen.blit(current_frame, frame_rect.topleft)
         
         # Debug LOS indicator
@@ -215,5 +207,5 @@ class Child(Enemy):
             line_color = (0, 255, 0, 100)  # Green
             line_end_x = center[0] + 50 * math.cos(self.facing_angle)
             line_end_y = center[1] + 50 * math.sin(self.facing_angle)
-            pygame.draw.line(screen, line_color, center, (line_end_x, line_end_y), 2)
+            pygame.draw.line(screen, line_color, view_pos(*center), view_pos(line_end_x, line_end_y), 2)
 
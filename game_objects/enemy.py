@@ -3,13 +3,17 @@
 import pygame
 import math
 import random
-import os
-from game import GameObject
+from game import GameObject, log, track_surface, view_pos, view_size, view_rect, view_points
+from utils.assets import assets
 
 
 class Enemy(GameObject):
     """Enemy with directional sight cone and random patrol movement"""
     
+    SIDESTEP_FRAMES = 20  # Frames a patroller steps aside after bumping into another mover
+    
+    _cone_buffer = None  # Screen-sized sight cone surface shared by every enemy (see cone_surface)
+    
     # Sprite configuration
     SPRITE_SCALE_FACTOR = 4
     SPRITE_WIDTH_ON_SHEET = 16
@@ -17,9 +21,10 @@ class Enemy(GameObject):
     ENEMY_WIDTH = SPRITE_WIDTH_ON_SHEET * SPRITE_SCALE_FACTOR  # 64
     ENEMY_HEIGHT = SPRITE_HEIGHT_ON_SHEET * SPRITE_SCALE_FACTOR  # 128
     
-    def __init__(self, x, y, speed=100):
+    def __init__(self, x, y, speed=100, rng=None):
         super().__init__(x, y)
         self.speed = speed
+        self.rng = rng or random  # Stream the wandering directions are drawn from
         self.width = self.ENEMY_WIDTH
         self.height = self.ENEMY_HEIGHT
         
@@ -59,6 +64,14 @@ class Enemy(GameObject):
         self.last_moving_dx = 1
         self.last_moving_dy = 0
         
+        # Patrol navigation (set by the scene via set_patrol)
+        self.nav_grid = None
+        self.patrol_route = None
+        self.patrol_index = 0
+        self.sidestep_timer = 0
+        self.sidestep_dx = 0.0
+        self.sidestep_dy = 0.0
+        
         # Debug
         self.debug_los_clear = False
         
@@ -67,56 +80,33 @@ class Enemy(GameObject):
     
     def _load_sprite_sheet(self):
         """Load enemy sprites or use placeholder"""
-        try:
-            assets_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                     'assets', 'images', 'christmas')
-            sheet_path = os.path.join(assets_dir, 'character.png')
-            
-            sheet = pygame.image.load(sheet_path).convert_alpha()
-            sheet_width = sheet.get_width()
-            num_sprites = sheet_width // self.SPRITE_WIDTH_ON_SHEET
-            
-            # Split sprite sheet
-            sprites = []
-            for i in range(num_sprites):
-                frame = pygame.Surface((self.SPRITE_WIDTH_ON_SHEET, self.SPRITE_HEIGHT_ON_SHEET), 
-                                      pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), 
-                          (i * self.SPRITE_WIDTH_ON_SHEET, 0, 
-                           self.SPRITE_WIDTH_ON_SHEET, self.SPRITE_HEIGHT_ON_SHEET))
-                scaled_frame = pygame.transform.scale(frame, (self.ENEMY_WIDTH, self.ENEMY_HEIGHT))
-                sprites.append(scaled_frame)
-            
-            # Map sprites to animations
-            if len(sprites) >= 16:
-                return {
-                    'idle': [sprites[0]],
-                    'walk_down': [sprites[0], sprites[1]],
-                    'walk_up': [sprites[4], sprites[5]],
-                    'walk_right': [sprites[12], sprites[13]],
-                    'walk_left': [sprites[8], sprites[9]]
-                }
-            else:
-                raise Exception("Not enough sprites")
-        
-        except Exception as e:
-            print(f"Failed to load enemy sprites: {e}. Using placeholder box.")
-            # Create placeholder box
-            placeholder = pygame.Surface((self.ENEMY_WIDTH, self.ENEMY_HEIGHT), pygame.SRCALPHA)
-            placeholder.fill((200, 50, 50))
-            # Draw face/eyes
-            pygame.draw.circle(placeholder, (255, 255, 255), (20, 40), 8)
-            pygame.draw.circle(placeholder, (255, 255, 255), (44, 40), 8)
-            pygame.draw.circle(placeholder, (0, 0, 0), (20, 40), 4)
-            pygame.draw.circle(placeholder, (0, 0, 0), (44, 40), 4)
-            
-            return {
-                'idle': [placeholder],
-                'walk_down': [placeholder],
-                'walk_up': [placeholder],
-                'walk_right': [placeholder],
-                'walk_left': [placeholder]
-            }
+        # Frames and animations come from the shared character atlas
+        atlas = assets.atlas('characters', self)
+        if 'enemy' in atlas:
+            return atlas.animation_set('enemy')
+        # Sheet missing from the atlas - one placeholder set shared by every enemy
+        return assets.fallback('enemy', self, self._create_placeholder_sprites)
+    
+    @classmethod
+    def _create_placeholder_sprites(cls):
+        """Create the placeholder box animations"""
+        log.warning('entity', "Failed to load enemy sprites. Using placeholder box.")
+        placeholder = pygame.Surface((cls.ENEMY_WIDTH, cls.ENEMY_HEIGHT), pygame.SRCALPHA)
+        placeholder.fill((200, 50, 50))
+        # Draw face/eyes
+        pygame.draw.circle(placeholder, (255, 255, 255), (20, 40), 8)
+        pygame.draw.circle(placeholder, (255, 255, 255), (44, 40), 8)
+        pygame.draw.circle(placeholder, (0, 0, 0), (20, 40), 4)
+        pygame.draw.circle(placeholder, (0, 0, 0), (44, 40), 4)
+        placeholder = pygame.transform.scale(placeholder, view_size(cls.ENEMY_WIDTH, cls.ENEMY_HEIGHT))
+        
+        return {
+            'idle': [placeholder],
+            'walk_down': [placeholder],
+            'walk_up': [placeholder],
+            'walk_right': [placeholder],
+            'walk_left': [placeholder]
+        }
     
     def set_state(self, new_state):
         """Change animation state"""
@@ -147,7 +137,7 @@ class Enemy(GameObject):
         """Set a random movement direction"""
         while True:
             # Random direction
-            angle = random.random() * 2 * math.pi
+            angle = self.rng.random() * 2 * math.pi
             dx = math.cos(angle) * self.speed
             dy = math.sin(angle) * self.speed
             
@@ -157,6 +147,60 @@ class Enemy(GameObject):
                 self.facing_angle = math.atan2(dy, dx)
                 break
     
+    def set_patrol(self, nav_grid, patrol_route, start_index=0):
+        """Follow a waypoint route instead of wandering randomly
+        
+        Args:
+            nav_grid: NavGrid shared by the scene
+            patrol_route: PatrolRoute to loop around
+            start_index: Index of the first waypoint to head for
+        """
+        if not patrol_route or len(patrol_route) == 0:
+            return
+        self.nav_grid = nav_grid
+        self.patrol_route = patrol_route
+        self.patrol_index = start_index % len(patrol_route)
+    
+    def _advance_waypoint(self):
+        """Head for the next waypoint on the patrol route"""
+        self.patrol_index = (self.patrol_index + 1) % len(self.patrol_route)
+    
+    def _start_sidestep(self, dx, dy):
+        """Step to the right of a blocked heading for a while, keeping the waypoint
+        
+        Two patrollers meeting head-on both turn to their own right, so they
+        pass each other instead of blocking forever.
+        
+        Args:
+            dx: X component of the blocked heading
+            dy: Y component of the blocked heading
+        """
+        length = math.hypot(dx, dy)
+        if length == 0:
+            dx, dy = self.last_moving_dx, self.last_moving_dy
+            length = math.hypot(dx, dy) or 1
+        self.sidestep_dx = -dy / length
+        self.sidestep_dy = dx / length
+        self.sidestep_timer = self.SIDESTEP_FRAMES
+    
+    def _follow_patrol(self):
+        """Set velocity from the shared flow field toward the current waypoint"""
+        if self.sidestep_timer > 0:
+            self.sidestep_timer -= 1
+            self.velocity_x = self.sidestep_dx * self.speed
+            self.velocity_y = self.sidestep_dy * self.speed
+            return
+        
+        center = self.rect.center
+        target = self.patrol_route.waypoints[self.patrol_index]
+        if math.hypot(target[0] - center[0], target[1] - center[1]) <= self.nav_grid.cell_size / 2:
+            self._advance_waypoint()
+            target = self.patrol_route.waypoints[self.patrol_index]
+        
+        dx, dy = self.nav_grid.steer(center, target)
+        self.velocity_x = dx * self.speed
+        self.velocity_y = dy * self.speed
+    
     def update(self, dt, obstacles):
         """Update enemy AI, movement, and animation
         
@@ -167,11 +211,15 @@ class Enemy(GameObject):
         if not self.active:
             return
         
-        # Update move timer
-        self.move_timer += 1
-        if self.move_timer >= self.move_interval:
-            self.set_random_direction()
-            self.move_timer = 0
+        if self.patrol_route:
+            # Patrolling: a flow field lookup replaces collide-and-retry
+            self._follow_patrol()
+        else:
+            # Update move timer
+            self.move_timer += 1
+            if self.move_timer >= self.move_interval:
+                self.set_random_direction()
+                self.move_timer = 0
         
         # Update facing direction based on movement
         if self.velocity_x != 0 or self.velocity_y != 0:
@@ -212,6 +260,10 @@ class Enemy(GameObject):
                 continue
             if hasattr(obstacle, 'rect') and self.rect.colliderect(obstacle.rect):
                 # Collision detected - revert and change direction
+                # (patrolling enemies skip a waypoint blocked by walls or trees,
+                # and step aside from other enemies and children)
+                heading_x = self.velocity_x
+                heading_y = self.velocity_y
                 self.x = old_x
                 self.y = old_y
                 # Update rect using offsets (works for both Enemy and Child)
@@ -219,7 +271,16 @@ class Enemy(GameObject):
                 self.rect.y = int(self.y) + self.y_offset
                 self.velocity_x = 0
                 self.velocity_y = 0
-                self.set_random_direction()
+                if self.patrol_route:
+                    if isinstance(obstacle, Enemy):
+                        if self.sidestep_timer == 0:
+                            self._start_sidestep(heading_x, heading_y)
+                    elif self.sidestep_timer > 0:
+                        self.sidestep_timer = 0  # Sidestep ran into geometry - resume the route
+                    else:
+                        self._advance_waypoint()
+                else:
+                    self.set_random_direction()
                 break
         
         # Animate
@@ -264,6 +325,23 @@ class Enemy(GameObject):
         self.debug_los_clear = False
         return False
     
+    @staticmethod
+    def cone_surface(size):
+        """Get the shared sight cone surface, allocated once per screen size
+        
+        Cones are drawn into it one at a time; whoever draws must clear the
+        area it drew again after blitting, so the surface stays transparent.
+        
+        Args:
+            size: (width, height) of the screen the cones are blitted to
+        
+        Returns:
+            Transparent pygame.Surface of that size
+        """
+        if Enemy._cone_buffer is None or Enemy._cone_buffer.get_size() != size:
+            Enemy._cone_buffer = track_surface(pygame.Surface(size, pygame.SRCALPHA), 'sight cones')
+        return Enemy._cone_buffer
+    
     def render(self, screen, walls=None, debug=False):
         """Render enemy with sight cone
         
@@ -322,20 +400,38 @@ class Enemy(GameObject):
         
         # Draw sight cone
         cone_points = [center, current_point_a, current_point_b]
-        s = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-        pygame.draw.polygon(s, (255, 100, 50, 50), cone_points)
-        screen.blit(s, (0, 0))
+        cone_surface = self.cone_surface(screen.get_size())
+        cone_area = pygame.draw.polygon(cone_surface, (255, 100, 50, 50), view_points(cone_points))
+        screen.blit(cone_surface, cone_area, cone_area)
+        cone_surface.fill((0, 0, 0, 0), cone_area)
         
         # Draw enemy sprite
         current_frame = self.get_current_frame()
         if current_frame:
             frame_rect = current_frame.get_rect()
-            frame_rect.midbottom = self.rect.midbottom
+            frame_rect.midbottom = view_pos(*self.rect.midbottom)
             screen.blit(current_frame, frame_rect.topleft)
         
         # Debug: draw line of sight
         if debug and self.debug_los_clear:
             line_end_x = center[0] + 50 * math.cos(self.facing_angle)
             line_end_y = center[1] + 50 * math.sin(self.facing_angle)
-            pygame.draw.line(screen, (0, 255, 0, 100), center, (line_end_x, line_end_y), 2)
+            pygame.draw.line(screen, (0, 255, 0, 100), view_pos(*center), view_pos(line_end_x, line_end_y), 2)
+    
+    def view_bounds(self):
+        """Get the area render() can draw on (sight cone, sprite and LOS line)
+        
+        Returns:
+            pygame.Rect in render target coordinates
+        """
+        reach = self.sight_range + 2
+        cone = pygame.Rect(0, 0, reach * 2, reach * 2)
+        cone.center = self.rect.center
+        bounds = view_rect(cone)
+        current_frame = self.get_current_frame()
+        if current_frame:
+            frame_rect = current_frame.get_rect()
+            frame_rect.midbottom = view_pos(*self.rect.midbottom)
+            bounds.union_ip(frame_rect)
+        return bounds
 
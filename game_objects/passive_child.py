@@ -1,7 +1,8 @@
 """Passive child game object - static sprite with no movement"""
 
 import pygame
-from game import GameObject
+from game import GameObject, log, view_pos, view_size, view_rect
+from utils.assets import assets
 
 
 class PassiveChild(GameObject):
@@ -28,57 +29,32 @@ class PassiveChild(GameObject):
         self.rect = pygame.Rect(int(x), int(y), self.width, self.height)
     
     def _load_sprite_sheet(self):
-        """Load and split the child sprite sheet
+        """Get the idle frames from the character atlas
         
         Returns:
             dict: Dictionary of animation frames by state
         """
-        try:
-            sheet = pygame.image.load('assets/character.png').convert_alpha()
-            
-            # Frame dimensions on sheet
-            frame_width = 12
-            frame_height = 24
-            scale_factor = 4  # Scale up to 48x96
-            
-            # Extract idle frames for each direction
-            frames = {
-                'idle_down': self._extract_frame(sheet, 0, 0, frame_width, frame_height, scale_factor),
-                'idle_up': self._extract_frame(sheet, 0, 3, frame_width, frame_height, scale_factor),
-                'idle_left': self._extract_frame(sheet, 0, 2, frame_width, frame_height, scale_factor),
-                'idle_right': self._extract_frame(sheet, 0, 1, frame_width, frame_height, scale_factor),
-            }
-            
-            return frames
-        except pygame.error as e:
-            print(f"⚠️ Error loading child sprite: {e}")
-            # Return empty surface as fallback
-            fallback = pygame.Surface((self.width, self.height))
-            fallback.fill((100, 150, 200))  # Light blue placeholder
-            return {
-                'idle_down': fallback,
-                'idle_up': fallback,
-                'idle_left': fallback,
-                'idle_right': fallback,
-            }
+        # Idle frames for each direction, shared through the character atlas
+        atlas = assets.atlas('characters', self)
+        if 'passive_child' in atlas:
+            animations = atlas.animation_set('passive_child')
+            return {state: frames[0] for state, frames in animations.items()}
+        return assets.fallback('passive_child', self,
+                               lambda: self._create_fallback_frames(self.width, self.height))
     
-    def _extract_frame(self, sheet, col, row, frame_w, frame_h, scale):
-        """Extract and scale a single frame from sprite sheet
-        
-        Args:
-            sheet: Source sprite sheet surface
-            col: Column index
-            row: Row index
-            frame_w: Frame width on sheet
-            frame_h: Frame height on sheet
-            scale: Scale factor
-            
-        Returns:
-            pygame.Surface: Scaled frame
-        """
-        frame = pygame.Surface((frame_w, frame_h), pygame.SRCALPHA)
-        frame.blit(sheet, (0, 0), (col * frame_w, row * frame_h, frame_w, frame_h))
-        return pygame.transform.scale(frame, (frame_w * scale, frame_h * scale))
+    @staticmethod
+    def _create_fallback_frames(width, height):
+        """Create the placeholder frames (drawn once, shared by every passive child)"""
+        log.warning('entity', "⚠️ Error loading child sprite")
+        # Return empty surface as fallback
+        fallback = pygame.Surface(view_size(width, height))
+        fallback.fill((100, 150, 200))  # Light blue placeholder
+        return {
+            'idle_down': fallback,
+            'idle_up': fallback,
+            'idle_left': fallback,
+            'idle_right': fallback,
+        }
     
     def _get_idle_frame(self):
         """Get the idle frame for current direction
@@ -106,8 +82,18 @@ class PassiveChild(GameObject):
             debug: If True, show hitbox
         """
         if self.visible and self.current_frame:
-            screen.blit(self.current_frame, (int(self.x), int(self.y)))
+            screen.blit(self.current_frame, view_pos(self.x, self.y))
             
             if debug:
-                pygame.draw.rect(screen, (255, 255, 0), self.rect, 2)
+                pygame.draw.rect(screen, (255, 255, 0), view_rect(self.rect), 2)
+    
+    def view_bounds(self):
+        """Get the area render() draws the sprite on
+        
+        Returns:
+            pygame.Rect in render target coordinates
+        """
+        if self.current_frame:
+            return self.current_frame.get_rect(topleft=view_pos(self.x, self.y))
+        return pygame.Rect(view_pos(self.x, self.y), (0, 0))
 
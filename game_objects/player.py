@@ -1,8 +1,9 @@
 """Player game object with sprite animations and stealth mechanics"""
 
 import pygame
-import os
-from game import GameObject
+from game import GameObject, log, track_surface, view_pos, view_size, view_rect
+from utils.assets import assets
+from utils.text import get_font
 
 
 class Player(GameObject):
@@ -19,6 +20,11 @@ class Player(GameObject):
     MAIN_RECT_HEIGHT_RATIO = 0.75  # Main rect is 75% of sprite height (for enemy detection)
     COLLISION_RECT_WIDTH_RATIO = 0.5  # Collision rect is 50% of sprite width
     COLLISION_RECT_HEIGHT_RATIO = 0.5  # Collision rect is 50% of sprite height (for obstacles)
+    MAIN_RECT_HEIGHT = int(PLAYER_HEIGHT * MAIN_RECT_HEIGHT_RATIO)  # 96px
+    COLLISION_WIDTH = int(PLAYER_WIDTH * COLLISION_RECT_WIDTH_RATIO)  # 36px
+    COLLISION_HEIGHT = int(PLAYER_HEIGHT * COLLISION_RECT_HEIGHT_RATIO)  # 64px
+    COLLISION_X_OFFSET = (PLAYER_WIDTH - COLLISION_WIDTH) // 2  # Centered horizontally
+    COLLISION_Y_OFFSET = PLAYER_HEIGHT - COLLISION_HEIGHT  # Aligned at the feet
     
     def __init__(self, x=0, y=0, speed=200):
         super().__init__(x, y)
@@ -43,9 +49,7 @@ class Player(GameObject):
                                 self.width, self.collision_height)
         
         # 2. Collision rect - for obstacles/walls (smaller, centered at feet)
-        collision_width = int(self.PLAYER_WIDTH * self.COLLISION_RECT_WIDTH_RATIO)
-        collision_height = int(self.PLAYER_HEIGHT * self.COLLISION_RECT_HEIGHT_RATIO)
-        self.collision_rect = pygame.Rect(0, 0, collision_width, collision_height)
+        self.collision_rect = pygame.Rect(0, 0, self.COLLISION_WIDTH, self.COLLISION_HEIGHT)
         self._update_collision_rect()
         
         # Lives and invulnerability (for stealth interiors)
@@ -56,49 +60,17 @@ class Player(GameObject):
         self.is_caught = False
         
         # Font for UI
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
     
     def _load_sprite_sheet(self):
-        """Load and split the Grinch sprite sheet"""
+        """Get the Grinch animations from the character atlas"""
         try:
-            assets_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                     'assets', 'images', 'christmas')
-            sheet_path = os.path.join(assets_dir, 'grinch_spread.png')
-            
-            sheet = pygame.image.load(sheet_path).convert_alpha()
-            sheet_width = sheet.get_width()
-            num_sprites = sheet_width // self.SPRITE_WIDTH_ON_SHEET
-            
-            # Split sprite sheet
-            sprites = []
-            for i in range(num_sprites):
-                frame = pygame.Surface((self.SPRITE_WIDTH_ON_SHEET, self.SPRITE_HEIGHT_ON_SHEET), 
-                                      pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), 
-                          (i * self.SPRITE_WIDTH_ON_SHEET, 0, 
-                           self.SPRITE_WIDTH_ON_SHEET, self.SPRITE_HEIGHT_ON_SHEET))
-                scaled_frame = pygame.transform.scale(frame, (self.PLAYER_WIDTH, self.PLAYER_HEIGHT))
-                sprites.append(scaled_frame)
-            
-            # Map sprites to animations
-            if len(sprites) >= 12:
-                return {
-                    'idle_down': [sprites[0]],
-                    'walk_down': [sprites[1], sprites[2]],
-                    'idle_up': [sprites[3]],
-                    'walk_up': [sprites[4], sprites[5]],
-                    'idle_right': [sprites[6]],
-                    'walk_right': [sprites[7], sprites[6], sprites[8]],
-                    'idle_left': [sprites[9]],
-                    'walk_left': [sprites[10], sprites[9], sprites[11]]
-                }
-            else:
-                raise Exception("Not enough sprites")
-        
+            # Frames and animations come from the shared character atlas
+            return assets.atlas('characters', self).animation_set('player')
         except Exception as e:
-            print(f"Failed to load Grinch sprites: {e}. Using placeholder.")
+            log.warning('entity', "Failed to load Grinch sprites: %s. Using placeholder.", e)
             # Create placeholder
-            placeholder = pygame.Surface((self.PLAYER_WIDTH, self.PLAYER_HEIGHT), pygame.SRCALPHA)
+            placeholder = track_surface(pygame.Surface(view_size(self.PLAYER_WIDTH, self.PLAYER_HEIGHT), pygame.SRCALPHA), self)
             placeholder.fill((100, 200, 100))
             return {
                 'idle_down': [placeholder],
@@ -116,13 +88,8 @@ class Player(GameObject):
         
         Collision rect is centered horizontally and aligned at the bottom (feet)
         """
-        collision_width = int(self.PLAYER_WIDTH * self.COLLISION_RECT_WIDTH_RATIO)
-        collision_height = int(self.PLAYER_HEIGHT * self.COLLISION_RECT_HEIGHT_RATIO)
-        x_offset = (self.PLAYER_WIDTH - collision_width) // 2  # Center horizontally
-        y_offset = self.PLAYER_HEIGHT - collision_height  # Align at bottom
-        
-        self.collision_rect.x = int(self.x) + x_offset
-        self.collision_rect.y = int(self.y) + y_offset
+        self.collision_rect.x = int(self.x) + self.COLLISION_X_OFFSET
+        self.collision_rect.y = int(self.y) + self.COLLISION_Y_OFFSET
     
     def set_state(self, new_state):
         """Change animation state"""
@@ -279,7 +246,7 @@ class Player(GameObject):
             self.lives -= 1
             self.is_vulnerable = False
             self.invuln_timer = self.max_invuln_time
-            print(f"*** PLAYER HIT! Lives remaining: {self.lives} ***")
+            log.info('entity', "*** PLAYER HIT! Lives remaining: %s ***", self.lives)
             return True
         return False
     
@@ -304,7 +271,7 @@ class Player(GameObject):
         # Collision rect (obstacles) using helper method
         self._update_collision_rect()
         
-        print(f"🔄 Player reset to position ({x}, {y})")
+        log.debug('entity', "🔄 Player reset to position (%s, %s)", x, y)
     
     def got_caught(self):
         """Get caught by enemy sight - triggers kickout"""
@@ -313,7 +280,7 @@ class Player(GameObject):
             self.is_vulnerable = False
             self.invuln_timer = self.max_invuln_time
             self.is_caught = True
-            print(f"*** PLAYER CAUGHT! Lives: {self.lives} ***")
+            log.info('entity', "*** PLAYER CAUGHT! Lives: %s ***", self.lives)
             return True
         return False
     
@@ -343,13 +310,27 @@ class Player(GameObject):
             if current_frame:
                 # Align sprite bottom with rect bottom
                 frame_rect = current_frame.get_rect()
-                frame_rect.midbottom = self.rect.midbottom
+                frame_rect.midbottom = view_pos(*self.rect.midbottom)
                 screen.blit(current_frame, frame_rect.topleft)
             
             # Debug: Show hitboxes
             if debug:
                 # Main rect (yellow) - for enemy detection
-                pygame.draw.rect(screen, (255, 255, 0), self.rect, 2)
+                pygame.draw.rect(screen, (255, 255, 0), view_rect(self.rect), 2)
                 # Collision rect (green) - for physical collisions
-                pygame.draw.rect(screen, (0, 255, 0), self.collision_rect, 2)
+                pygame.draw.rect(screen, (0, 255, 0), view_rect(self.collision_rect), 2)
+    
+    def view_bounds(self):
+        """Get the area render() can draw on (sprite and debug hitboxes)
+        
+        Returns:
+            pygame.Rect in render target coordinates
+        """
+        bounds = view_rect(self.rect.union(self.collision_rect))
+        current_frame = self.get_current_frame()
+        if current_frame:
+            frame_rect = current_frame.get_rect()
+            frame_rect.midbottom = view_pos(*self.rect.midbottom)
+            bounds.union_ip(frame_rect)
+        return bounds
 
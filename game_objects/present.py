@@ -2,92 +2,96 @@
 
 import pygame
 import random
-import os
-from game import GameObject
+from game import GameObject, log, track_surface, view_pos, view_size
+from utils.assets import assets
+from utils.text import render_text
 
 
-# Present image paths
-PRESENT_IMAGE_PATHS = ['prez1.png', 'prez2.png']
-PRESENT_SIZE = 40  # Size to scale present images to
+PRESENT_SIZE = 40  # Size of the present images (see assets/atlases/items.json)
 
 
 class Present(GameObject):
     """Collectible present that requires holding E to collect"""
     
-    # Class variable for caching loaded present images
-    PRESENT_IMAGES = None
-    
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None, image_index=None):
         super().__init__(x, y)
         self.width = PRESENT_SIZE
         self.height = PRESENT_SIZE
         
-        # Load present images if not cached
-        if Present.PRESENT_IMAGES is None:
-            Present.PRESENT_IMAGES = self._load_present_images()
-        
-        # Randomly select a present image
-        if Present.PRESENT_IMAGES:
-            self.image = random.choice(Present.PRESENT_IMAGES)
-        else:
-            # Fallback image
-            self.image = pygame.Surface((PRESENT_SIZE, PRESENT_SIZE), pygame.SRCALPHA)
-            self.image.fill((100, 150, 255))
+        # Load present images (shared by every present through the items atlas)
+        self.images = self._load_present_images()
         
         # Collision rect
-        self.rect = pygame.Rect(int(x), int(y), self.width, self.height)
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
         
         # Interaction zone (smaller for tighter gameplay)
         self.interaction_range = 45
         interact_size = self.interaction_range * 2
         self.interaction_rect = pygame.Rect(0, 0, interact_size, interact_size)
-        self.interaction_rect.center = self.rect.center
         
-        # Collection state
-        self.is_collected = False
-        self.is_collecting = False
-        self.collection_progress = 0
         self.max_collection_time = 150  # 2.5 seconds at 60 FPS
         
-        # UI
-        self.font_medium = pygame.font.Font(None, 24)
-        
         # Colors (updated interaction opacity to 20)
         self.present_color = (100, 150, 255)
         self.interaction_color = (100, 150, 255, 20)  # More transparent
+        self._bubble = None  # Interaction bubble surface, drawn once per view size
         self.meter_bg_color = (30, 30, 30)
         self.meter_fill_color = (0, 200, 0)
         self.prompt_color = (255, 255, 0)
         self.bg_color = (0, 0, 0)
         self.white = (255, 255, 255)
+        
+        self.reset(x, y, rng, image_index)
+    
+    def reset(self, x, y, rng=None, image_index=None):
+        """Put the present back in its just-spawned state (used by object pools)
+        
+        Args:
+            x: X position
+            y: Y position
+            rng: random.Random picking the image (the scene's seeded one keeps
+                an interior reproducible), or None for the random module
+            image_index: Index of the image to show (restored presents), or
+                None to pick one with rng
+        """
+        self.x = x
+        self.y = y
+        self.active = True
+        self.visible = True
+        
+        # Randomly select a present image
+        if image_index is None:
+            image_index = (rng or random).randrange(len(self.images))
+        self.image_index = image_index % len(self.images)
+        self.image = self.images[self.image_index]
+        
+        self.rect.x = int(x)
+        self.rect.y = int(y)
+        self.interaction_rect.center = self.rect.center
+        
+        # Collection state
+        self.is_collected = False
+        self.is_collecting = False
+        self.collection_progress = 0
     
     def _load_present_images(self):
-        """Load present images from assets/images/christmas/presents/"""
-        images = []
-        assets_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'assets', 'images', 'christmas', 'presents'
-        )
-        
-        for path in PRESENT_IMAGE_PATHS:
-            try:
-                full_path = os.path.join(assets_dir, path)
-                raw_image = pygame.image.load(full_path).convert_alpha()
-                scaled_image = pygame.transform.scale(raw_image, (PRESENT_SIZE, PRESENT_SIZE))
-                images.append(scaled_image)
-                print(f"✅ Loaded present image: {path}")
-            except Exception as e:
-                print(f"⚠️ Failed to load {path}: {e}")
-                # Create fallback
-                fallback = pygame.Surface((PRESENT_SIZE, PRESENT_SIZE), pygame.SRCALPHA)
-                fallback.fill((100, 150, 255))
-                pygame.draw.line(fallback, (255, 255, 255), (PRESENT_SIZE // 2, 0),
-                                (PRESENT_SIZE // 2, PRESENT_SIZE), 3)
-                pygame.draw.line(fallback, (255, 255, 255), (0, PRESENT_SIZE // 2),
-                                (PRESENT_SIZE, PRESENT_SIZE // 2), 3)
-                images.append(fallback)
-        
-        return images if images else None
+        """Get the present images from the items atlas"""
+        atlas = assets.atlas('items', self)
+        if 'present' in atlas:
+            return atlas.frames('present')
+        return assets.fallback('present', self, self._create_fallback_images)
+    
+    @staticmethod
+    def _create_fallback_images():
+        """Create the fallback present (drawn once, shared by every present)"""
+        log.warning('entity', "⚠️ Failed to load present images")
+        fallback = pygame.Surface((PRESENT_SIZE, PRESENT_SIZE), pygame.SRCALPHA)
+        fallback.fill((100, 150, 255))
+        pygame.draw.line(fallback, (255, 255, 255), (PRESENT_SIZE // 2, 0),
+                        (PRESENT_SIZE // 2, PRESENT_SIZE), 3)
+        pygame.draw.line(fallback, (255, 255, 255), (0, PRESENT_SIZE // 2),
+                        (PRESENT_SIZE, PRESENT_SIZE // 2), 3)
+        return (pygame.transform.scale(fallback, view_size(PRESENT_SIZE, PRESENT_SIZE)),)
     
     def check_interaction_proximity(self, player):
         """Check if player is within interaction range"""
@@ -128,30 +132,51 @@ class Present(GameObject):
                 self.cancel_collection()
     
     def render(self, screen, player):
-        """Render present with UI overlay
+        """Render present and its interaction bubble (prompts are drawn by render_ui)
         
         Args:
-            screen: Pygame screen surface
+            screen: Pygame screen surface (world render target)
             player: Player object (to check proximity)
         """
         if not self.visible or self.is_collected:
             return
         
         # Draw interaction bubble (transparent)
-        interaction_surface = pygame.Surface((self.interaction_range * 2, self.interaction_range * 2), 
-                                            pygame.SRCALPHA)
-        pygame.draw.circle(interaction_surface, self.interaction_color, 
-                          (self.interaction_range, self.interaction_range), self.interaction_range)
-        screen.blit(interaction_surface, self.interaction_rect.topleft)
+        bubble_w, bubble_h = view_size(self.interaction_range * 2, self.interaction_range * 2)
+        if self._bubble is None or self._bubble.get_size() != (bubble_w, bubble_h):
+            self._bubble = track_surface(pygame.Surface((bubble_w, bubble_h), pygame.SRCALPHA), self)
+            pygame.draw.circle(self._bubble, self.interaction_color, 
+                              (bubble_w // 2, bubble_h // 2), bubble_w // 2)
+        screen.blit(self._bubble, view_pos(*self.interaction_rect.topleft))
         
         # Draw present image
-        screen.blit(self.image, self.rect.topleft)
+        screen.blit(self.image, view_pos(*self.rect.topleft))
+    
+    def view_bounds(self):
+        """Get the area render() can draw on (interaction bubble and image)
+        
+        Returns:
+            pygame.Rect in render target coordinates
+        """
+        bubble = pygame.Rect(view_pos(*self.interaction_rect.topleft),
+                             view_size(self.interaction_range * 2, self.interaction_range * 2))
+        return bubble.union(self.image.get_rect(topleft=view_pos(*self.rect.topleft)))
+    
+    def render_ui(self, screen, player):
+        """Render the collect prompt and collection meter at full resolution
+        
+        Args:
+            screen: Pygame screen surface (display, world coordinates)
+            player: Player object (to check proximity)
+        """
+        if not self.visible or self.is_collected:
+            return
         
         # Draw UI based on state
         if self.check_interaction_proximity(player):
             if not self.is_collecting:
                 # Show interaction prompt
-                interact_text = self.font_medium.render("PRESS E TO COLLECT", True, self.prompt_color)
+                interact_text = render_text("PRESS E TO COLLECT", 24, self.prompt_color)
                 text_rect = interact_text.get_rect(center=(self.rect.centerx, self.rect.top - 40))
                 bg_rect = text_rect.inflate(10, 5)
                 pygame.draw.rect(screen, self.bg_color, bg_rect, border_radius=3)
@@ -2,7 +2,8 @@
 
 import pygame
 import random
-from game import GameObject
+from game import GameObject, log, view_pos, view_size, view_rect
+from utils.assets import assets
 
 
 class StaticPresent(GameObject):
@@ -39,21 +40,26 @@ class StaticPresent(GameObject):
         Returns:
             pygame.Surface: Present sprite scaled to size
         """
-        try:
-            # Pick random present
-            image_path = random.choice(self.PRESENT_IMAGES)
-            sprite = pygame.image.load(image_path).convert_alpha()
-            
-            # Scale to desired size
-            sprite = pygame.transform.scale(sprite, (self.size, self.size))
-            
-            return sprite
-        except pygame.error as e:
-            print(f"⚠️ Error loading present sprite: {e}")
-            # Fallback to colored square
-            fallback = pygame.Surface((self.size, self.size))
-            fallback.fill((200, 50, 50))  # Red
-            return fallback
+        # Pick random present from the items atlas when it has this size
+        atlas = assets.atlas('items', self)
+        if 'static_present' in atlas:
+            frames = atlas.frames('static_present')
+            if frames[0].get_size() == view_size(self.size, self.size):
+                return random.choice(frames)
+        
+        # Other sizes are scaled once and shared through the asset manager
+        image_path = random.choice(self.PRESENT_IMAGES)
+        if assets.exists(image_path):
+            return assets.image(image_path, self, size=view_size(self.size, self.size))
+        return assets.fallback(f'static_present_{self.size}', self, self._create_fallback_sprite)
+    
+    def _create_fallback_sprite(self):
+        """Create the fallback sprite (drawn once per size)"""
+        log.warning('entity', "⚠️ Error loading present sprite")
+        # Fallback to colored square
+        fallback = pygame.Surface(view_size(self.size, self.size))
+        fallback.fill((200, 50, 50))  # Red
+        return fallback
     
     def update(self, dt):
         """Update (does nothing for static present)
@@ -72,8 +78,18 @@ class StaticPresent(GameObject):
             debug: If True, show hitbox
         """
         if self.visible and self.sprite:
-            screen.blit(self.sprite, (int(self.x), int(self.y)))
+            screen.blit(self.sprite, view_pos(self.x, self.y))
             
             if debug:
-                pygame.draw.rect(screen, (255, 215, 0), self.rect, 2)
+                pygame.draw.rect(screen, (255, 215, 0), view_rect(self.rect), 2)
+    
+    def view_bounds(self):
+        """Get the area render() draws the sprite on
+        
+        Returns:
+            pygame.Rect in render target coordinates
+        """
+        if self.sprite:
+            return self.sprite.get_rect(topleft=view_pos(self.x, self.y))
+        return pygame.Rect(view_pos(self.x, self.y), (0, 0))
 
@@ -1,8 +1,8 @@
 """Tree game object - decorative obstacle with present spawning"""
 
 import pygame
-import os
-from game import GameObject
+from game import GameObject, log, track_surface, view_pos, view_size
+from utils.assets import assets
 
 
 class Tree(GameObject):
@@ -11,7 +11,12 @@ class Tree(GameObject):
     # Tree dimensions
     TREE_WIDTH = 110
     TREE_HEIGHT = 150
-    TREE_IMAGE = None  # Class variable for cached image
+    
+    # Smaller collision box at base of tree (40% width x 30% height), centered
+    COLLISION_WIDTH = int(TREE_WIDTH * 0.4)  # 44px
+    COLLISION_HEIGHT = int(TREE_HEIGHT * 0.3)  # 45px
+    COLLISION_X_OFFSET = (TREE_WIDTH - COLLISION_WIDTH) // 2
+    COLLISION_Y_OFFSET = TREE_HEIGHT - COLLISION_HEIGHT
     
     def __init__(self, x, y):
         """Initialize tree at position (x, y) for top-left of full sprite
@@ -22,57 +27,51 @@ class Tree(GameObject):
         """
         super().__init__(x, y)
         
-        # Store the full sprite position
-        self.full_x = x
-        self.full_y = y
-        
-        # Load the tree image (cached)
-        if Tree.TREE_IMAGE is None:
-            Tree.TREE_IMAGE = self._load_tree_image()
-        
-        self.image = Tree.TREE_IMAGE
+        # Load the tree image (shared by every tree through the items atlas)
+        self.image = self._load_tree_image()
         self.width = self.TREE_WIDTH
         self.height = self.TREE_HEIGHT
         
-        # Create smaller collision box at base of tree (40% width x 30% height)
-        collision_width = int(self.TREE_WIDTH * 0.4)  # 56px
-        collision_height = int(self.TREE_HEIGHT * 0.3)  # 54px
+        # Collision rect at base of tree (positioned by reset)
+        self.rect = pygame.Rect(0, 0, self.COLLISION_WIDTH, self.COLLISION_HEIGHT)
+        self._spawn_range = None  # (min radius, max radius, surface) of the spawn range overlay
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Move the tree to a new position (used by object pools)
+        
+        Args:
+            x: X position of top-left corner of full sprite
+            y: Y position of top-left corner of full sprite
+        """
+        self.x = x
+        self.y = y
+        self.active = True
+        self.visible = True
         
-        # Calculate offsets to center collision box at base
-        x_offset = (self.TREE_WIDTH - collision_width) // 2
-        y_offset = self.TREE_HEIGHT - collision_height
+        # Store the full sprite position
+        self.full_x = x
+        self.full_y = y
         
         # Set collision rect at base of tree
-        self.rect = pygame.Rect(
-            x + x_offset,
-            y + y_offset,
-            collision_width,
-            collision_height
-        )
+        self.rect.x = x + self.COLLISION_X_OFFSET
+        self.rect.y = y + self.COLLISION_Y_OFFSET
     
     def _load_tree_image(self):
-        """Load and scale the christmas tree image"""
-        try:
-            assets_dir = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                'assets', 'images', 'christmas'
-            )
-            tree_path = os.path.join(assets_dir, 'christmas_tree.png')
-            
-            raw_image = pygame.image.load(tree_path).convert_alpha()
-            scaled_image = pygame.transform.scale(
-                raw_image,
-                (self.TREE_WIDTH, self.TREE_HEIGHT)
-            )
-            print(f"✅ Tree image loaded: {self.TREE_WIDTH}x{self.TREE_HEIGHT}")
-            return scaled_image
-            
-        except Exception as e:
-            print(f"⚠️ Failed to load tree image: {e}")
-            # Fallback: green rectangle
-            fallback = pygame.Surface((self.TREE_WIDTH, self.TREE_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(fallback, (30, 150, 30), fallback.get_rect())
-            return fallback
+        """Get the christmas tree image from the items atlas"""
+        atlas = assets.atlas('items', self)
+        if 'tree' in atlas:
+            return atlas.frames('tree')[0]
+        return assets.fallback('tree', self, self._create_fallback_image)
+    
+    @classmethod
+    def _create_fallback_image(cls):
+        """Create the fallback tree (drawn once, shared by every tree)"""
+        log.warning('entity', "⚠️ Failed to load tree image")
+        # Fallback: green rectangle
+        fallback = pygame.Surface(view_size(cls.TREE_WIDTH, cls.TREE_HEIGHT), pygame.SRCALPHA)
+        pygame.draw.rect(fallback, (30, 150, 30), fallback.get_rect())
+        return fallback
     
     def get_full_sprite_center(self):
         """Get the center point of the full 140x180 tree sprite
@@ -89,10 +88,28 @@ class Tree(GameObject):
         """Trees don't need updates (static objects)"""
         pass
     
-    def render(self, screen):
-        """Render the full tree sprite at its original position"""
-        # Draw the full 140x180 tree image
-        screen.blit(self.image, (self.full_x, self.full_y))
+    def view_bounds(self):
+        """Get the area render() draws on
+        
+        Returns:
+            pygame.Rect in render target coordinates
+        """
+        return self.image.get_rect(topleft=view_pos(self.full_x, self.full_y))
+    
+    def render(self, screen, area=None):
+        """Render the full tree sprite at its original position
+        
+        Args:
+            screen: Surface to draw on (world render target)
+            area: Optional view-space rect to limit drawing to (e.g. where
+                the tree covers objects drawn over a pre-baked copy of it)
+        """
+        pos = view_pos(self.full_x, self.full_y)
+        if area is None:
+            # Draw the full 140x180 tree image
+            screen.blit(self.image, pos)
+        else:
+            screen.blit(self.image, area.topleft, area.move(-pos[0], -pos[1]))
     
     def render_spawn_range(self, screen, min_radius, max_radius):
         """Debug visualization: render present spawn range circles
@@ -104,21 +121,21 @@ class Tree(GameObject):
         """
         center_x, center_y = self.rect.center
         
-        # Create translucent surface
-        debug_surface = pygame.Surface(
-            (screen.get_width(), screen.get_height()),
-            pygame.SRCALPHA
-        )
-        
-        # Draw spawn range circles
-        debug_color = (255, 255, 100, 50)  # Light yellow translucent
-        
-        # Draw filled max radius circle
-        pygame.draw.circle(debug_surface, debug_color, (center_x, center_y), max_radius, 0)
-        
-        # Draw outlines
-        pygame.draw.circle(debug_surface, debug_color, (center_x, center_y), max_radius, 2)
-        pygame.draw.circle(debug_surface, debug_color, (center_x, center_y), min_radius, 2)
+        # Draw the translucent circles once, around the center of their own surface
+        if self._spawn_range is None or self._spawn_range[:2] != (min_radius, max_radius):
+            debug_surface = track_surface(pygame.Surface((max_radius * 2, max_radius * 2), pygame.SRCALPHA), self)
+            center = (max_radius, max_radius)
+            
+            # Draw spawn range circles
+            debug_color = (255, 255, 100, 50)  # Light yellow translucent
+            
+            # Draw filled max radius circle
+            pygame.draw.circle(debug_surface, debug_color, center, max_radius, 0)
+            
+            # Draw outlines
+            pygame.draw.circle(debug_surface, debug_color, center, max_radius, 2)
+            pygame.draw.circle(debug_surface, debug_color, center, min_radius, 2)
+            self._spawn_range = (min_radius, max_radius, debug_surface)
         
-        screen.blit(debug_surface, (0, 0))
+        screen.blit(self._spawn_range[2], (center_x - max_radius, center_y - max_radius))
 
@@ -1,7 +1,7 @@
 """Wall game object - static obstacle"""
 
 import pygame
-from game import GameObject
+from game import GameObject, view_rect
 
 
 class Wall(GameObject):
@@ -25,5 +25,5 @@ class Wall(GameObject):
     def render(self, screen):
         """Render the wall"""
         if self.visible:
-            pygame.draw.rect(screen, self.color, self.rect)
+            pygame.draw.rect(screen, self.color, view_rect(self.rect))
 
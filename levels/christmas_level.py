@@ -3,21 +3,71 @@
 import pygame
 import random
 import os
-from game import Level
+import time
+from collections import OrderedDict
+from game import Level, log, surface_memory, hitch_detector, gc_policy, transition, profiler, blit_audit
+from game.log import LOG_DIR
 from scenes import Chunk, Interior, Interior_1
-from game_objects import Player, Wall
+from game_objects import Player
 from ui_elements import PresentCounter, LivesTracker
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, L1_PRESENT_ITEM_GOAL
-from utils import play_music
+from utils import audio, set_music_state, sfx, list_layouts, load_layout, bsp_layout_name, assets, text_cache, render_text
+
+
+# Saved interiors are advanced at most this often (seconds), not every frame
+OFFSCREEN_SIM_INTERVAL = 1.0
+
+# Recently visited Interior_1 scenes kept alive for warm re-entry (LRU)
+MAX_CACHED_INTERIORS = 4
+
+# Chance that a house uses one of the hand-made layouts in assets/layouts
+# instead of a generated one (decided per chunk, so a house keeps its layout)
+HANDMADE_LAYOUT_CHANCE = 0.25
 
 
 class InteriorState:
-    """Stores the state of an interior for persistence"""
-    def __init__(self, level_num, enemy_positions, present_data, tree_positions):
-        self.level_num = level_num  # Which level configuration (1-4)
+    """Stores the state of an interior for persistence
+    
+    While the player is away, the interior keeps running as a coarse
+    simulation: each patrolling enemy is just an arc length along its
+    PatrolRoute, advanced analytically from elapsed time.
+    """
+    def __init__(self, layout_name, enemy_positions, present_data, tree_positions,
+                 patrols=None, sim_time=0.0, seed=None):
+        self.layout_name = layout_name  # Which layout file the interior uses
         self.enemy_positions = enemy_positions  # List of (x, y) positions
-        self.present_data = present_data  # List of {'x': x, 'y': y, 'collected': bool}
+        self.present_data = present_data  # List of {'x': x, 'y': y, 'collected': bool, 'image': index}
         self.tree_positions = tree_positions  # List of (x, y) positions
+        # Per enemy: None, or {'route', 'route_key', 'distance', 'speed', 'center_offset', 'patrol_index'}
+        self.patrols = patrols or [None] * len(enemy_positions)
+        self.sim_time = sim_time  # Level time the patrols were last advanced to
+        self.seed = seed  # Generation seed the interior was built from
+    
+    def advance_to(self, level_time):
+        """Advance every patrol to the given level time
+        
+        Args:
+            level_time: Level clock in seconds
+        """
+        elapsed = level_time - self.sim_time
+        if elapsed <= 0:
+            return
+        self.sim_time = level_time
+        
+        for patrol in self.patrols:
+            if patrol and patrol['route'].length > 0:
+                patrol['distance'] = (patrol['distance'] + patrol['speed'] * elapsed) % patrol['route'].length
+    
+    def resolve(self):
+        """Turn patrol arc lengths back into concrete enemy positions"""
+        for i, patrol in enumerate(self.patrols):
+            if not patrol:
+                continue
+            route = patrol['route']
+            center_x, center_y = route.position_at(patrol['distance'])
+            offset_x, offset_y = patrol['center_offset']
+            self.enemy_positions[i] = (center_x - offset_x, center_y - offset_y)
+            patrol['patrol_index'] = route.next_waypoint_index(patrol['distance'])
 
 
 class ChristmasLevel(Level):
@@ -39,6 +89,9 @@ class ChristmasLevel(Level):
             8: ["0_winter.png", "0_winter_top.png", "0_walls.png"]  # Placeholder for goal chunk (using map 0 for now)
         }
         
+        # Decode every map layer and sprite source in parallel before the first chunk needs them
+        self._preload_assets()
+        
         # Path configuration - defines which edges have paths for each map
         # True = has path on that edge, False = no path
         self.map_paths = {
@@ -105,6 +158,11 @@ class ChristmasLevel(Level):
         # Interior persistence - store interior states by chunk coordinates
         # Format: {(chunk_x, chunk_y): InteriorState object}
         self.saved_interiors = {}
+        self.interior_cache = OrderedDict()  # (x, y) -> Interior_1 scene, least recent first
+        
+        # Level clock for the off-screen simulation of saved interiors
+        self.level_time = 0.0
+        self.offscreen_sim_timer = 0.0
         
         # Debug mode
         self.debug_mode = False
@@ -112,12 +170,8 @@ class ChristmasLevel(Level):
         # Input tracking
         self.e_pressed = False
         
-        # Audio
-        try:
-            self.collect_sound = pygame.mixer.Sound("assets/sounds/present_collected.mp3")
-        except:
-            print("⚠️ Could not load present collection sound")
-            self.collect_sound = None
+        # Sound effects are decoded once at startup (no-op if already loaded)
+        sfx.load()
         
         # UI Elements list
         self.ui_elements = []
@@ -146,6 +200,7 @@ class ChristmasLevel(Level):
         
         # Create initial chunk at (0, 0)
         self.create_chunk(0, 0)
+        set_music_state(self.outside_music_state())
         
         # Track door entry state
         self.door_entry_x = 0
@@ -155,7 +210,7 @@ class ChristmasLevel(Level):
     def collect_present(self):
         """Collect a present and check if goal chunk should be unlocked"""
         self.presents_collected += 1
-        print(f"🎁 Present collected! ({self.presents_collected}/{self.present_goal})")
+        log.info('level', "🎁 Present collected! (%s/%s)", self.presents_collected, self.present_goal)
         
         # Update the UI counter
         self.present_counter.update_count(self.presents_collected, self.present_goal)
@@ -163,8 +218,19 @@ class ChristmasLevel(Level):
         # Check if we've reached the goal and should unlock the ending scene
         if self.presents_collected >= self.present_goal and not self.chunk_unlocked[8]:
             self.unlock_chunk(8)
-            print(f"🎄✨ You've collected enough presents! The ENDING SCENE is now unlocked!")
-            print(f"🎵 Listen... the children are singing!")
+            log.info('level', "🎄✨ You've collected enough presents! The ENDING SCENE is now unlocked!")
+            log.info('level', "🎵 Listen... the children are singing!")
+        
+        if not self.is_in_interior:
+            set_music_state(self.outside_music_state())
+    
+    def outside_music_state(self):
+        """Get the music state for the outdoor chunks
+        
+        Returns:
+            'goal_reached' once enough presents are collected, else 'outside'
+        """
+        return 'goal_reached' if self.presents_collected >= self.present_goal else 'outside'
     
     def unlock_chunk(self, chunk_id):
         """Unlock a chunk, making it available for generation
@@ -175,13 +241,20 @@ class ChristmasLevel(Level):
         if chunk_id not in self.chunk_unlocked:
             # Add new chunk to the unlocked dictionary
             self.chunk_unlocked[chunk_id] = True
-            print(f"🎁 Unlocked new chunk: {chunk_id}!")
+            log.info('level', "🎁 Unlocked new chunk: %s!", chunk_id)
         elif not self.chunk_unlocked[chunk_id]:
             # Unlock previously locked chunk
             self.chunk_unlocked[chunk_id] = True
-            print(f"🎁 Unlocked chunk: {chunk_id}!")
+            log.info('level', "🎁 Unlocked chunk: %s!", chunk_id)
         else:
-            print(f"Chunk {chunk_id} is already unlocked.")
+            log.debug('level', "Chunk %s is already unlocked.", chunk_id)
+    
+    def _preload_assets(self):
+        """Preload the map layers, atlas sources and ending backdrop on a thread pool"""
+        map_dir = os.path.join('assets', 'images', 'christmas')
+        map_layers = sorted({os.path.join(map_dir, file_name)
+                             for map_files in self.maps.values() for file_name in map_files})
+        assets.preload(map_layers + ['assets/singing_tree.png'], atlases=['characters', 'items', 'hud'])
     
     def _build_valid_neighbors(self):
         """Build valid neighbor mappings based on path alignment
@@ -311,36 +384,33 @@ class ChristmasLevel(Level):
             # If no valid maps, use map 0 as fallback (should always be unlocked)
             if not valid_maps:
                 map_id = 0
-                print(f"WARNING: No valid unlocked maps for ({chunk_x}, {chunk_y}), using map 0")
+                log.warning('level', "⚠️ No valid unlocked maps for (%s, %s), using map 0", chunk_x, chunk_y)
             else:
                 map_id = random.choice(list(valid_maps))
             
             self.generated_chunks[(chunk_x, chunk_y)] = map_id
             if len(valid_maps) > 1:
-                print(f"Generated chunk at ({chunk_x}, {chunk_y}) with map {map_id} (from {len(valid_maps)} unlocked options)")
+                log.debug('level', "Generated chunk at (%s, %s) with map %s (from %s unlocked options)", chunk_x, chunk_y, map_id, len(valid_maps))
             else:
-                print(f"Generated chunk at ({chunk_x}, {chunk_y}) with map {map_id} (only unlocked option)")
+                log.debug('level', "Generated chunk at (%s, %s) with map %s (only unlocked option)", chunk_x, chunk_y, map_id)
         
         # Special handling for chunk 8 (ending scene)
         if map_id == 8:
             from scenes import EndingScene
             ending_scene = EndingScene(self.player, name="The Grinch Returns")
             
-            # Clear existing scenes and add ending scene
-            self.scenes.clear()
-            self.add_scene(ending_scene)
-            self.current_scene_index = 0
-            print("🎄🎁 ENDING SCENE ACTIVATED! The Grinch returns the presents to the children!")
+            # Suspend the chunk we came from under the ending scene
+            self.push_scene(ending_scene)
+            log.info('level', "🎄🎁 ENDING SCENE ACTIVATED! The Grinch returns the presents to the children!")
         else:
             # Create regular chunk with coordinates and map_id
             chunk = Chunk(chunk_x, chunk_y, map_id, self.maps, level=self)
             chunk.set_player(self.player)
             
-            # Clear existing scenes and add new chunk
-            self.scenes.clear()
-            self.add_scene(chunk)
-            self.current_scene_index = 0
+            # Drop the old chunk (and anything suspended under it)
+            self.replace_scenes(chunk)
     
+    @transition('switch_chunk')
     def switch_chunk(self, new_x, new_y, entry_direction):
         """Switch to a different chunk at the given coordinates
         
@@ -367,89 +437,74 @@ class ChristmasLevel(Level):
         self.player.x = max(padding, min(self.player.x, SCREEN_WIDTH - self.player.width - padding))
         self.player.y = max(padding, min(self.player.y, SCREEN_HEIGHT - self.player.height - padding))
     
-    def _get_interior_level_config(self, level_num):
-        """Get the configuration for a specific interior level (1-2)
+    def interior_layout_name(self, chunk_x, chunk_y):
+        """Get the layout of the house in a chunk
+        
+        Most houses get the layout generated for their chunk; with
+        HANDMADE_LAYOUT_CHANCE a house uses a hand-made layout file instead.
+        The choice is seeded by the chunk, so a house always gets the same one.
         
         Args:
-            level_num: Interior level number (1 or 2)
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
             
         Returns:
-            dict with 'walls', 'enemy_areas', 'tree_areas' lists
+            Layout name for load_layout
         """
-        configs = {
-            1: {  # Level 1 - Complex room divisions
-                'walls': [
-                    # Border walls
-                    Wall(0, 0, 1280, 20), Wall(0, 0, 20, 720),
-                    Wall(0, 700, 1280, 20), Wall(1260, 0, 20, 720),
-                    # Interior walls
-                    Wall(0, 350, 180, 20), Wall(300, 350, 220, 20),
-                    Wall(520, 350, 20, 100), Wall(520, 600, 20, 200),
-                    Wall(780, 0, 20, 500)
-                ],
-                'enemy_areas': [(270, 400, 200, 200), (810, 300, 440, 300)],
-                'tree_areas': [(30, 380, 150, 310), (30, 30, 500, 170), (810, 30, 440, 300)]
-            },
-            2: {  # Level 2 - Multiple areas with central dividers
-                'walls': [
-                    # Border walls
-                    Wall(0, 0, 1280, 20), Wall(0, 0, 20, 720),
-                    Wall(0, 700, 1280, 20), Wall(1260, 0, 20, 720),
-                    # Interior walls
-                    Wall(655, 150, 20, 400),  # Central vertical divider
-                    Wall(300, 340, 700, 20),  # Middle horizontal
-                    Wall(0, 340, 150, 20),  # Left horizontal extension
-                    Wall(1150, 340, 200, 20)  # Right horizontal extension
-                ],
-                'enemy_areas': [
-                    (380, 30, 150, 300),  # Upper left-center
-                    (850, 30, 150, 300),  # Upper right-center
-                    (900, 400, 200, 200),  # Lower right
-                    (200, 400, 200, 200)  # Lower left
-                ],
-                'tree_areas': [
-                    (30, 30, 130, 300),  # Top left
-                    (1120, 30, 130, 300),  # Top right
-                    (30, 520, 130, 170),  # Bottom left
-                    (1120, 520, 130, 170)  # Bottom right
-                ]
-            }
-        }
-        return configs.get(level_num, configs[1])  # Default to level 1 if invalid
+        rng = random.Random(f"house {chunk_x},{chunk_y}")
+        handmade = list_layouts()
+        if handmade and rng.random() < HANDMADE_LAYOUT_CHANCE:
+            return rng.choice(handmade)
+        return bsp_layout_name(chunk_x, chunk_y)
+    
+    def interior_seed(self, chunk_x, chunk_y):
+        """Get the generation seed of the house in a chunk
+        
+        Seeded by the chunk like interior_layout_name, so a house is always
+        generated the same way and regenerating it reuses the cached
+        reachability check for its layout and seed.
+        
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+            
+        Returns:
+            32-bit seed for Interior_1
+        """
+        return random.Random(f"house seed {chunk_x},{chunk_y}").getrandbits(32)
     
-    def _create_interior_1(self, level_num=None, saved_state=None):
-        """Create an Interior_1 instance with level configuration
+    def _create_interior_1(self, layout_name, saved_state=None, seed=None):
+        """Create an Interior_1 instance from a layout
         
         Args:
-            level_num: Which level to create (1 or 2). If None, randomly select
+            layout_name: Which layout to use (file name in assets/layouts, or
+                a generated layout name - see interior_layout_name)
             saved_state: InteriorState object to restore from, or None for new interior
+            seed: Generation seed for a new interior (see interior_seed), or
+                None for a random one
             
         Returns:
             Interior_1 scene
         """
-        # Determine level number (only 2 levels available)
-        if level_num is None:
-            level_num = random.randint(1, 2)
-        
-        # Get level configuration
-        config = self._get_interior_level_config(level_num)
+        # Compiled once, then shared by every interior using this layout
+        layout = load_layout(layout_name)
         
         # Create Interior_1 with configuration
         interior = Interior_1(
-            walls=config['walls'],
-            enemy_spawn_areas=config['enemy_areas'],
-            tree_spawn_areas=config['tree_areas'],
+            layout=layout,
             num_enemies=3,
             num_presents=8,  # Target (actual number depends on tree placement)
             num_trees=3,
             level=self,
-            name=f"Interior {level_num}",
-            saved_state=saved_state  # Pass saved state for restoration
+            name=f"Interior {layout_name}",
+            saved_state=saved_state,  # Pass saved state for restoration
+            seed=seed
         )
         
-        print(f"🏠 Created Interior Level {level_num}")
+        log.info('level', "🏠 Created Interior %s", layout_name)
         return interior
     
+    @transition('enter_interior')
     def enter_interior(self):
         """Enter an interior area"""
         if self.is_in_interior:
@@ -465,24 +520,34 @@ class ChristmasLevel(Level):
         saved_state = self.saved_interiors.get(self.current_chunk_pos)
         
         if saved_state:
-            # Restore previous interior
-            interior = self._create_interior_1(level_num=saved_state.level_num, saved_state=saved_state)
-            print(f"🏠 Restoring Interior Level {saved_state.level_num}")
+            # Catch up on the time spent away, then pin enemies to concrete positions
+            saved_state.advance_to(self.level_time)
+            saved_state.resolve()
+            
+            interior = self.interior_cache.pop(self.current_chunk_pos, None)
+            if interior:
+                # Warm re-entry - reuse the scene and its objects as they are
+                interior.resume_from_state(saved_state)
+            else:
+                # Restore previous interior
+                interior = self._create_interior_1(layout_name=saved_state.layout_name, saved_state=saved_state)
+            log.info('level', "🏠 Restoring Interior %s", saved_state.layout_name)
         else:
-            # Create new random interior
-            interior = self._create_interior_1()
-            print("🏠 Entering new Interior - Stealth challenge!")
+            # Create new interior - each house's layout and seed are picked from its chunk
+            interior = self._create_interior_1(layout_name=self.interior_layout_name(*self.current_chunk_pos),
+                                               seed=self.interior_seed(*self.current_chunk_pos))
+            log.info('level', "🏠 Entering new Interior - Stealth challenge!")
         
         interior.set_player(self.player)
         
         self.current_interior = interior
         self.is_in_interior = True
+        set_music_state('inside')
         
-        # Switch to interior scene
-        self.scenes.clear()
-        self.add_scene(interior)
-        self.current_scene_index = 0
+        # Suspend the chunk and switch to the interior scene
+        self.push_scene(interior)
     
+    @transition('exit_interior')
     def exit_interior(self):
         """Exit the interior and return to the chunk"""
         if not self.is_in_interior:
@@ -491,14 +556,15 @@ class ChristmasLevel(Level):
         # Save interior state before exiting (if it's an Interior_1)
         if isinstance(self.current_interior, Interior_1):
             self._save_interior_state(self.door_entry_chunk_pos, self.current_interior)
+            self._cache_interior(self.door_entry_chunk_pos, self.current_interior)
         
-        # Return to the chunk we were in
+        # Return to the chunk we were in - it was suspended, not rebuilt
         self.is_in_interior = False
         self.current_interior = None
-        
-        # Restore chunk at the saved coordinates
+        self.pop_scene()
         self.current_chunk_pos = self.door_entry_chunk_pos
-        self.create_chunk(self.door_entry_chunk_pos[0], self.door_entry_chunk_pos[1])
+        
+        set_music_state(self.outside_music_state())
         
         # Reset player position and state (clears caught status, velocities, etc.)
         self.player.reset_for_new_round(self.door_entry_x, self.door_entry_y + 45)
@@ -510,15 +576,30 @@ class ChristmasLevel(Level):
             chunk_pos: (x, y) chunk coordinates
             interior: Interior_1 instance to save
         """
-        # Extract level number from interior name
-        level_num = interior.level_num if hasattr(interior, 'level_num') else 1
+        layout_name = interior.layout_name
         
         # Save enemy positions
         enemy_positions = [(e.x, e.y) for e in interior.enemies]
         
+        # Save each patrol as an arc length along its route for the off-screen simulation
+        route_keys = {id(route): key for key, route in interior.patrol_routes.items()}
+        patrols = []
+        for e in interior.enemies:
+            if e.patrol_route:
+                patrols.append({
+                    'route': e.patrol_route,
+                    'route_key': route_keys.get(id(e.patrol_route)),
+                    'distance': e.patrol_route.project(e.rect.center),
+                    'speed': e.speed,
+                    'center_offset': (e.rect.centerx - e.x, e.rect.centery - e.y),
+                    'patrol_index': e.patrol_index
+                })
+            else:
+                patrols.append(None)
+        
         # Save present data (position and collected status)
         present_data = [
-            {'x': p.x, 'y': p.y, 'collected': p.is_collected}
+            {'x': p.x, 'y': p.y, 'collected': p.is_collected, 'image': p.image_index}
             for p in interior.presents
         ]
         
@@ -526,17 +607,74 @@ class ChristmasLevel(Level):
         tree_positions = [(t.full_x, t.full_y) for t in interior.trees]
         
         # Create and store state
-        state = InteriorState(level_num, enemy_positions, present_data, tree_positions)
+        state = InteriorState(layout_name, enemy_positions, present_data, tree_positions,
+                              patrols=patrols, sim_time=self.level_time, seed=interior.seed)
         self.saved_interiors[chunk_pos] = state
         
-        print(f"💾 Saved interior state for chunk {chunk_pos}: Level {level_num}, {len(enemy_positions)} enemies, {len(present_data)} presents")
+        log.debug('level', "💾 Saved interior state for chunk %s: %s, %s enemies, %s presents", chunk_pos, layout_name, len(enemy_positions), len(present_data))
+    
+    def _cache_interior(self, chunk_pos, interior):
+        """Keep an interior scene for the next visit, evicting the least recent one
+        
+        Args:
+            chunk_pos: (x, y) chunk coordinates
+            interior: Interior_1 instance the player just left
+        """
+        self.interior_cache[chunk_pos] = interior
+        self.interior_cache.move_to_end(chunk_pos)
+        while len(self.interior_cache) > MAX_CACHED_INTERIORS:
+            _, evicted = self.interior_cache.popitem(last=False)
+            evicted.release_objects()
+    
+    def _simulate_saved_interiors(self, dt):
+        """Advance saved interiors on a coarse timer instead of every frame
+        
+        Args:
+            dt: Delta time in seconds
+        """
+        self.level_time += dt
+        self.offscreen_sim_timer += dt
+        if self.offscreen_sim_timer < OFFSCREEN_SIM_INTERVAL:
+            return
+        self.offscreen_sim_timer = 0.0
+        
+        for state in self.saved_interiors.values():
+            state.advance_to(self.level_time)
+    
+    def profile_tag(self):
+        """Get the profiler tag for where the player is (scene type and chunk or interior id)"""
+        if self.is_in_interior and self.current_interior:
+            return (f"{type(self.current_interior).__name__} {self.current_interior.layout_name} "
+                    f"at {self.door_entry_chunk_pos}")
+        return f"Chunk {self.current_chunk_pos} map {self.generated_chunks.get(self.current_chunk_pos, 0)}"
+    
+    def write_debug_report(self):
+        """Write the asset, text, sound, surface memory, hitch and blit reports to a file in LOG_DIR
+        
+        Returns:
+            Path of the file written, or None if it could not be written
+        """
+        lines = (assets.report_lines() + text_cache.report_lines() + sfx.report_lines()
+                 + surface_memory.report_lines() + hitch_detector.report_lines())
+        if blit_audit.enabled:
+            lines += blit_audit.report_lines()
+        path = os.path.join(LOG_DIR, f"report-{time.strftime('%Y%m%d-%H%M%S')}.txt")
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+        except OSError as e:
+            log.warning('level', "⚠️ Could not write debug report: %s", e)
+            return None
+        log.info('level', "📋 Debug report written to %s", path)
+        return path
     
     def restart_game(self):
         """Request return to main menu from Game class (on game over)"""
         if self.game:
             self.game.request_return_to_menu()
         else:
-            print("⚠️ Cannot return to menu - no game reference")
+            log.warning('level', "⚠️ Cannot return to menu - no game reference")
     
     def handle_event(self, event):
         """Handle pygame events
@@ -548,14 +686,14 @@ class ChristmasLevel(Level):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSLASH:
                 self.debug_mode = not self.debug_mode
-                print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+                log.info('level', "Debug mode: %s", 'ON' if self.debug_mode else 'OFF')
             elif event.key == pygame.K_e:
                 self.e_pressed = True
             # TEST: Press P to collect 10 presents (for testing)
             elif event.key == pygame.K_p:
                 for _ in range(10):
                     self.collect_present()
-                print(f"🎁 Added 10 presents! Total: {self.presents_collected}/{self.present_goal}")
+                log.info('level', "🎁 Added 10 presents! Total: %s/%s", self.presents_collected, self.present_goal)
             # TEST: Press [ to trigger fade to black
             elif event.key == pygame.K_LEFTBRACKET:
                 self.fade_to_black()
@@ -565,6 +703,18 @@ class ChristmasLevel(Level):
             # TEST: Press \ and R together to reset fade
             elif event.key == pygame.K_r and pygame.key.get_pressed()[pygame.K_BACKSLASH]:
                 self.reset_fade()
+            # DEBUG: Press F5 to write the asset, text, sound, surface memory, hitch and blit reports to logs/
+            elif event.key == pygame.K_F5:
+                self.write_debug_report()
+            # DEBUG: Press F7 to write the surface memory report to logs/
+            elif event.key == pygame.K_F7:
+                surface_memory.write_report()
+            # DEBUG: Press F8 to switch GC policy (hitch counts are kept per policy)
+            elif event.key == pygame.K_F8:
+                gc_policy.toggle()
+            # DEBUG: Press F9 to start/stop a sampling profile of the game thread (written to logs/)
+            elif event.key == pygame.K_F9:
+                profiler.toggle(tag=self.profile_tag)
         
         # Pass events to parent
         super().handle_event(event)
@@ -575,17 +725,17 @@ class ChristmasLevel(Level):
         e_pressed_this_frame = self.e_pressed
         self.e_pressed = False
         
+        # Keep saved interiors alive while the player is elsewhere
+        self._simulate_saved_interiors(dt)
+        
         # Update lives tracker to match player's current lives
         if self.player and self.lives_tracker:
             self.lives_tracker.set_lives(self.player.lives)
         
-        # Music management based on location
+        # Advance music crossfades
+        audio.update(dt)
+        
         if not self.is_in_interior:
-            # Play special music when goal is reached
-            if self.presents_collected >= self.present_goal:
-                play_music("assets/sounds/children_singing.mp3")
-            else:
-                play_music("assets/sounds/outside_music.mp3")
             # Check for chunk switching
             scene = self.get_current_scene()
             if isinstance(scene, Chunk):
@@ -620,50 +770,58 @@ class ChristmasLevel(Level):
         # Render scene (pass debug mode to chunk)
         scene = self.get_current_scene()
         if scene:
+            # World into the render target (low resolution if RENDER_SCALE > 1), scaled up once
+            world = self.render_target.begin(screen)
             if isinstance(scene, Chunk):
-                scene.render(screen, debug=self.debug_mode)
+                scene.render(world, debug=self.debug_mode)
             elif isinstance(scene, Interior):
-                scene.render(screen, debug=self.debug_mode)
+                scene.render(world, debug=self.debug_mode)
             else:
-                scene.render(screen)
+                scene.render(world)
+            self.render_target.present(screen)
+            
+            # Prompts, text and debug drawing at full resolution
+            scene.render_overlay(screen)
         
         # Only show HUD in debug mode
         if self.debug_mode:
-            font = pygame.font.Font(None, 36)
-            
             # Show current chunk/interior
             if self.is_in_interior:
-                text = font.render("Interior - Press SPACE to exit", True, (255, 255, 255))
+                text = render_text("Interior - Press SPACE to exit", 36, (255, 255, 255))
                 screen.blit(text, (10, 10))
             else:
                 # Show chunk ID (sprite/map number)
                 current_map_id = self.generated_chunks.get(self.current_chunk_pos, 0)
                 chunk_text = f"Chunk: {current_map_id}"
-                text = font.render(chunk_text, True, (148, 87, 235))
+                text = render_text(chunk_text, 36, (148, 87, 235))
                 screen.blit(text, (10, 10))
                 
                 # Show chunk coordinates
                 coords_chunk_text = f"Coords: ({self.current_chunk_pos[0]}, {self.current_chunk_pos[1]})"
-                text_coords_chunk = font.render(coords_chunk_text, True, (148, 87, 235))
+                text_coords_chunk = render_text(coords_chunk_text, 36, (148, 87, 235))
                 screen.blit(text_coords_chunk, (10, 50))
             
             # Show player position
             player_pos_text = f"Player: (X:{int(self.player.x)}, Y:{int(self.player.y)})"
-            text_player_pos = font.render(player_pos_text, True, (148, 87, 235))
+            text_player_pos = render_text(player_pos_text, 36, (148, 87, 235))
             screen.blit(text_player_pos, (10, 90))
             
             # Show chunks explored count
             chunks_text = f"Chunks explored: {len(self.generated_chunks)}"
-            text_chunks = font.render(chunks_text, True, (148, 87, 235))
+            text_chunks = render_text(chunks_text, 36, (148, 87, 235))
             screen.blit(text_chunks, (10, 130))
             
             # Show presents collected
             presents_text = f"Presents: {self.presents_collected}/{self.present_goal}"
-            text_presents = font.render(presents_text, True, (255, 215, 0))  # Gold color
+            text_presents = render_text(presents_text, 36, (255, 215, 0))  # Gold color
             screen.blit(text_presents, (10, 170))
             
+            # Show surface memory
+            text_memory = render_text(surface_memory.summary(), 36, (148, 87, 235))
+            screen.blit(text_memory, (10, 210))
+            
             # Debug mode indicator
-            debug_text = font.render("DEBUG MODE (Press \\ to toggle)", True, (255, 255, 0))
+            debug_text = render_text("DEBUG MODE (Press \\ to toggle)", 36, (255, 255, 0))
             screen.blit(debug_text, (SCREEN_WIDTH - 500, 10))
         
         # === Render UI Elements (Always Visible) ===
@@ -674,8 +832,7 @@ class ChristmasLevel(Level):
         if not self.is_in_interior:
             scene = self.get_current_scene()
             if isinstance(scene, Chunk) and scene.check_door_enter():
-                font = pygame.font.Font(None, 36)
-                hint_text = font.render("Press E to enter", True, (255, 255, 0))
+                hint_text = render_text("Press E to enter", 36, (255, 255, 0))
                 screen.blit(hint_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 50))
         
         # Render fade overlay on top of everything (from base Level class)
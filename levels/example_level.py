@@ -1,6 +1,6 @@
 """Example level - demonstrates both factory function and inheritance approaches"""
 
-from game import Level
+from game import Level, log
 from scenes.example_scene import create_example_scene, ExampleScene
 
 
@@ -67,7 +67,7 @@ class ExampleLevel(Level):
     def on_level_complete(self):
         """Called when level is completed"""
         self.level_complete = True
-        print(f"Level {self.name} completed!")
+        log.info('level', "Level %s completed!", self.name)
         # Could switch to next level or show victory screen
         # self.set_scene(1)  # Switch to victory scene
     def render(self, screen):
@@ -4,6 +4,7 @@ from game import Game
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 from levels.christmas_level import ChristmasLevel
 from scenes import Menu
+from utils import sfx
 
 
 def main():
@@ -11,6 +12,9 @@ def main():
     # Create the game with settings from config
     game = Game(width=SCREEN_WIDTH, height=SCREEN_HEIGHT, title=SCREEN_TITLE)
     
+    # Decode every sound effect once, before any level needs them
+    sfx.load()
+    
     # Create and set the menu
     menu = Menu()
     game.set_menu(menu)
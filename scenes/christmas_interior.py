@@ -2,8 +2,9 @@
 
 import pygame
 import random
-from game import Scene
+from game import Scene, log
 from game_objects import Enemy, Present, Wall
+from utils.text import render_text
 
 
 class ChristmasInterior(Scene):
@@ -110,7 +111,7 @@ class ChristmasInterior(Scene):
             
             attempts += 1
         
-        print(f"Spawned {len(self.presents)} presents in Christmas Interior")
+        log.debug('scene', "Spawned %s presents in Christmas Interior", len(self.presents))
     
     def set_player(self, player):
         """Set the player for this interior
@@ -134,7 +135,7 @@ class ChristmasInterior(Scene):
         if self.game_over_active:
             self.game_over_timer -= 1
             if self.game_over_timer <= 0:
-                print("🔄 Restarting game...")
+                log.info('scene', "🔄 Restarting game...")
                 if self.level:
                     self.level.restart_game()
             return  # Don't update game during game over
@@ -200,7 +201,7 @@ class ChristmasInterior(Scene):
                 
                 # Check if just collected
                 if present.is_collected:
-                    print(f"Present collected! Notifying level...")
+                    log.info('scene', "Present collected! Notifying level...")
                     # Notify level of collection
                     if self.level:
                         self.level.collect_present()
@@ -222,7 +223,7 @@ class ChristmasInterior(Scene):
         """Trigger the kickout state (caught by enemy)"""
         if self.player and self.player.lives <= 0:
             # Game over - player has no lives left
-            print("💀 GAME OVER! Out of lives!")
+            log.info('scene', "💀 GAME OVER! Out of lives!")
             self.game_over_active = True
             self.game_over_timer = self.game_over_duration
         else:
@@ -257,11 +258,8 @@ class ChristmasInterior(Scene):
         if self.game_over_active:
             # Black screen during game over
             screen.fill((0, 0, 0))
-            font_large = pygame.font.Font(None, 72)
-            font_small = pygame.font.Font(None, 48)
-            
-            msg1 = font_large.render("GAME OVER", True, (255, 0, 0))
-            msg2 = font_small.render("You ran out of lives", True, (255, 255, 255))
+            msg1 = render_text("GAME OVER", 72, (255, 0, 0))
+            msg2 = render_text("You ran out of lives", 48, (255, 255, 255))
             
             screen.blit(msg1, (640 - msg1.get_width() // 2, 300))
             screen.blit(msg2, (640 - msg2.get_width() // 2, 380))
@@ -271,8 +269,7 @@ class ChristmasInterior(Scene):
         if self.is_kickout_active:
             # Black screen during kickout
             screen.fill((0, 0, 0))
-            font = pygame.font.Font(None, 72)
-            msg = font.render("CAUGHT! KICKED OUT.", True, (255, 0, 0))
+            msg = render_text("CAUGHT! KICKED OUT.", 72, (255, 0, 0))
             screen.blit(msg, (640 - msg.get_width() // 2, 360 - msg.get_height() // 2))
             return
         
@@ -300,8 +297,7 @@ class ChristmasInterior(Scene):
             
             # Show lives
             if debug:
-                font = pygame.font.Font(None, 24)
-                lives_text = font.render(f"Lives: {self.player.lives}", True, (255, 255, 0))
+                lives_text = render_text(f"Lives: {self.player.lives}", 24, (255, 255, 0))
                 screen.blit(lives_text, (10, 10))
         
         # Debug: draw enemy collision boxes (player hitboxes are drawn in player.render())
@@ -2,9 +2,12 @@
 
 import pygame
 import os
-from game import Scene
+from game import Scene, log
 from game_objects import Player
+from game.render_target import VIEW_WIDTH, VIEW_HEIGHT
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.assets import assets
+from utils.tiles import TiledLayer
 
 
 class Chunk(Scene):
@@ -18,10 +21,10 @@ class Chunk(Scene):
         self.maps_dict = maps_dict
         self.level = level  # Reference to parent level for debug mode
         
-        # Map surfaces
+        # Map layers (tiled) and collision geometry
         self.map_bottom = None
         self.map_top = None
-        self.walls = None
+        self.walls_path = None
         self.collision_rects = []
         self.door_rects = []
         
@@ -40,49 +43,45 @@ class Chunk(Scene):
             map_id: ID of the map to load (0-7)
         """
         if map_id not in self.maps_dict:
-            print(f"Warning: Map {map_id} not found in maps_dict")
+            log.warning('scene', "⚠️ Map %s not found in maps_dict", map_id)
             return
         
         map_files = self.maps_dict[map_id]
         assets_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'images', 'christmas')
         
-        # Load bottom layer
+        # Load bottom layer (split into tiles; opaque tiles blit without alpha)
         bottom_path = os.path.join(assets_dir, map_files[0])
-        if os.path.exists(bottom_path):
-            self.map_bottom = pygame.image.load(bottom_path).convert_alpha()
-            self.map_bottom = pygame.transform.scale(self.map_bottom, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        if assets.exists(bottom_path):
+            self.map_bottom = assets.tiles(bottom_path, self, size=(VIEW_WIDTH, VIEW_HEIGHT))
         else:
-            print(f"Warning: {bottom_path} not found")
-            self.map_bottom = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.map_bottom.fill((100, 100, 100))
+            # Plain grey floor, built once for every chunk missing its map
+            self.map_bottom = assets.fallback('map_bottom', self, self._create_fallback_floor)
         
-        # Load top layer
+        # Load top layer (only the tiles the overlay actually covers are kept)
         top_path = os.path.join(assets_dir, map_files[1])
-        if os.path.exists(top_path):
-            self.map_top = pygame.image.load(top_path).convert_alpha()
-            self.map_top = pygame.transform.scale(self.map_top, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        else:
-            self.map_top = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.map_top.set_alpha(0)
+        if assets.exists(top_path):
+            self.map_top = assets.tiles(top_path, self, size=(VIEW_WIDTH, VIEW_HEIGHT))
         
-        # Load walls for collision
+        # Walls are only used for collision (never drawn)
         walls_path = os.path.join(assets_dir, map_files[2])
-        if os.path.exists(walls_path):
-            self.walls = pygame.image.load(walls_path).convert_alpha()
-            self.walls = pygame.transform.scale(self.walls, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        else:
-            self.walls = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.walls.set_alpha(0)
+        if assets.exists(walls_path):
+            self.walls_path = walls_path
+    
+    @staticmethod
+    def _create_fallback_floor():
+        """Create the grey floor layer used when a map image is missing"""
+        floor = pygame.Surface((VIEW_WIDTH, VIEW_HEIGHT))
+        floor.fill((100, 100, 100))
+        return TiledLayer(floor)
     
     def generate_collisions(self):
-        """Generate collision rectangles from walls surface"""
-        if self.walls is None:
+        """Generate collision rectangles from the walls image (no walls, no collisions)"""
+        if self.walls_path is None:
             return
         
-        # Create mask from walls surface
-        mask = pygame.mask.from_surface(self.walls)
-        # Get bounding rects from mask
-        self.collision_rects = mask.get_bounding_rects()
+        # Bounding rects of the walls stretched over the screen - measured on
+        # the small source image and shared by every chunk using this map
+        self.collision_rects = list(assets.collision_rects(self.walls_path, self, (SCREEN_WIDTH, SCREEN_HEIGHT)))
     
     def setup_doors(self):
         """Setup door rectangles for this chunk based on map appearance"""
@@ -174,11 +173,12 @@ class Chunk(Scene):
         
         Args:
             screen: pygame.Surface to render to
-            debug: If True, render collision and door rects
+            debug: If True, game objects draw their hitboxes (collision and
+                door rects are drawn by render_overlay)
         """
         # Render map bottom layer
         if self.map_bottom:
-            screen.blit(self.map_bottom, (0, 0))
+            self.map_bottom.render(screen)
         
         # Render game objects (player, etc.)
         for obj in self.game_objects:
@@ -193,15 +193,18 @@ class Chunk(Scene):
         
         # Render map top layer (overlay)
         if self.map_top:
-            screen.blit(self.map_top, (0, 0))
+            self.map_top.render(screen)
+    
+    def render_overlay(self, screen):
+        """Render UI and debug rects at full resolution
         
-        # Render UI elements
-        for ui in self.ui_elements:
-            if ui.visible:
-                ui.render(screen)
+        Args:
+            screen: Display surface
+        """
+        super().render_overlay(screen)
         
         # Debug mode: Render collision rects
-        if debug:
+        if self.level and self.level.debug_mode:
             for rect in self.collision_rects:
                 pygame.draw.rect(screen, (255, 0, 0), rect, 2)
             
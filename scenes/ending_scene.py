@@ -2,10 +2,13 @@
 
 import pygame
 import random
-from game import Scene
+from game import Scene, log, track_surface
+from game.render_target import VIEW_WIDTH, VIEW_HEIGHT
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from game_objects import PassiveChild, StaticPresent
-from utils.audio import play_music
+from utils.audio import set_music_state
+from utils.assets import assets
+from utils.text import render_text
 
 
 # Child positions based on singing_tree_childrenblocks.png
@@ -61,6 +64,10 @@ class EndingScene(Scene):
         self.background_color = (240, 250, 255)  # Light winter blue
         self.background_image = self._load_background()
         
+        # Background with every static object (children, presents) stamped in
+        self.backdrop = self._create_backdrop()
+        self.static_objects = []
+        
         # Player (CPU controlled)
         self.player = player
         self.cpu_control_active = True
@@ -91,7 +98,10 @@ class EndingScene(Scene):
         self.present_spawn_counter = 0
         self.max_presents = 20  # Total presents to spawn
         
-        print("🎄 ENDING SCENE LOADED - The Grinch returns!")
+        # Children singing for the rest of the game
+        set_music_state('ending')
+        
+        log.info('scene', "🎄 ENDING SCENE LOADED - The Grinch returns!")
     
     def _load_background(self):
         """Load the singing tree background
@@ -100,23 +110,67 @@ class EndingScene(Scene):
             pygame.Surface or None: Background image
         """
         try:
-            bg = pygame.image.load('assets/singing_tree.png').convert_alpha()
-            # Scale to screen size
-            bg = pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            print("✅ Singing tree background loaded")
-            return bg
+            return assets.image('assets/singing_tree.png', self, size=(VIEW_WIDTH, VIEW_HEIGHT))
         except pygame.error as e:
-            print(f"⚠️ Error loading singing tree background: {e}")
+            log.warning('scene', "⚠️ Error loading singing tree background: %s", e)
             return None
     
+    def _create_backdrop(self):
+        """Create the backdrop surface static objects are stamped into
+        
+        Returns:
+            pygame.Surface at world render target size
+        """
+        backdrop = pygame.Surface((VIEW_WIDTH, VIEW_HEIGHT))
+        if pygame.display.get_surface():
+            backdrop = backdrop.convert()
+        track_surface(backdrop, self)
+        self._draw_background(backdrop)
+        return backdrop
+    
+    def _draw_background(self, surface):
+        """Draw the bare background (no objects)"""
+        if self.background_image:
+            surface.blit(self.background_image, (0, 0))
+        else:
+            surface.fill(self.background_color)
+    
+    def _redraw_area(self, surface, area, objects):
+        """Draw the background and the objects touching an area again, inside that area only
+        
+        Args:
+            surface: Surface to draw on
+            area: View-space rect to redraw
+            objects: Objects that may touch the area (drawn in depth order)
+        """
+        touching = [obj for obj in objects if obj.visible and obj.view_bounds().colliderect(area)]
+        touching.sort(key=lambda obj: obj.rect.bottom)
+        
+        previous_clip = surface.get_clip()
+        surface.set_clip(area)
+        self._draw_background(surface)
+        for obj in touching:
+            obj.render(surface)
+        surface.set_clip(previous_clip)
+    
+    def _stamp(self, obj):
+        """Add a static object to the backdrop at its depth
+        
+        Args:
+            obj: Object that never moves (needs rect and view_bounds())
+        """
+        self.static_objects.append(obj)
+        self._redraw_area(self.backdrop, obj.view_bounds(), self.static_objects)
+    
     def _create_children(self):
         """Create passive children at predefined positions"""
         for child_id, (x, y, direction) in CHILD_POSITIONS.items():
             child = PassiveChild(x, y, direction)
             self.children.append(child)
             self.add_game_object(child)
+            self._stamp(child)
         
-        print(f"👶 Created {len(self.children)} passive children")
+        log.debug('scene', "👶 Created %s passive children", len(self.children))
     
     def update(self, dt):
         """Update the ending scene with CPU-controlled player and present spawning
@@ -124,9 +178,6 @@ class EndingScene(Scene):
         Args:
             dt: Delta time in seconds
         """
-        # Play children singing music during ending
-        play_music("assets/sounds/children_singing.mp3")
-        
         # === Phase 1: CPU-controlled player movement ===
         if self.cpu_control_active and not self.player_stopped:
             self.player_movement_timer += dt
@@ -137,7 +188,7 @@ class EndingScene(Scene):
                 self.player.velocity_y = 0
                 self.player.set_state('idle_left')
                 self.player_stopped = True
-                print("🎅 Grinch stopped - preparing to return presents...")
+                log.info('scene', "🎅 Grinch stopped - preparing to return presents...")
         
         # === Phase 2: Wait before spawning presents ===
         if self.player_stopped and not self.present_spawn_started:
@@ -145,7 +196,7 @@ class EndingScene(Scene):
             
             if self.present_spawn_timer >= self.present_spawn_delay:
                 self.present_spawn_started = True
-                print("🎁 Starting present spawning!")
+                log.info('scene', "🎁 Starting present spawning!")
         
         # === Phase 3: Spawn presents ===
         if self.present_spawn_started and len(self.presents) < self.max_presents:
@@ -155,15 +206,10 @@ class EndingScene(Scene):
                 self._spawn_present()
                 self.present_spawn_counter = 0
         
-        # Update all game objects
+        # Update all game objects (presents included)
         for obj in self.game_objects:
             if obj.active:
                 obj.update(dt)
-        
-        # Update presents
-        for present in self.presents:
-            if present.active:
-                present.update(dt)
     
     def _spawn_present(self):
         """Spawn a present at a random location"""
@@ -182,8 +228,9 @@ class EndingScene(Scene):
         present = StaticPresent(x, y, size=64)
         self.presents.append(present)
         self.add_game_object(present)
+        self._stamp(present)
         
-        print(f"🎁 Spawned present #{len(self.presents)} at ({x}, {y})")
+        log.debug('scene', "🎁 Spawned present #%s at (%s, %s)", len(self.presents), x, y)
     
     def render(self, screen, debug=False):
         """Render the ending scene
@@ -192,34 +239,38 @@ class EndingScene(Scene):
             screen: pygame screen surface
             debug: If True, show debug info
         """
-        # Draw background
-        if self.background_image:
-            screen.blit(self.background_image, (0, 0))
-        else:
-            screen.fill(self.background_color)
-        
-        # Sort game objects by y-position for depth (render bottom objects last)
-        sorted_objects = sorted(
-            [obj for obj in self.game_objects if obj.visible],
-            key=lambda obj: obj.rect.bottom if hasattr(obj, 'rect') else obj.y
-        )
+        if debug:
+            # Hitboxes aren't baked - draw every object in depth order
+            self._draw_background(screen)
+            sorted_objects = sorted(
+                [obj for obj in self.game_objects if obj.visible],
+                key=lambda obj: obj.rect.bottom
+            )
+            for obj in sorted_objects:
+                obj.render(screen, debug=debug)
+            return
         
-        # Render all game objects (children, player, presents)
-        for obj in sorted_objects:
-            obj.render(screen, debug=debug)
+        # Children and presents are already in the backdrop
+        screen.blit(self.backdrop, (0, 0))
         
-        # Render presents separately if needed
-        for present in self.presents:
-            if present.visible:
-                present.render(screen, debug=debug)
+        # The player is the only moving object: redraw its area (a pixel of
+        # slack for rounding) so static objects in front of it still cover it
+        self._redraw_area(screen, self.player.view_bounds().inflate(2, 2),
+                          [self.player] + self.static_objects)
+    
+    def render_overlay(self, screen, debug=False):
+        """Render debug text and UI elements at full resolution
         
+        Args:
+            screen: pygame screen surface (display)
+            debug: If True, show debug info
+        """
         # Debug info
         if debug:
-            font = pygame.font.Font(None, 30)
             status = "Moving" if not self.player_stopped else "Stopped"
             spawn_status = f"Spawning ({len(self.presents)}/{self.max_presents})" if self.present_spawn_started else "Waiting"
             
-            debug_text = font.render(f"Player: {status} | Presents: {spawn_status}", True, (255, 255, 0))
+            debug_text = render_text(f"Player: {status} | Presents: {spawn_status}", 30, (255, 255, 0))
             screen.blit(debug_text, (10, 10))
         
         # Render UI elements
@@ -3,9 +3,11 @@
 import pygame
 import random
 import math
-from game import Scene
-from game_objects import Wall, Child, Present, Tree
-from utils import play_music
+import numpy as np
+from game import Scene, log, track_surface
+from game_objects import Wall, Child, Present, Tree, Player
+from utils import (set_music_state, play_sfx, render_text, NavGrid, PatrolRoute, OccupancyGrid, ObjectPool,
+                   ReachabilityMap, get_cached_reachability, cache_reachability)
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 
 
@@ -13,51 +15,82 @@ from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 TREE_WIDTH = 110
 TREE_HEIGHT = 150
 PRESENT_SIZE = 40
+PRESENT_INTERACTION_SIZE = 90  # Present interaction bubble (2 * Present.interaction_range)
 TREE_MARGIN = 40
 TREE_MIN_RADIUS = max(TREE_WIDTH, TREE_HEIGHT) // 6 + TREE_MARGIN  # ~65px
 TREE_MAX_RADIUS = TREE_MIN_RADIUS + 30  # ~95px
 TREE_MIN_SEPARATION = 30
+ENEMY_MIN_SEPARATION = 20
+
+# Patrol waypoints sit this far inside the corners of each enemy spawn area
+PATROL_WAYPOINT_INSET = 20
+
+# Entity pools shared by every interior - objects are reset by value, not rebuilt
+TREE_POOL = ObjectPool(Tree)
+CHILD_POOL = ObjectPool(Child)
+PRESENT_POOL = ObjectPool(Present)
+
+# Spots tried when moving a tree that cuts the player off from the door
+TREE_RELOCATION_ATTEMPTS = 8
+
+# Player rects relative to the top-left of the collision rect (feet):
+# the collision rect itself touches the door, the main rect touches presents
+PLAYER_FEET_REACH = pygame.Rect(0, 0, Player.COLLISION_WIDTH, Player.COLLISION_HEIGHT)
+PLAYER_BODY_REACH = pygame.Rect(
+    -Player.COLLISION_X_OFFSET,
+    Player.PLAYER_HEIGHT - Player.MAIN_RECT_HEIGHT - Player.COLLISION_Y_OFFSET,
+    Player.PLAYER_WIDTH, Player.MAIN_RECT_HEIGHT
+)
 
 
 class Interior_1(Scene):
     """Advanced interior scene with procedural enemy, tree, and present spawning"""
     
-    def __init__(self, walls, enemy_spawn_areas, tree_spawn_areas, 
-                 num_enemies, num_presents, num_trees, level=None, name="Interior 1", saved_state=None):
+    def __init__(self, layout, num_enemies, num_presents, num_trees, level=None,
+                 name="Interior 1", saved_state=None, seed=None):
         """Initialize Interior_1 with spawn configuration
         
         Args:
-            walls: List of Wall objects
-            enemy_spawn_areas: List of (x, y, w, h) tuples for enemy spawn zones
-            tree_spawn_areas: List of (x, y, w, h) tuples for tree spawn zones
+            layout: CompiledLayout with walls, spawn areas, door and player spawn
             num_enemies: Number of enemies to spawn
             num_presents: Target number of presents (will spawn around trees)
             num_trees: Number of trees to spawn
             level: Reference to parent level for tracking state
             name: Scene name
             saved_state: InteriorState object for restoration, or None for new interior
+            seed: Generation seed (random if None); the same layout and seed
+                always produce the same interior
         """
         super().__init__(name)
         self.level = level
         self.background_color = (152, 116, 86)  # Brown/tan floor color
         
-        # Store level number for saving/loading
-        self.level_num = saved_state.level_num if saved_state else int(name.split()[-1]) if name.split()[-1].isdigit() else 1
+        # Layout geometry is compiled once and shared by every interior using it
+        self.layout = layout
+        self.layout_name = layout.name  # Stored for saving/loading
         
         # Store spawn configuration
-        self.walls = walls
-        self.enemy_spawn_areas = enemy_spawn_areas
-        self.tree_spawn_areas = tree_spawn_areas
+        self.walls = list(layout.walls)
+        self.enemy_spawn_areas = layout.enemy_areas
+        self.tree_spawn_areas = layout.tree_areas
         self.num_enemies = num_enemies
         self.num_presents = num_presents
         self.num_trees = num_trees
         
+        # Per-interior random stream, so generation can be replayed from the seed
+        if saved_state and saved_state.seed is not None:
+            self.seed = saved_state.seed
+        else:
+            self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)
+        
         # Player spawn and door
-        self.player_spawn = (630, 550)
-        self.door = pygame.Rect(640, 695, 50, 30)
-        DOOR_INTERACT_SIZE = 100
-        self.door_interaction_rect = self.door.inflate(DOOR_INTERACT_SIZE, DOOR_INTERACT_SIZE)
+        self.player_spawn = layout.player_spawn
+        self.door = layout.door
+        self.door_interaction_rect = layout.door_interaction_rect
         self.door_ready_to_exit = False
+        self._door_bubble = None  # Door interaction bubble, drawn on first use
+        self._debug_zones = None  # Spawn zone overlay, drawn the first time debug mode shows it
         
         # Game state
         self.game_state = 'PLAYING'  # PLAYING, CAUGHT, GAME_OVER, OUTSIDE
@@ -73,6 +106,8 @@ class Interior_1(Scene):
         self.enemies = []
         self.trees = []
         self.presents = []
+        self.saved_patrols = []  # Patrols carried over from a saved state
+        self._static_background = None  # Layout background with the trees baked in
         
         # Add walls to scene
         for wall in self.walls:
@@ -84,8 +119,22 @@ class Interior_1(Scene):
             self._restore_from_state(saved_state)
         else:
             # Generate new interior
-            # Spawn trees first (they define where presents go)
-            self.trees = self.spawn_trees()
+            cached = get_cached_reachability(self.layout_name, self.seed)
+            if cached:
+                # Same layout and seed as before: reuse the validated trees
+                self.trees = [TREE_POOL.acquire(x, y) for (x, y) in cached['tree_positions']]
+                self.rng.setstate(cached['rng_state'])
+                reachability = cached['reachability']
+            else:
+                # Spawn trees first (they define where presents go), then make
+                # sure they don't cut the player off from the door
+                self.trees = self.spawn_trees()
+                reachability = self.validate_tree_layout()
+                cache_reachability(self.layout_name, self.seed, {
+                    'reachability': reachability,
+                    'tree_positions': [(t.full_x, t.full_y) for t in self.trees],
+                    'rng_state': self.rng.getstate()
+                })
             for tree in self.trees:
                 self.add_game_object(tree)
             
@@ -94,8 +143,20 @@ class Interior_1(Scene):
             
             # Spawn presents around trees (don't add to game_objects - we'll update them manually)
             self.presents = self.spawn_presents_around_trees()
+            self.validate_presents(reachability)
         
-        print(f"🏠 Interior_1 created: {len(self.enemies)} enemies, {len(self.trees)} trees, {len(self.presents)} presents")
+        # Navigation grid for patrols - walls and trees never move, so build it once
+        self.nav_grid = NavGrid(
+            list(layout.wall_rects) + [tree.rect for tree in self.trees],
+            Child.COLLISION_WIDTH, Child.COLLISION_HEIGHT
+        )
+        self.patrol_routes = {}  # (area_index, direction) -> PatrolRoute
+        self.assign_patrols()
+        
+        # Trees are final now - bake them into the background
+        self.bake_static_background()
+        
+        log.debug('scene', "🏠 Interior_1 created: %s enemies, %s trees, %s presents", len(self.enemies), len(self.trees), len(self.presents))
     
     def _restore_from_state(self, saved_state):
         """Restore interior from saved state
@@ -107,22 +168,82 @@ class Interior_1(Scene):
         
         # Restore trees at their exact positions
         for (tree_x, tree_y) in saved_state.tree_positions:
-            tree = Tree(tree_x, tree_y)
+            tree = TREE_POOL.acquire(tree_x, tree_y)
             self.trees.append(tree)
             self.add_game_object(tree)
         
         # Restore enemies at their saved positions
         for (enemy_x, enemy_y) in saved_state.enemy_positions:
-            enemy = Child(enemy_x, enemy_y)  # Use default speed (60)
+            enemy = CHILD_POOL.acquire(enemy_x, enemy_y, rng=self.rng)  # Use default speed (60)
             self.enemies.append(enemy)
+        self.saved_patrols = saved_state.patrols
         
         # Restore presents with their collected status
         for present_info in saved_state.present_data:
             if not present_info['collected']:  # Only restore uncollected presents
-                present = Present(present_info['x'], present_info['y'])
+                present = PRESENT_POOL.acquire(present_info['x'], present_info['y'],
+                                               image_index=present_info.get('image'))
                 self.presents.append(present)
         
-        print(f"📦 Restored from state: {len(self.trees)} trees, {len(self.enemies)} enemies, {len(self.presents)} presents")
+        log.debug('scene', "📦 Restored from state: %s trees, %s enemies, %s presents", len(self.trees), len(self.enemies), len(self.presents))
+    
+    def resume_from_state(self, saved_state):
+        """Reuse this scene for another visit instead of building a new one
+        
+        Trees and presents are still in place; enemies are moved (by value)
+        to where the off-screen simulation left them.
+        
+        Args:
+            saved_state: InteriorState saved when the player last left
+        """
+        self.game_state = 'PLAYING'
+        self.kickout_timer = 0
+        self.game_over_timer = 0
+        self.door_ready_to_exit = False
+        if self.player:
+            self.remove_game_object(self.player)
+            self.player = None
+        
+        for enemy, (enemy_x, enemy_y) in zip(self.enemies, saved_state.enemy_positions):
+            enemy.reset(enemy_x, enemy_y)
+        self.saved_patrols = saved_state.patrols
+        self.assign_patrols()
+        
+        for present in self.presents:
+            present.cancel_collection()
+        
+        log.debug('scene', "♻️ Resumed cached interior: %s trees, %s enemies, %s presents", len(self.trees), len(self.enemies), len(self.presents))
+    
+    def release_objects(self):
+        """Give trees, enemies and presents back to their pools
+        
+        The scene must not be used afterwards.
+        """
+        for tree in self.trees:
+            self.remove_game_object(tree)
+        TREE_POOL.release_all(self.trees)
+        CHILD_POOL.release_all(self.enemies)
+        PRESENT_POOL.release_all(self.presents)
+        self.trees = []
+        self.enemies = []
+        self.presents = []
+        self.invalidate_static_background()
+    
+    def bake_static_background(self):
+        """Draw the layout background (floor, walls, door) and every tree into one surface
+        
+        Trees never move once spawned, so each frame starts with one opaque
+        blit of this surface; render() only draws a tree again where it
+        covers an object sorted behind it.
+        """
+        background = self.layout.background.copy()
+        for tree in sorted(self.trees, key=lambda tree: tree.rect.bottom):
+            tree.render(background)
+        self._static_background = background
+    
+    def invalidate_static_background(self):
+        """Drop the baked background (call whenever trees are added, moved or removed)"""
+        self._static_background = None
     
     def set_player(self, player):
         """Set the player for this interior
@@ -137,47 +258,168 @@ class Interior_1(Scene):
             # Add player to game objects
             self.add_game_object(self.player)
     
-    def random_point_in_area(self, area, obj_width, obj_height, margin=0):
-        """Get a random point within a spawn area
+    def area_positions(self, grid, area, obj_width, obj_height, margin=0):
+        """Get the placement positions that keep an object inside a spawn area
         
         Args:
+            grid: OccupancyGrid the positions belong to
             area: (x, y, w, h) tuple defining the spawn area
             obj_width: Width of object to spawn
             obj_height: Height of object to spawn
             margin: Safety margin from edges
             
         Returns:
-            (px, py) tuple or None if area is too small
+            (rows, cols) bool mask of top-left positions (empty if area is too small)
         """
         x, y, w, h = area
-        min_x = x + margin
-        min_y = y + margin
-        max_x = x + w - obj_width - margin
-        max_y = y + h - obj_height - margin
+        return grid.region(x + margin, y + margin,
+                           x + w - obj_width - margin, y + h - obj_height - margin)
+    
+    def _static_occupancy(self, include_trees=True):
+        """Create an occupancy grid with the walls (and trees) already stamped"""
+        grid = OccupancyGrid()
+        grid.occupied |= self.layout.wall_occupancy
+        if include_trees:
+            for tree in self.trees:
+                grid.stamp(tree.rect)
+        return grid
+    
+    def _place_in_areas(self, grid, footprint, area_masks):
+        """Pick a free position in a random spawn area that still has room
         
-        if max_x < min_x or max_y < min_y:
+        Args:
+            grid: OccupancyGrid to place on
+            footprint: pygame.Rect collision footprint relative to the position
+            area_masks: List of position masks, one per spawn area
+            
+        Returns:
+            (x, y) position or None if every area is full
+        """
+        free = grid.free_positions(footprint)
+        candidates = [mask & free for mask in area_masks]
+        candidates = [mask for mask in candidates if mask.any()]
+        if not candidates:
             return None
-        
-        px = random.randint(min_x, max_x)
-        py = random.randint(min_y, max_y)
-        return (px, py)
-    
+        return grid.pick(self.rng.choice(candidates), self.rng)
+
     def spawn_enemies(self):
         """Spawn Child enemies in designated spawn areas
         
+        Enemies are kept clear of walls, trees and each other.
+        
         Returns:
             List of Child enemy objects
         """
         enemies = []
+        grid = self._static_occupancy()
+        footprint = pygame.Rect(Child.COLLISION_X_OFFSET, Child.COLLISION_Y_OFFSET,
+                                Child.COLLISION_WIDTH, Child.COLLISION_HEIGHT)
+        area_masks = [
+            self.area_positions(grid, area, Child.CHILD_WIDTH, Child.CHILD_HEIGHT, margin=8)
+            for area in self.enemy_spawn_areas
+        ]
+        
         for _ in range(self.num_enemies):
-            area = random.choice(self.enemy_spawn_areas)
-            pt = self.random_point_in_area(area, Child.CHILD_WIDTH, Child.CHILD_HEIGHT, margin=8)
-            if pt:
-                px, py = pt
-                enemies.append(Child(px, py))  # Use default speed (60)
+            pt = self._place_in_areas(grid, footprint, area_masks)
+            if pt is None:
+                log.warning('spawn', "⚠️ No space left to place enemy")
+                break
+            
+            enemy = CHILD_POOL.acquire(*pt, rng=self.rng)  # Use default speed (60)
+            enemies.append(enemy)
+            grid.stamp(enemy.rect.inflate(ENEMY_MIN_SEPARATION * 2, ENEMY_MIN_SEPARATION * 2))
         
-        print(f"👶 Spawned {len(enemies)} Child enemies")
+        log.debug('spawn', "👶 Spawned %s Child enemies", len(enemies))
         return enemies
+
+    def patrol_waypoints(self, area):
+        """Get the patrol waypoints for an enemy spawn area
+        
+        Args:
+            area: (x, y, w, h) tuple defining the spawn area
+            
+        Returns:
+            List of (x, y) corner points, clockwise from top-left
+        """
+        x, y, w, h = area
+        left = x + PATROL_WAYPOINT_INSET
+        top = y + PATROL_WAYPOINT_INSET
+        right = x + w - PATROL_WAYPOINT_INSET
+        bottom = y + h - PATROL_WAYPOINT_INSET
+        return [(left, top), (right, top), (right, bottom), (left, bottom)]
+    
+    def _nearest_area_index(self, point):
+        """Get the index of the enemy spawn area containing (or closest to) a point"""
+        px, py = point
+        best_index = 0
+        best_dist = None
+        for i, (x, y, w, h) in enumerate(self.enemy_spawn_areas):
+            dx = max(x - px, 0, px - (x + w))
+            dy = max(y - py, 0, py - (y + h))
+            dist = dx * dx + dy * dy
+            if best_dist is None or dist < best_dist:
+                best_index = i
+                best_dist = dist
+        return best_index
+    
+    def assign_patrols(self):
+        """Put every enemy on a waypoint loop around its spawn area
+        
+        Enemies in the same area walking the same way share one route, and
+        every route shares the grid's cached A* paths and flow fields.
+        """
+        if not self.enemy_spawn_areas:
+            return
+        
+        for i, enemy in enumerate(self.enemies):
+            # Restored enemies resume the route the off-screen simulation moved them along
+            saved = self.saved_patrols[i] if i < len(self.saved_patrols) else None
+            if saved:
+                route = saved['route']
+                if saved['route_key'] is not None:
+                    self.patrol_routes.setdefault(saved['route_key'], route)
+                enemy.set_patrol(self.nav_grid, route, saved['patrol_index'])
+                continue
+            
+            area_index = self._nearest_area_index(enemy.rect.center)
+            direction = self.rng.choice((1, -1))
+            key = (area_index, direction)
+            
+            if key not in self.patrol_routes:
+                waypoints = self.patrol_waypoints(self.enemy_spawn_areas[area_index])[::direction]
+                self.patrol_routes[key] = PatrolRoute(self.nav_grid, waypoints)
+            route = self.patrol_routes[key]
+            
+            if len(route) == 0:
+                continue
+            
+            # Start at the nearest waypoint so enemies don't all bunch up
+            cx, cy = enemy.rect.center
+            start_index = min(
+                range(len(route.waypoints)),
+                key=lambda i: (route.waypoints[i][0] - cx) ** 2 + (route.waypoints[i][1] - cy) ** 2
+            )
+            enemy.set_patrol(self.nav_grid, route, start_index)
+    
+    def _tree_placement(self, trees):
+        """Set up placement of more trees next to the given ones
+        
+        Args:
+            trees: Trees already placed (kept TREE_MIN_SEPARATION away)
+            
+        Returns:
+            (grid, footprint, area_masks) for _place_in_areas
+        """
+        grid = self._static_occupancy(include_trees=False)
+        for tree in trees:
+            grid.stamp(tree.rect.inflate(TREE_MIN_SEPARATION * 2, TREE_MIN_SEPARATION * 2))
+        footprint = pygame.Rect(Tree.COLLISION_X_OFFSET, Tree.COLLISION_Y_OFFSET,
+                                Tree.COLLISION_WIDTH, Tree.COLLISION_HEIGHT)
+        area_masks = [
+            self.area_positions(grid, area, TREE_WIDTH, TREE_HEIGHT, margin=8)
+            for area in self.tree_spawn_areas
+        ]
+        return grid, footprint, area_masks
     
     def spawn_trees(self):
         """Spawn trees in designated areas with minimum separation
@@ -186,52 +428,50 @@ class Interior_1(Scene):
             List of Tree objects
         """
         trees = []
-        solids_for_trees = list(self.walls)
-        attempts_per_tree = 200
+        grid, footprint, area_masks = self._tree_placement([])
         
         for _ in range(self.num_trees):
-            success = False
-            for _attempt in range(attempts_per_tree):
-                area = random.choice(self.tree_spawn_areas)
-                pt = self.random_point_in_area(area, TREE_WIDTH, TREE_HEIGHT, margin=8)
-                
-                if pt is None:
-                    continue
-                
-                px, py = pt
-                candidate = Tree(px, py)
-                
-                # Create inflated rect for minimum separation check
-                candidate_buffer_rect = candidate.rect.inflate(
-                    TREE_MIN_SEPARATION * 2,
-                    TREE_MIN_SEPARATION * 2
-                )
-                
-                # Check overlap with existing solids
-                overlap = False
-                for solid in solids_for_trees:
-                    if isinstance(solid, Tree):
-                        # Check trees with buffer
-                        if candidate_buffer_rect.colliderect(solid.rect):
-                            overlap = True
-                            break
-                    else:
-                        # Check walls normally
-                        if candidate.rect.colliderect(solid.rect):
-                            overlap = True
-                            break
-                
-                if not overlap:
-                    trees.append(candidate)
-                    solids_for_trees.append(candidate)
-                    success = True
-                    break
+            pt = self._place_in_areas(grid, footprint, area_masks)
+            if pt is None:
+                log.warning('spawn', "⚠️ No space left to place tree")
+                break
             
-            if not success:
-                print(f"⚠️ Could not place tree after {attempts_per_tree} attempts")
+            tree = TREE_POOL.acquire(*pt)
+            trees.append(tree)
+            # Later trees keep TREE_MIN_SEPARATION away from this one's base
+            grid.stamp(tree.rect.inflate(TREE_MIN_SEPARATION * 2, TREE_MIN_SEPARATION * 2))
         
-        print(f"🎄 Spawned {len(trees)} trees")
+        log.debug('spawn', "🎄 Spawned %s trees", len(trees))
         return trees
+
+    def _present_footprint(self):
+        """Get the present interaction bubble relative to the present position"""
+        bubble_offset = (PRESENT_SIZE - PRESENT_INTERACTION_SIZE) // 2
+        return pygame.Rect(bubble_offset, bubble_offset,
+                           PRESENT_INTERACTION_SIZE, PRESENT_INTERACTION_SIZE)
+    
+    def _present_area(self, grid, tree):
+        """Get the positions a present around a tree may use
+        
+        Args:
+            grid: OccupancyGrid the positions belong to
+            tree: Tree the present belongs to
+            
+        Returns:
+            (rows, cols) bool mask of top-left positions
+        """
+        # Must be fully on screen
+        allowed = grid.region(1, 1, SCREEN_WIDTH - PRESENT_SIZE - 1, SCREEN_HEIGHT - PRESENT_SIZE - 1)
+        
+        # Present centers within the spawn ring around the tree
+        tree_center = tree.get_full_sprite_center()
+        allowed &= grid.ring(
+            tree_center[0] - PRESENT_SIZE // 2, tree_center[1] - PRESENT_SIZE // 2,
+            TREE_MIN_RADIUS, TREE_MAX_RADIUS
+        )
+        # Prevent presents from being visually hidden by tree canopy
+        allowed &= grid.region(0, tree.rect.top - PRESENT_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT)
+        return allowed
     
     def spawn_presents_around_trees(self):
         """Spawn presents in a radius around each tree
@@ -241,76 +481,142 @@ class Interior_1(Scene):
         """
         presents = []
         if not self.trees:
-            print("⚠️ No trees to spawn presents around")
+            log.warning('spawn', "⚠️ No trees to spawn presents around")
             return presents
         
-        solids = list(self.walls) + list(self.trees)
+        # Presents (and their interaction bubbles) must not overlap walls,
+        # trees or other presents' bubbles
+        grid = self._static_occupancy()
+        footprint = self._present_footprint()
         
         for tree in self.trees:
             # Spawn 1-4 presents per tree
-            presents_for_this_tree = random.randint(1, 4)
-            attempts = 300
-            placed = 0
+            presents_for_this_tree = self.rng.randint(1, 4)
+            allowed = self._present_area(grid, tree)
             
-            tree_center = tree.get_full_sprite_center()
-            
-            while placed < presents_for_this_tree and attempts > 0:
-                attempts -= 1
-                
-                # Random angle and radius
-                angle = random.random() * math.pi * 2
-                radius = random.randint(TREE_MIN_RADIUS, TREE_MAX_RADIUS)
-                
-                cx = tree_center[0] + int(radius * math.cos(angle))
-                cy = tree_center[1] + int(radius * math.sin(angle))
-                
-                px = cx - PRESENT_SIZE // 2
-                py = cy - PRESENT_SIZE // 2
-                
-                body = pygame.Rect(px, py, PRESENT_SIZE, PRESENT_SIZE)
-                
-                # Interaction bubble check
-                interaction = pygame.Rect(0, 0, 90, 90)
-                interaction.center = body.center
-                
-                # Must be fully on screen
-                if not (0 < body.left and body.right < SCREEN_WIDTH and
-                        0 < body.top and body.bottom < SCREEN_HEIGHT):
-                    continue
-                
-                # Must not overlap walls, trees, or existing presents
-                blocked = False
-                for solid in solids:
-                    if body.colliderect(solid.rect) or interaction.colliderect(solid.rect):
-                        blocked = True
-                        break
-                
-                if blocked:
-                    continue
-                
-                for p in presents:
-                    if body.colliderect(p.rect) or interaction.colliderect(p.interaction_rect):
-                        blocked = True
-                        break
-                
-                if blocked:
-                    continue
-                
-                # Prevent presents from being visually hidden by tree canopy
-                if body.bottom < tree.rect.top:
-                    blocked = True
-                
-                if blocked:
-                    continue
+            for _ in range(presents_for_this_tree):
+                pt = grid.pick(allowed & grid.free_positions(footprint), self.rng)
+                if pt is None:
+                    break
                 
-                # Valid placement
-                new_present = Present(px, py)
+                new_present = PRESENT_POOL.acquire(*pt, rng=self.rng)
                 presents.append(new_present)
-                solids.append(new_present)
-                placed += 1
+                grid.stamp(new_present.interaction_rect)
         
-        print(f"🎁 Spawned {len(presents)} presents around trees")
+        log.debug('spawn', "🎁 Spawned %s presents around trees", len(presents))
         return presents
+
+    def _build_reachability(self, trees):
+        """Flood fill where the player's feet can get to from the spawn point
+        
+        Args:
+            trees: Trees to treat as obstacles (besides the walls)
+            
+        Returns:
+            ReachabilityMap
+        """
+        return ReachabilityMap(
+            list(self.layout.wall_rects) + [tree.rect for tree in trees],
+            Player.COLLISION_WIDTH, Player.COLLISION_HEIGHT,
+            (self.player_spawn[0] + Player.COLLISION_X_OFFSET,
+             self.player_spawn[1] + Player.COLLISION_Y_OFFSET)
+        )
+    
+    def _door_reachable(self, reachability):
+        """Check if the player can walk from the spawn point into the door bubble"""
+        return (not reachability.start_blocked
+                and reachability.can_touch(self.door_interaction_rect, PLAYER_FEET_REACH))
+    
+    def validate_tree_layout(self):
+        """Make sure the trees don't cut the player off from the door
+        
+        A tree that blocks the way on its own is moved to another spot in the
+        spawn areas (or dropped if none works). If trees only block the way
+        together, the last ones are dropped until the door can be reached.
+        
+        Returns:
+            ReachabilityMap for the walls and the final trees
+        """
+        reachability = self._build_reachability(self.trees)
+        if self._door_reachable(reachability):
+            return reachability
+        
+        for i, tree in enumerate(self.trees):
+            others = self.trees[:i] + self.trees[i + 1:]
+            if not self._door_reachable(self._build_reachability(others)):
+                continue
+            
+            # This tree is the culprit - try to move it somewhere harmless
+            grid, footprint, area_masks = self._tree_placement(others)
+            for _ in range(TREE_RELOCATION_ATTEMPTS):
+                pt = self._place_in_areas(grid, footprint, area_masks)
+                if pt is None:
+                    break
+                
+                candidate = TREE_POOL.acquire(*pt)
+                candidate_reachability = self._build_reachability(others + [candidate])
+                if self._door_reachable(candidate_reachability):
+                    log.debug('spawn', "🎄 Moved tree blocking the door to %s", pt)
+                    self.trees[i] = candidate
+                    TREE_POOL.release(tree)
+                    return candidate_reachability
+                grid.stamp(candidate.rect)  # Don't try this spot again
+                TREE_POOL.release(candidate)
+            
+            log.warning('spawn', "⚠️ Dropped tree blocking the door")
+            self.trees = others
+            TREE_POOL.release(tree)
+            return self._build_reachability(others)
+        
+        # No single tree is to blame - drop trees until the door opens up
+        while self.trees:
+            TREE_POOL.release(self.trees.pop())
+            reachability = self._build_reachability(self.trees)
+            if self._door_reachable(reachability):
+                break
+        log.warning('spawn', "⚠️ Trees blocked the door together, kept %s", len(self.trees))
+        return reachability
+    
+    def validate_presents(self, reachability):
+        """Move or drop presents the player can never get into range of
+        
+        Args:
+            reachability: ReachabilityMap for the walls and trees
+        """
+        unreachable = [p for p in self.presents
+                       if not reachability.can_touch(p.interaction_rect, PLAYER_BODY_REACH)]
+        if not unreachable:
+            return
+        self.presents = [p for p in self.presents if p not in unreachable]
+        # Released presents may be reset by the acquires below, so keep where they were
+        unreachable_centers = [p.rect.center for p in unreachable]
+        PRESENT_POOL.release_all(unreachable)
+        
+        grid = self._static_occupancy()
+        for present in self.presents:
+            grid.stamp(present.interaction_rect)
+        footprint = self._present_footprint()
+        free = grid.free_positions(footprint)
+        
+        moved = 0
+        for px, py in unreachable_centers:
+            # Retry around the tree the present belonged to
+            tree = min(self.trees, key=lambda t: (t.get_full_sprite_center()[0] - px) ** 2
+                                                 + (t.get_full_sprite_center()[1] - py) ** 2)
+            candidates = np.flatnonzero(self._present_area(grid, tree) & free).tolist()
+            self.rng.shuffle(candidates)
+            
+            for index in candidates:
+                row, col = divmod(index, grid.cols)
+                x, y = col * grid.cell_size, row * grid.cell_size
+                if reachability.can_touch(footprint.move(x, y), PLAYER_BODY_REACH):
+                    new_present = PRESENT_POOL.acquire(x, y, rng=self.rng)
+                    self.presents.append(new_present)
+                    grid.stamp(new_present.interaction_rect)
+                    moved += 1
+                    break
+        
+        log.debug('spawn', "🎁 %s unreachable presents: %s moved, %s dropped", len(unreachable), moved, len(unreachable) - moved)
     
     def handle_event(self, event):
         """Handle scene-specific events
@@ -370,15 +676,15 @@ class Interior_1(Scene):
             screen: Pygame screen surface
         """
         # Draw interaction bubble
-        door_interact_color = (255, 200, 100, 30)
-        door_interact_surface = pygame.Surface(self.door_interaction_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(door_interact_surface, door_interact_color, 
-                        door_interact_surface.get_rect(), border_radius=5)
-        screen.blit(door_interact_surface, self.door_interaction_rect.topleft)
+        if self._door_bubble is None:
+            door_interact_color = (255, 200, 100, 30)
+            self._door_bubble = track_surface(pygame.Surface(self.door_interaction_rect.size, pygame.SRCALPHA), self)
+            pygame.draw.rect(self._door_bubble, door_interact_color, 
+                            self._door_bubble.get_rect(), border_radius=5)
+        screen.blit(self._door_bubble, self.door_interaction_rect.topleft)
         
         # Draw prompt text
-        font = pygame.font.Font(None, 36)
-        interact_text = font.render("PRESS E TO LEAVE", True, (255, 255, 255))
+        interact_text = render_text("PRESS E TO LEAVE", 36, (255, 255, 255))
         text_rect = interact_text.get_rect(center=(self.door.centerx, self.door.top - 20))
         screen.blit(interact_text, text_rect)
     
@@ -390,9 +696,6 @@ class Interior_1(Scene):
             e_pressed: True if 'E' key was pressed this frame
         """
         if self.game_state == 'PLAYING':
-            # Play interior music
-            play_music("assets/sounds/inside_music.mp3")
-            
             # Check door proximity
             self.door_ready_to_exit = self.check_door_proximity(self.player)
             # Handle player input
@@ -414,11 +717,11 @@ class Interior_1(Scene):
                     if present.is_collected and self.level:
                         self.level.collect_present()
                         # Play collection sound
-                        if hasattr(self.level, 'collect_sound') and self.level.collect_sound:
-                            self.level.collect_sound.play()
-                        print(f"✅ Present collected!")
+                        play_sfx('present_collected')
+                        log.debug('scene', "✅ Present collected!")
             
-            # Remove collected presents
+            # Remove collected presents (back to the pool)
+            PRESENT_POOL.release_all(p for p in self.presents if p.is_collected)
             self.presents = [p for p in self.presents if not p.is_collected]
             
             # Build solids list for collision
@@ -472,17 +775,19 @@ class Interior_1(Scene):
                             if self.player.got_caught():
                                 # Check if player is out of lives
                                 if self.player.lives <= 0:
-                                    print("💀 GAME OVER! Out of lives!")
+                                    log.info('scene', "💀 GAME OVER! Out of lives!")
                                     self.game_state = 'GAME_OVER'
                                     self.game_over_timer = self.game_over_duration
+                                    set_music_state('game_over')
                                 else:
-                                    print("🚨 PLAYER CAUGHT!")
+                                    log.info('scene', "🚨 PLAYER CAUGHT!")
                                     self.game_state = 'CAUGHT'
                                     self.kickout_timer = self.kickout_duration
+                                    set_music_state('caught')
                 
                 # Check door interaction - require E key press when near door
                 if self.door_ready_to_exit and e_pressed:
-                    print("🚪 Player exiting interior through door")
+                    log.info('scene', "🚪 Player exiting interior through door")
                     self.game_state = 'OUTSIDE'
                     if self.level:
                         self.level.exit_interior()
@@ -493,25 +798,19 @@ class Interior_1(Scene):
                 enemy.update(dt, all_obstacles)
         
         elif self.game_state == 'CAUGHT':
-            # Play caught music
-            play_music("assets/sounds/player_caught.mp3")
-            
             # Countdown kickout timer
             self.kickout_timer -= 1
             if self.kickout_timer <= 0:
-                print("⏱️ Kickout complete - returning to outdoor scene")
+                log.info('scene', "⏱️ Kickout complete - returning to outdoor scene")
                 if self.level:
                     self.level.exit_interior()
                 self.game_state = 'OUTSIDE'
         
         elif self.game_state == 'GAME_OVER':
-            # Play game over music
-            play_music("assets/sounds/game-over.mp3")
-            
             # Countdown game over timer
             self.game_over_timer -= 1
             if self.game_over_timer <= 0:
-                print("🔄 Restarting game...")
+                log.info('scene', "🔄 Restarting game...")
                 if self.level:
                     # Restart the game by resetting the level
                     self.level.restart_game()
@@ -525,8 +824,11 @@ class Interior_1(Scene):
         Args:
             screen: Pygame screen surface
         """
-        # Create translucent surface
-        debug_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        # The spawn areas never change, so the translucent overlay is drawn once
+        if self._debug_zones is not None:
+            screen.blit(self._debug_zones, (0, 0))
+            return
+        debug_surface = self._debug_zones = track_surface(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA), self)
         
         # Draw enemy spawn areas in yellow
         for area in self.enemy_spawn_areas:
@@ -554,6 +856,11 @@ class Interior_1(Scene):
         for enemy in self.enemies:
             pygame.draw.rect(screen, (255, 0, 0), enemy.rect, 2)
         
+        # Draw patrol routes in orange
+        for route in self.patrol_routes.values():
+            if len(route.points) >= 2:
+                pygame.draw.lines(screen, (255, 150, 0), False, route.points, 1)
+        
         # Draw player hitboxes (now done in player.render())
         
         # Draw door rect in blue
@@ -566,30 +873,50 @@ class Interior_1(Scene):
             pygame.draw.circle(screen, (255, 255, 100), center, TREE_MIN_RADIUS, 1)
             pygame.draw.circle(screen, (255, 255, 100), center, TREE_MAX_RADIUS, 1)
     
+    def _tree_redraw_areas(self, render_objects):
+        """Find where baked trees have to be drawn again this frame
+        
+        A tree must be drawn again wherever it overlaps an object sorted
+        before it (which is drawn over the baked copy). Everywhere else the
+        baked tree is already correct.
+        
+        Args:
+            render_objects: Objects in draw order
+        
+        Returns:
+            List of non-overlapping view-space rects
+        """
+        areas = []
+        behind = []  # View bounds of the objects drawn so far
+        for obj in render_objects:
+            if isinstance(obj, Tree):
+                tree_rect = obj.view_bounds()
+                areas.extend(tree_rect.clip(bounds) for bounds in behind if tree_rect.colliderect(bounds))
+            else:
+                # A pixel of slack for rounding to view coordinates
+                behind.append(obj.view_bounds().inflate(2, 2))
+        
+        # Merge overlapping areas so no pixel is blended twice
+        merged = []
+        for area in areas:
+            index = area.collidelist(merged)
+            while index != -1:
+                area.union_ip(merged.pop(index))
+                index = area.collidelist(merged)
+            merged.append(area)
+        return merged
+    
     def render(self, screen):
         """Render interior with Z-ordering
         
         Args:
-            screen: Pygame screen surface
+            screen: Pygame screen surface (world render target)
         """
-        # Fill background
-        screen.fill(self.background_color)
-        
         if self.game_state == 'PLAYING':
-            # Debug: Draw spawn zones BEFORE game objects (so they're behind)
-            if self.level and hasattr(self.level, 'debug_mode') and self.level.debug_mode:
-                self._render_debug_spawn_zones(screen)
-            
-            # Render walls
-            for wall in self.walls:
-                wall.render(screen)
-            
-            # Render door
-            pygame.draw.rect(screen, (0, 0, 255), self.door)
-            
-            # Render door interaction UI if player is near
-            if self.door_ready_to_exit:
-                self.render_door_ui(screen)
+            # Floor, walls, door and trees come pre-drawn in the static background
+            if self._static_background is None:
+                self.bake_static_background()
+            screen.blit(self._static_background, (0, 0))
             
             # Z-ordering: Sort all objects by rect.bottom
             render_objects = []
@@ -601,6 +928,12 @@ class Interior_1(Scene):
             
             render_objects.sort(key=lambda obj: obj.rect.bottom)
             
+            # Where a baked tree must cover an object behind it, start from the
+            # bare background again and draw the tree over the object in order
+            redraw_areas = self._tree_redraw_areas(render_objects)
+            for area in redraw_areas:
+                screen.blit(self.layout.background, area, area)
+            
             # Render sorted objects
             walls_for_los = self.walls + self.trees
             debug_mode = self.level and hasattr(self.level, 'debug_mode') and self.level.debug_mode
@@ -610,36 +943,55 @@ class Interior_1(Scene):
                 elif isinstance(obj, Present):
                     obj.render(screen, self.player if self.player else obj)
                 elif isinstance(obj, Tree):
-                    obj.render(screen)
+                    tree_rect = obj.view_bounds()
+                    for area in redraw_areas:
+                        clip = tree_rect.clip(area)
+                        if clip:
+                            obj.render(screen, clip)
                 else:
                     # Pass debug for player and other objects
                     try:
                         obj.render(screen, debug=debug_mode)
                     except TypeError:
                         obj.render(screen)
+        
+        else:
+            # CAUGHT / GAME_OVER: black screen, message drawn by render_overlay
+            screen.fill((0, 0, 0))
+    
+    def render_overlay(self, screen):
+        """Render prompts, messages and debug drawing at full resolution
+        
+        Args:
+            screen: Pygame screen surface (display, world coordinates)
+        """
+        if self.game_state == 'PLAYING':
+            debug_mode = self.level and hasattr(self.level, 'debug_mode') and self.level.debug_mode
             
-            # Debug: Draw hitboxes and spawn ranges AFTER game objects (so they're on top)
-            if self.level and hasattr(self.level, 'debug_mode') and self.level.debug_mode:
+            # Debug: Draw spawn zones
+            if debug_mode:
+                self._render_debug_spawn_zones(screen)
+            
+            # Render door interaction UI if player is near
+            if self.door_ready_to_exit:
+                self.render_door_ui(screen)
+            
+            # Present prompts and collection meters
+            for present in self.presents:
+                present.render_ui(screen, self.player if self.player else present)
+            
+            # Debug: Draw hitboxes and spawn ranges
+            if debug_mode:
                 self._render_debug_hitboxes(screen)
         
         elif self.game_state == 'CAUGHT':
-            # Draw black screen with message
-            pygame.draw.rect(screen, (0, 0, 0), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
-            
-            font = pygame.font.Font(None, 72)
-            msg = font.render("CAUGHT! KICKED OUT.", True, (255, 0, 0))
+            msg = render_text("CAUGHT! KICKED OUT.", 72, (255, 0, 0))
             screen.blit(msg, (SCREEN_WIDTH // 2 - msg.get_width() // 2, 
                             SCREEN_HEIGHT // 2 - msg.get_height() // 2))
         
         elif self.game_state == 'GAME_OVER':
-            # Draw black screen with game over message
-            pygame.draw.rect(screen, (0, 0, 0), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
-            
-            font_large = pygame.font.Font(None, 72)
-            font_small = pygame.font.Font(None, 48)
-            
-            msg1 = font_large.render("GAME OVER", True, (255, 0, 0))
-            msg2 = font_small.render("You ran out of lives", True, (255, 255, 255))
+            msg1 = render_text("GAME OVER", 72, (255, 0, 0))
+            msg2 = render_text("You ran out of lives", 48, (255, 255, 255))
             
             screen.blit(msg1, (SCREEN_WIDTH // 2 - msg1.get_width() // 2, 
                               SCREEN_HEIGHT // 2 - 60))
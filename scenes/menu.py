@@ -1,7 +1,8 @@
 """Main menu scene with start button"""
 
 import pygame
-from game import Scene
+from game import Scene, log, track_surface
+from utils.assets import assets
 
 
 class Menu(Scene):
@@ -16,15 +17,12 @@ class Menu(Scene):
         
         # Load background image
         try:
-            self.background_image = pygame.image.load('assets/Title_Screen.png').convert()
-            self.background_image = pygame.transform.scale(
-                self.background_image, 
-                (self.screen_width, self.screen_height)
-            )
-            print("✅ Title screen loaded successfully")
+            self.background_image = assets.image('assets/Title_Screen.png', self,
+                                                 size=(self.screen_width, self.screen_height),
+                                                 alpha=False)
         except pygame.error as e:
-            print(f"⚠️ Error loading assets/Title_Screen.png: {e}. Using fallback.")
-            self.background_image = pygame.Surface((self.screen_width, self.screen_height))
+            log.warning('ui', "⚠️ Error loading assets/Title_Screen.png: %s. Using fallback.", e)
+            self.background_image = track_surface(pygame.Surface((self.screen_width, self.screen_height)), self)
             self.background_image.fill((255, 255, 255))
         
         # Define the clickable START button area
@@ -36,6 +34,7 @@ class Menu(Scene):
         
         # State
         self.start_clicked = False
+        self.needs_redraw = True  # Whole screen must be drawn (first frame, back from the game)
     
     def handle_event(self, event):
         """Handle mouse clicks on the start button
@@ -46,7 +45,7 @@ class Menu(Scene):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Check if click is within start button
             if self.start_button_rect.collidepoint(event.pos):
-                print("🎮 Start button clicked!")
+                log.info('ui', "🎮 Start button clicked!")
                 self.start_clicked = True
     
     def update(self, dt):
@@ -61,16 +60,38 @@ class Menu(Scene):
     def render(self, screen):
         """Render the menu
         
+        The menu is static: it is drawn in full once, afterwards only areas
+        of UI elements that changed are drawn again.
+        
         Args:
             screen: pygame screen surface
+        
+        Returns:
+            List of changed screen rects, or None if the whole screen changed
         """
-        # Draw background image
-        screen.blit(self.background_image, (0, 0))
+        rects = None if self.needs_redraw else self.ui_dirty_rects()
+        if rects is None:
+            # Draw background image
+            screen.blit(self.background_image, (0, 0))
+            self.render_overlay(screen)
+            self.ui_dirty_rects()  # Everything was just drawn
+            self.needs_redraw = False
+            
+            # DEBUG: Uncomment to see the clickable button area
+            # pygame.draw.rect(screen, (255, 0, 0), self.start_button_rect, 2)
+            return None
         
-        # DEBUG: Uncomment to see the clickable button area
-        # pygame.draw.rect(screen, (255, 0, 0), self.start_button_rect, 2)
+        # Redraw the background and UI inside each changed area only
+        for rect in rects:
+            screen.set_clip(rect)
+            screen.blit(self.background_image, (0, 0))
+            self.render_overlay(screen)
+        screen.set_clip(None)
+        self.ui_dirty_rects()  # Clipped redraws don't change anything else
+        return rects
     
     def reset(self):
         """Reset menu state for returning to menu"""
         self.start_clicked = False
+        self.needs_redraw = True
 
@@ -1,7 +1,9 @@
 """Lives tracker UI element - displays player's remaining lives as present icons"""
 
 import pygame
-from game import UIElement
+from game import UIElement, log, track_surface
+from utils.assets import assets
+from utils.text import get_font
 
 
 class LivesTracker(UIElement):
@@ -24,7 +26,7 @@ class LivesTracker(UIElement):
         self.spacing = spacing
         
         # Font for "Lives:" label
-        self.font = pygame.font.Font(None, 36)  # Medium font size to match smaller icons
+        self.font = get_font(36)  # Medium font size to match smaller icons
         self.label_text = "Lives:"
         self.label_color = (0, 0, 0)  # Black
         
@@ -36,6 +38,10 @@ class LivesTracker(UIElement):
         # Load and scale the present icon
         self.life_icon = self._load_icon()
         
+        # Darkened version for lost lives (semi-transparent), made once
+        self.lost_life_icon = self.life_icon.copy()
+        self.lost_life_icon.set_alpha(80)
+        
         # Total width for positioning (label + icons)
         self.width = self.label_width + self.label_offset + (self.icon_size * self.max_lives) + (self.spacing * (self.max_lives - 1))
         self.height = max(self.icon_size, self.label_surface.get_height())
@@ -47,14 +53,16 @@ class LivesTracker(UIElement):
             pygame.Surface: Scaled lives icon
         """
         try:
-            icon = pygame.image.load('assets/images/christmas/presents/lives.png').convert_alpha()
-            # Scale to desired size
-            icon = pygame.transform.scale(icon, (self.icon_size, self.icon_size))
-            return icon
-        except pygame.error as e:
-            print(f"⚠️ Error loading life icon: {e}")
+            # HUD atlas icon when it has this size, else scaled once and shared
+            icon = assets.atlas('hud', self).frames('life')[0]
+            if icon.get_size() == (self.icon_size, self.icon_size):
+                return icon
+            return assets.image('assets/images/christmas/presents/lives.png', self,
+                                size=(self.icon_size, self.icon_size))
+        except (pygame.error, KeyError) as e:
+            log.warning('ui', "⚠️ Error loading life icon: %s", e)
             # Fallback: red square
-            fallback = pygame.Surface((self.icon_size, self.icon_size))
+            fallback = track_surface(pygame.Surface((self.icon_size, self.icon_size)), self)
             fallback.fill((255, 0, 0))
             return fallback
     
@@ -64,7 +72,10 @@ class LivesTracker(UIElement):
         Args:
             lives: Current number of lives (0 to max_lives)
         """
-        self.current_lives = max(0, min(lives, self.max_lives))
+        lives = max(0, min(lives, self.max_lives))
+        if lives != self.current_lives:
+            self.current_lives = lives
+            self.mark_dirty()
     
     def update(self, dt):
         """Update the lives tracker
@@ -75,35 +86,21 @@ class LivesTracker(UIElement):
         # Lives tracker is static, no updates needed
         pass
     
-    def render(self, screen):
-        """Render the lives tracker
+    def compose(self):
+        """Draw the label and life icons into one surface
         
-        Args:
-            screen: pygame screen surface
+        Returns:
+            pygame.Surface (rebuilt only when the lives change)
         """
-        if not self.visible:
-            return
-        
-        # Render "Lives:" label
-        # Center the label vertically with the icons
-        label_y = self.y + (self.icon_size // 2) - (self.label_surface.get_height() // 2)
-        screen.blit(self.label_surface, (self.x, label_y))
+        # "Lives:" label centered vertically with the icons
+        label_y = (self.icon_size // 2) - (self.label_surface.get_height() // 2)
+        parts = [(self.label_surface, (0, label_y))]
         
-        # Calculate starting x position for icons (after label)
-        icons_start_x = self.x + self.label_width + self.label_offset
-        
-        # Render each life icon
+        # Icons start after the label; lost lives are grayed out
+        icons_start_x = self.label_width + self.label_offset
         for i in range(self.max_lives):
             icon_x = icons_start_x + (i * (self.icon_size + self.spacing))
-            icon_y = self.y
-            
-            if i < self.current_lives:
-                # Render filled icon (has life)
-                screen.blit(self.life_icon, (icon_x, icon_y))
-            else:
-                # Render empty/grayed out icon (lost life)
-                # Create a darkened version
-                dark_icon = self.life_icon.copy()
-                dark_icon.set_alpha(80)  # Make it semi-transparent
-                screen.blit(dark_icon, (icon_x, icon_y))
-
+            icon = self.life_icon if i < self.current_lives else self.lost_life_icon
+            parts.append((icon, (icon_x, 0)))
+        
+        return self.compose_parts(parts)
@@ -1,8 +1,9 @@
 """Present Counter UI Element - displays present collection progress"""
 
 import pygame
-import os
-from game import UIElement
+from game import UIElement, log, track_surface
+from utils.assets import assets
+from utils.text import render_text
 
 
 class PresentCounter(UIElement):
@@ -24,7 +25,6 @@ class PresentCounter(UIElement):
         
         # UI styling
         self.icon_size = 82  # Large icon size
-        self.font = pygame.font.Font(None, 48)
         self.text_color = (0, 0, 0)  # Black
         
         # Container/background settings
@@ -43,34 +43,24 @@ class PresentCounter(UIElement):
     def _load_background(self):
         """Load the candy cane pattern background"""
         try:
-            # Get the path to the pre-cropped candy cane pattern
-            assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'images')
-            bg_path = os.path.join(assets_dir, 'candy_cane_pattern_ui.png')
-            
-            # Load the background (already sized to 100x100, no scaling needed)
-            self.background = pygame.image.load(bg_path).convert_alpha()
-            print("✅ Candy cane pattern background loaded successfully (100x100)")
+            # Pre-cropped pattern, already sized to 100x100 (no scaling needed)
+            self.background = assets.atlas('hud', self).frames('counter_background')[0]
         except Exception as e:
-            print(f"⚠️ Failed to load candy cane pattern: {e}")
+            log.warning('ui', "⚠️ Failed to load candy cane pattern: %s", e)
             # Create a fallback background (light colored rectangle)
-            self.background = pygame.Surface((self.container_width, self.container_height))
+            self.background = track_surface(pygame.Surface((self.container_width, self.container_height)), self)
             self.background.fill((200, 200, 200))  # Light gray fallback
     
     def _load_icon(self):
         """Load the present icon image"""
         try:
-            # Get the path to the present icon
-            assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'images', 'christmas', 'presents')
-            icon_path = os.path.join(assets_dir, 'topdownTile_50.png')
-            
-            # Load and scale the icon
-            self.icon = pygame.image.load(icon_path).convert_alpha()
-            self.icon = pygame.transform.scale(self.icon, (self.icon_size, self.icon_size))
-            print("✅ Present counter icon loaded successfully")
+            self.icon = assets.atlas('hud', self).frames('counter_icon')[0]
+            if self.icon.get_size() != (self.icon_size, self.icon_size):
+                self.icon = pygame.transform.scale(self.icon, (self.icon_size, self.icon_size))
         except Exception as e:
-            print(f"⚠️ Failed to load present counter icon: {e}")
+            log.warning('ui', "⚠️ Failed to load present counter icon: %s", e)
             # Create a fallback icon (simple colored rectangle)
-            self.icon = pygame.Surface((self.icon_size, self.icon_size))
+            self.icon = track_surface(pygame.Surface((self.icon_size, self.icon_size)), self)
             self.icon.fill((100, 150, 255))  # Blue present color
     
     def update_count(self, presents_collected, present_goal=None):
@@ -80,9 +70,12 @@ class PresentCounter(UIElement):
             presents_collected: New number of presents collected
             present_goal: Optional new goal value
         """
-        self.presents_collected = presents_collected
-        if present_goal is not None:
+        if present_goal is None:
+            present_goal = self.present_goal
+        if (presents_collected, present_goal) != (self.presents_collected, self.present_goal):
+            self.presents_collected = presents_collected
             self.present_goal = present_goal
+            self.mark_dirty()
     
     def update(self, dt):
         """Update logic (present counter is mostly static)"""
@@ -90,30 +83,19 @@ class PresentCounter(UIElement):
             return
         # No animation or update logic needed for static counter
     
-    def render(self, screen):
-        """Render the present icon and count text
+    def compose(self):
+        """Draw the background, present icon and count text into one surface
         
-        Args:
-            screen: pygame.Surface to render to
+        Returns:
+            pygame.Surface (rebuilt only when the count changes)
         """
-        if not self.visible:
-            return
-        
-        # Draw the candy cane pattern background first
-        screen.blit(self.background, (self.x, self.y))
-        
-        # Draw the present icon centered horizontally in the container
-        icon_x = self.x + self.icon_offset_x
-        icon_y = self.y + self.icon_offset_y
-        screen.blit(self.icon, (icon_x, icon_y))
-        
-        # Draw the count text centered horizontally below the icon
+        # Count text centered horizontally below the icon
         count_text = f"{self.presents_collected} / {self.present_goal}"
-        text_surface = self.font.render(count_text, True, self.text_color)
+        text_surface = render_text(count_text, 48, self.text_color)
+        text_x = (self.container_width - text_surface.get_width()) // 2
         
-        # Center text horizontally within the container
-        text_width = text_surface.get_width()
-        text_x = self.x + (self.container_width - text_width) // 2
-        text_y = self.y + self.text_offset_y
-        screen.blit(text_surface, (text_x, text_y))
-
+        return self.compose_parts([
+            (self.background, (0, 0)),  # Candy cane pattern first
+            (self.icon, (self.icon_offset_x, self.icon_offset_y)),
+            (text_surface, (text_x, self.text_offset_y))
+        ])
@@ -1,7 +1,24 @@
 """Utility functions package"""
 
 # Import utility functions here
-from utils.audio import play_music, stop_music, set_music_volume
-
-__all__ = ['play_music', 'stop_music', 'set_music_volume']
+from utils.audio import AudioManager, audio, set_music_state, stop_music, set_music_volume
+from utils.sfx import SoundBank, sfx, play_sfx
+from utils.navigation import NavGrid, PatrolRoute
+from utils.placement import OccupancyGrid
+from utils.reachability import ReachabilityMap, get_cached_reachability, cache_reachability
+from utils.layouts import CompiledLayout, list_layouts, load_layout, load_bsp_layout
+from utils.bsp_layout import generate_bsp_layout, bsp_layout_name
+from utils.pool import ObjectPool
+from utils.atlas import SpriteAtlas
+from utils.tiles import TiledLayer
+from utils.surface_format import normalize_surface
+from utils.assets import AssetManager, assets
+from utils.text import get_font, render_text, TextCache, text_cache
 
+__all__ = ['AudioManager', 'audio', 'set_music_state', 'stop_music', 'set_music_volume',
+           'SoundBank', 'sfx', 'play_sfx', 'NavGrid', 'PatrolRoute', 'OccupancyGrid',
+           'ReachabilityMap', 'get_cached_reachability', 'cache_reachability',
+           'CompiledLayout', 'list_layouts', 'load_layout', 'load_bsp_layout',
+           'generate_bsp_layout', 'bsp_layout_name', 'ObjectPool', 'SpriteAtlas', 'TiledLayer', 'normalize_surface',
+           'AssetManager', 'assets',
+           'get_font', 'render_text', 'TextCache', 'text_cache']
@@ -0,0 +1,485 @@
+"""Shared asset manager - loads, converts, packs and scales each asset once"""
+
+import os
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+try:
+    from PIL import Image
+except ImportError:  # Preloading falls back to decoding on the main thread
+    Image = None
+
+from game.log import log
+from game.memory import track_surface
+from game.frame_monitor import hitch_detector
+from utils.atlas import ATLAS_DIR, SpriteAtlas, load_atlas_definition, atlas_source_paths
+from utils.tiles import TiledLayer
+from game.blit_audit import format_kind
+from utils.surface_format import normalize_surface
+
+
+# Project root, so 'assets/...' paths work from any working directory
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MAX_UNUSED_ASSET_BYTES = 32 * 1024 * 1024  # Unreferenced assets kept around for reuse
+PRELOAD_WORKERS = min(8, os.cpu_count() or 4)
+
+
+def _decode_file(path):
+    """Read and decode an image to raw RGBA bytes (runs on a worker thread)
+
+    Pillow releases the GIL while decompressing, so several of these run in
+    parallel.
+
+    Returns:
+        (bytes, (width, height), decode time in ms)
+    """
+    start = time.perf_counter()
+    with Image.open(path) as image:
+        image = image.convert('RGBA')
+        data = image.tobytes()
+        size = image.size
+    return data, size, (time.perf_counter() - start) * 1000
+
+
+def _surfaces(value, found):
+    """Collect the distinct surfaces in an asset value (by id)"""
+    if isinstance(value, pygame.Surface):
+        found[id(value)] = value
+    elif isinstance(value, SpriteAtlas):
+        found[id(value.surface)] = value.surface
+    elif isinstance(value, TiledLayer):
+        for tile, _ in value.blit_sequence:
+            found[id(tile)] = tile
+    elif isinstance(value, dict):
+        _surfaces(tuple(value.values()), found)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _surfaces(item, found)
+    return found
+
+
+def _normalize(value, done):
+    """Normalize every surface in a surface, dict or sequence (shared surfaces once)"""
+    if isinstance(value, pygame.Surface):
+        if id(value) not in done:
+            done[id(value)] = normalize_surface(value)
+        return done[id(value)]
+    if isinstance(value, dict):
+        return {key: _normalize(item, done) for key, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        return type(value)(_normalize(item, done) for item in value)
+    return value
+
+
+def _surface_bytes(value):
+    """Get the pixel memory of an asset (surfaces, atlases, tiled layers and
+    dicts or sequences of them; shared surfaces are counted once)"""
+    return sum(
+        surface.get_bytesize() * surface.get_width() * surface.get_height()
+        for surface in _surfaces(value, {}).values()
+    )
+
+
+def _scaled_edge(index, source_length, scaled_length):
+    """Get the first scaled pixel taken from source pixel index or later
+
+    Mirrors the 16.16 fixed-point nearest-neighbour stepping of
+    pygame.transform.scale, so edges match the scaled surface exactly.
+    """
+    step = (source_length << 16) // scaled_length
+    return min(scaled_length, max(0, -(-((index << 16) - step // 2) // step)))
+
+
+def _scale_rect(rect, source_size, scaled_size):
+    """Map a rect on an image to the area it covers once the image is scaled up"""
+    left = _scaled_edge(rect.left, source_size[0], scaled_size[0])
+    top = _scaled_edge(rect.top, source_size[1], scaled_size[1])
+    right = _scaled_edge(rect.right, source_size[0], scaled_size[0])
+    bottom = _scaled_edge(rect.bottom, source_size[1], scaled_size[1])
+    return pygame.Rect(left, top, right - left, bottom - top)
+
+
+class _Asset:
+    """One cached asset and its bookkeeping"""
+
+    __slots__ = ('key', 'value', 'refs', 'hits', 'load_ms', 'bytes', 'deps')
+
+    def __init__(self, key, value, load_ms, deps=()):
+        self.key = key
+        self.value = value
+        self.refs = 0
+        self.hits = 0
+        self.load_ms = load_ms
+        self.bytes = _surface_bytes(value)
+        self.deps = deps  # Keys of the assets this one was built from
+
+
+class AssetManager:
+    """Cache of converted and pre-scaled surfaces shared by every entity
+
+    Every request names an owner; the asset stays referenced until all of
+    its owners are garbage collected (tracked with weakref.finalize). Assets
+    nobody references any more are kept in an LRU up to
+    MAX_UNUSED_ASSET_BYTES and evicted oldest first after that. Missing
+    files are remembered, so they are only looked up once.
+
+    Surfaces are normalized as they are cached (see normalize_surface):
+    opaque art loses its alpha channel, hard-edged sprites get an exact
+    colorkey and sparse ones RLE encoding.
+
+    Returned surfaces are shared - never draw on them or change their alpha;
+    copy first.
+    """
+
+    def __init__(self, max_unused_bytes=MAX_UNUSED_ASSET_BYTES):
+        """Create an empty manager
+
+        Args:
+            max_unused_bytes: Memory budget for unreferenced assets
+        """
+        self.max_unused_bytes = max_unused_bytes
+        self._assets = {}  # key -> _Asset
+        self._unused = OrderedDict()  # key -> None, least recently released first
+        self._unused_bytes = 0
+        self.evictions = 0
+        self._preloaded = {}  # path -> converted surface, decoded ahead of first use
+        self._found = {}  # path -> whether the file exists (failed lookups are never retried)
+        self.preload_timings = []  # One dict per preloaded image (see preload)
+
+    @staticmethod
+    def _resolve(path):
+        """Turn a project-relative path into a normalized absolute one"""
+        if not os.path.isabs(path):
+            path = os.path.join(PROJECT_ROOT, path)
+        return os.path.normpath(path)
+
+    def image(self, path, owner, size=None, alpha=True):
+        """Get a converted (and optionally scaled) image
+
+        Args:
+            path: Image path (absolute or relative to the project root)
+            owner: Object keeping the asset in use until it is collected
+            size: (width, height) to scale to, or None for the original size
+            alpha: Normalize from convert_alpha() if True (see
+                normalize_surface), plain convert() otherwise
+
+        Returns:
+            pygame.Surface (shared - do not modify)
+        """
+        path = self._resolve(path)
+        size = tuple(size) if size else None
+        key = ('image', path, size, alpha)
+        asset = self._assets.get(key)
+        if asset is None:
+            if size is None:
+                start = time.perf_counter()
+                asset = self._add(key, normalize_surface(self._decode(path, alpha)), start)
+            else:
+                source = self.image(path, self, alpha=alpha)  # Source held by the manager...
+                source_key = ('image', path, None, alpha)
+                self._acquire(source_key)  # ...and by this derived asset
+                start = time.perf_counter()
+                asset = self._add(key, normalize_surface(pygame.transform.scale(source, size)), start,
+                                  deps=(source_key,))
+        return self._track(asset, owner)
+
+    def exists(self, path):
+        """Check whether an image file exists, remembering the answer
+
+        Args:
+            path: Image path (absolute or relative to the project root)
+
+        Returns:
+            bool
+        """
+        path = self._resolve(path)
+        found = self._found.get(path)
+        if found is None:
+            found = self._found[path] = os.path.isfile(path)
+            if not found:
+                log.warning('assets', "⚠️ Missing asset %s", os.path.relpath(path, PROJECT_ROOT))
+        return found
+
+    def collision_rects(self, path, owner, size):
+        """Get the bounding rects of an image's opaque areas once scaled to a size
+
+        The mask is built from the image at its native size and, when the
+        image is scaled up, the rects are scaled analytically - the result
+        matches building the mask from the scaled surface, without creating
+        a full-size surface and mask.
+
+        Args:
+            path: Image path (absolute or relative to the project root)
+            owner: Object keeping the asset in use until it is collected
+            size: (width, height) the image is stretched to
+
+        Returns:
+            Tuple of pygame.Rect (shared - do not modify)
+        """
+        path = self._resolve(path)
+        size = tuple(size)
+        key = ('collision', path, size)
+        asset = self._assets.get(key)
+        if asset is None:
+            source = self.image(path, self)  # Only needed while building
+            start = time.perf_counter()
+            source_size = source.get_size()
+            if size[0] >= source_size[0] and size[1] >= source_size[1]:
+                rects = tuple(_scale_rect(rect, source_size, size)
+                              for rect in pygame.mask.from_surface(source).get_bounding_rects())
+            else:
+                # Shrinking can drop or merge pixels, so measure the scaled image
+                scaled = pygame.transform.scale(source, size)
+                rects = tuple(pygame.mask.from_surface(scaled).get_bounding_rects())
+            asset = self._add(key, rects, start)
+        return self._track(asset, owner)
+
+    def fallback(self, name, owner, build):
+        """Get placeholder art for missing assets, drawing it only once
+
+        Args:
+            name: Unique placeholder name
+            owner: Object keeping the asset in use until it is collected
+            build: Function returning the placeholder (a surface, or a dict or
+                list of surfaces); called on first use only
+
+        Returns:
+            The placeholder (shared - do not modify)
+        """
+        key = ('fallback', name)
+        asset = self._assets.get(key)
+        if asset is None:
+            start = time.perf_counter()
+            asset = self._add(key, _normalize(build(), {}), start)
+        return self._track(asset, owner)
+
+    def tiles(self, path, owner, size):
+        """Get a map layer scaled to a size and split into tiles
+
+        Args:
+            path: Image path (absolute or relative to the project root)
+            owner: Object keeping the asset in use until it is collected
+            size: (width, height) of the whole layer
+
+        Returns:
+            TiledLayer (shared - do not modify its tiles)
+        """
+        path = self._resolve(path)
+        size = tuple(size)
+        key = ('tiles', path, size)
+        asset = self._assets.get(key)
+        if asset is None:
+            source = self.image(path, self)
+            source_key = ('image', path, None, True)
+            self._acquire(source_key)
+            start = time.perf_counter()
+            # The scaled layer is only needed while splitting; the tiles own their pixels
+            layer = TiledLayer(pygame.transform.scale(source, size))
+            asset = self._add(key, layer, start, deps=(source_key,))
+            log.debug('assets', "   %s tiles kept (%s opaque, %s alpha), %s empty dropped",
+                      len(layer), layer.opaque_tiles, layer.alpha_tiles, layer.dropped_tiles)
+        return self._track(asset, owner)
+
+    def atlas(self, name, owner):
+        """Get a sprite atlas, building it from its definition on first use
+
+        Args:
+            name: Atlas name (definition file in assets/atlases without .json)
+            owner: Object keeping the asset in use until it is collected
+
+        Returns:
+            SpriteAtlas (shared - do not modify its surfaces)
+        """
+        path = self._resolve(os.path.join(ATLAS_DIR, f'{name}.json'))
+        key = ('atlas', path)
+        asset = self._assets.get(key)
+        if asset is None:
+            start = time.perf_counter()
+            # Source sheets are decoded only for the build; the atlas replaces them
+            atlas = SpriteAtlas(name, load_atlas_definition(name),
+                                lambda image_path: self._decode(self._resolve(image_path), True))
+            asset = self._add(key, atlas, start)
+        return self._track(asset, owner)
+
+    def _decode(self, path, alpha):
+        """Get a converted surface for a file, using a preloaded one if there is one"""
+        surface = self._preloaded.pop(path, None)
+        if surface is None:
+            if not self.exists(path):
+                raise FileNotFoundError(f"No file '{os.path.relpath(path, PROJECT_ROOT)}'")
+            surface = pygame.image.load(path)
+            return surface.convert_alpha() if alpha else surface.convert()
+        return surface if alpha else surface.convert()
+
+    def preload(self, paths=(), atlases=(), workers=PRELOAD_WORKERS):
+        """Decode images in parallel ahead of their first use
+
+        Files are read and decoded by Pillow on a thread pool; the raw RGBA
+        buffers are turned into converted surfaces on the calling (main)
+        thread, since pygame surfaces must be converted there. Later
+        image() and atlas() calls use the decoded surfaces instead of
+        loading the files again. Without Pillow nothing is preloaded.
+
+        Args:
+            paths: Image paths (absolute or relative to the project root)
+            atlases: Names of atlases whose source images to preload (skipped
+                if the atlas is already built)
+            workers: Decoder threads
+
+        Returns:
+            Total wall time in ms
+        """
+        if Image is None:
+            log.warning('assets', "⚠️ Pillow not installed - images are decoded on first use")
+            return 0.0
+
+        paths = list(paths)
+        for name in atlases:
+            if ('atlas', self._resolve(os.path.join(ATLAS_DIR, f'{name}.json'))) not in self._assets:
+                paths.extend(atlas_source_paths(name))
+        paths = list(dict.fromkeys(
+            path for path in map(self._resolve, paths)
+            if path not in self._preloaded and ('image', path, None, True) not in self._assets
+            and self.exists(path)
+        ))
+        start = time.perf_counter()
+        loaded = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(path, pool.submit(_decode_file, path)) for path in paths]
+            for path, future in futures:
+                wait_start = time.perf_counter()
+                try:
+                    data, size, decode_ms = future.result()
+                except (OSError, ValueError) as e:
+                    log.warning('assets', "⚠️ Could not preload %s: %s", os.path.relpath(path, PROJECT_ROOT), e)
+                    continue
+                upload_start = time.perf_counter()
+                surface = pygame.image.frombuffer(data, size, 'RGBA').convert_alpha()
+                self._preloaded[path] = surface
+                loaded += 1
+                self.preload_timings.append({
+                    'name': os.path.relpath(path, PROJECT_ROOT),
+                    'decode_ms': decode_ms,
+                    'wait_ms': (upload_start - wait_start) * 1000,
+                    'upload_ms': (time.perf_counter() - upload_start) * 1000,
+                    'bytes': _surface_bytes(surface)
+                })
+        total_ms = (time.perf_counter() - start) * 1000
+        log.info('assets', "🖼️ Preloaded %s images in %.1f ms on %s threads", loaded, total_ms, workers)
+        return total_ms
+
+    def preload_report_lines(self):
+        """Get the per-image preload timings as lines of text, slowest decode first"""
+        rows = sorted(self.preload_timings, key=lambda row: row['decode_ms'], reverse=True)
+        lines = [f"🖼️ Preload: {len(rows)} images, "
+                 f"{sum(row['decode_ms'] for row in rows):.1f} ms decoding, "
+                 f"{sum(row['wait_ms'] + row['upload_ms'] for row in rows):.1f} ms on the main thread",
+                 f"   {'decode':>8}{'wait':>8}{'upload':>8}{'KB':>8}  name"]
+        for row in rows:
+            lines.append(f"   {row['decode_ms']:>8.2f}{row['wait_ms']:>8.2f}{row['upload_ms']:>8.2f}"
+                         f"{row['bytes'] // 1024:>8}  {row['name']}")
+        return lines
+
+    def _add(self, key, value, start, deps=()):
+        """Store a freshly built asset"""
+        asset = _Asset(key, value, (time.perf_counter() - start) * 1000, deps)
+        for surface in _surfaces(value, {}).values():
+            track_surface(surface, f"assets: {key[0]}")
+        hitch_detector.note('asset load', asset.load_ms)
+        self._assets[key] = asset
+        # Unreferenced until _track; counted as unused so budgets stay exact
+        self._unused[key] = None
+        self._unused_bytes += asset.bytes
+        log.debug('assets', "🖼️ Loaded %s %s (%s KB, %.1f ms)", os.path.basename(key[1]), key[0], asset.bytes // 1024, asset.load_ms)
+        return asset
+
+    def _track(self, asset, owner):
+        """Count a use of an asset and release it when the owner goes away"""
+        asset.hits += 1
+        if owner is not self:
+            self._acquire(asset.key)
+            weakref.finalize(owner, self._release, asset.key)
+        return asset.value
+
+    def _acquire(self, key):
+        """Add a reference to an asset"""
+        asset = self._assets[key]
+        if asset.refs == 0 and key in self._unused:
+            del self._unused[key]
+            self._unused_bytes -= asset.bytes
+        asset.refs += 1
+
+    def _release(self, key):
+        """Drop a reference to an asset, evicting unused assets over budget"""
+        asset = self._assets.get(key)
+        if asset is None:
+            return
+        asset.refs -= 1
+        if asset.refs == 0:
+            self._unused[key] = None
+            self._unused_bytes += asset.bytes
+            self._evict(self.max_unused_bytes)
+
+    def _evict(self, budget):
+        """Evict least recently released assets until unused memory fits a budget"""
+        while self._unused_bytes > budget and self._unused:
+            key, _ = self._unused.popitem(last=False)
+            asset = self._assets.pop(key)
+            self._unused_bytes -= asset.bytes
+            self.evictions += 1
+            for dep in asset.deps:
+                self._release(dep)
+
+    def evict_unused(self):
+        """Drop every asset nobody references (e.g. during a scene transition)"""
+        self._evict(0)
+
+    def stats(self):
+        """Get per-asset statistics
+
+        Returns:
+            List of dicts with 'kind', 'name', 'size' (scaled size or None),
+            'refs', 'hits', 'load_ms', 'bytes' and 'formats' (format_kind
+            of its surfaces), largest first
+        """
+        rows = [
+            {
+                'kind': asset.key[0],
+                'name': asset.key[1] if asset.key[0] == 'fallback' else os.path.relpath(asset.key[1], PROJECT_ROOT),
+                'size': asset.key[2] if asset.key[0] in ('image', 'tiles', 'collision') else None,
+                'refs': asset.refs,
+                'hits': asset.hits,
+                'load_ms': asset.load_ms,
+                'bytes': asset.bytes,
+                'formats': sorted({format_kind(surface) for surface in _surfaces(asset.value, {}).values()})
+            }
+            for asset in self._assets.values()
+        ]
+        rows.sort(key=lambda row: row['bytes'], reverse=True)
+        return rows
+
+    def report_lines(self):
+        """Get the asset statistics as a table, one line of text per row"""
+        rows = self.stats()
+        lines = [f"🖼️ Assets: {len(rows)} cached, "
+                 f"{sum(row['bytes'] for row in rows) / (1024 * 1024):.1f} MB "
+                 f"({self._unused_bytes / (1024 * 1024):.1f} MB unused), "
+                 f"{self.evictions} evicted",
+                 f"   {'kind':<10}{'refs':>5}{'hits':>6}{'load ms':>9}{'KB':>8}  name"]
+        for row in rows:
+            size = f" @ {row['size'][0]}x{row['size'][1]}" if row['size'] else ""
+            formats = f" [{', '.join(row['formats'])}]" if row['formats'] else ""
+            lines.append(f"   {row['kind']:<10}{row['refs']:>5}{row['hits']:>6}"
+                         f"{row['load_ms']:>9.1f}{row['bytes'] // 1024:>8}  {row['name']}{size}{formats}")
+        if self.preload_timings:
+            lines += self.preload_report_lines()
+        return lines
+
+
+# Shared instance used by every entity and scene
+assets = AssetManager()
@@ -0,0 +1,208 @@
+"""Sprite atlases - many pre-scaled frames packed into one surface"""
+
+import json
+import os
+
+import pygame
+
+from config.settings import RENDER_SCALE
+from game.log import log
+from game.render_target import view_size
+from utils.surface_format import normalize_surface
+
+
+ATLAS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'atlases')
+ATLAS_MAX_WIDTH = 1024
+ATLAS_PADDING = 1  # Transparent gap between frames so scaled blits never bleed
+
+
+def _scale(image, size, smooth):
+    """Scale a frame - nearest neighbour keeps pixel art crisp, but shrinking
+    by 2x or more (world art at RENDER_SCALE > 1) is filtered instead"""
+    width, height = image.get_size()
+    if smooth and size[0] * 2 <= width and size[1] * 2 <= height:
+        return pygame.transform.smoothscale(image, size)
+    return pygame.transform.scale(image, size)
+
+
+def _slice(sheet, rect, size, smooth):
+    """Cut one frame out of a sheet and scale it
+
+    Frames reaching past the sheet edge keep their full size and are
+    transparent outside it, like blitting the area into an empty frame.
+    """
+    rect = pygame.Rect(rect)
+    if sheet.get_rect().contains(rect):
+        return _scale(sheet.subsurface(rect), size, smooth)
+    frame = pygame.Surface(rect.size, pygame.SRCALPHA)
+    frame.blit(sheet, (0, 0), rect)
+    return _scale(frame, size, smooth)
+
+
+class SpriteAtlas:
+    """Frames of several sprites packed into one converted surface
+
+    Built from a definition file in ATLAS_DIR listing each sprite's source
+    image, the frames to cut from it and the size to scale them to, plus
+    optional named animations (lists of frame indices). Atlases of world art
+    ("space": "world") are scaled down to the world render target's
+    resolution; other atlases (HUD art) keep the given sizes. After building,
+    ``manifest`` maps every sprite name to the rects of its frames in
+    ``surface``; frames are handed out as subsurfaces, so every sprite in the
+    atlas blits from the same source (sparse frames are RLE encoded, see
+    normalize_surface).
+    """
+
+    def __init__(self, name, definition, load_image):
+        """Build an atlas
+
+        Args:
+            name: Atlas name
+            definition: dict with optional 'space' ('world' to scale to the
+                world render target) and 'max_width', and 'sprites' mapping names to dicts with
+                'path' (sheet) or 'paths' (one frame per image), optional
+                'frame' [w, h] (slice a strip along the top row) or 'rects'
+                (source rects), optional 'size' [w, h] and optional
+                'animations' {name: [frame indices]}
+            load_image: Function decoding a path to a converted surface
+        """
+        self.name = name
+        max_width = definition.get('max_width', ATLAS_MAX_WIDTH)
+        world = definition.get('space') == 'world'
+
+        # Scale every frame first, skipping sprites whose sources are missing
+        sheets = {}
+        sprite_frames = {}
+        self.animations = {}
+        for sprite_name, spec in definition['sprites'].items():
+            try:
+                frames = self._build_frames(spec, sheets, load_image, world)
+                animations = spec.get('animations', {})
+                if any(i >= len(frames) for indices in animations.values() for i in indices):
+                    raise ValueError(f"{len(frames)} frames is not enough for its animations")
+            except (pygame.error, FileNotFoundError, ValueError) as e:
+                log.warning('assets', "⚠️ Atlas '%s': skipping sprite '%s': %s", name, sprite_name, e)
+                continue
+            sprite_frames[sprite_name] = frames
+            self.animations[sprite_name] = {anim: tuple(indices) for anim, indices in animations.items()}
+
+        # Shelf packing: tallest frames first, left to right, new shelf when a row is full
+        order = sorted(
+            ((sprite_name, i) for sprite_name, frames in sprite_frames.items() for i in range(len(frames))),
+            key=lambda item: -sprite_frames[item[0]][item[1]].get_height()
+        )
+        self.manifest = {sprite_name: [None] * len(frames) for sprite_name, frames in sprite_frames.items()}
+        x = y = shelf_height = width = 0
+        for sprite_name, i in order:
+            w, h = sprite_frames[sprite_name][i].get_size()
+            if x > 0 and x + w > max_width:
+                x = 0
+                y += shelf_height + ATLAS_PADDING
+                shelf_height = 0
+            self.manifest[sprite_name][i] = pygame.Rect(x, y, w, h)
+            x += w + ATLAS_PADDING
+            shelf_height = max(shelf_height, h)
+            width = max(width, x - ATLAS_PADDING)
+        height = y + shelf_height
+
+        self.surface = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+        for sprite_name, frames in sprite_frames.items():
+            for frame, rect in zip(frames, self.manifest[sprite_name]):
+                self.surface.blit(frame, rect)
+        if pygame.display.get_surface():
+            self.surface = self.surface.convert_alpha()
+
+        # Rects are final; frames are views into the atlas
+        self.manifest = {sprite_name: tuple(rects) for sprite_name, rects in self.manifest.items()}
+        self._frames = {
+            sprite_name: tuple(normalize_surface(self.surface.subsurface(rect)) for rect in rects)
+            for sprite_name, rects in self.manifest.items()
+        }
+
+    @staticmethod
+    def _build_frames(spec, sheets, load_image, world):
+        """Cut and scale the frames of one sprite (to view size for world art)"""
+        def sheet(path):
+            if path not in sheets:
+                sheets[path] = load_image(path)
+            return sheets[path]
+
+        smooth = world and RENDER_SCALE > 1
+
+        def scaled_size(native_size):
+            size = tuple(spec['size']) if 'size' in spec else tuple(native_size)
+            return view_size(*size) if world else size
+
+        if 'paths' in spec:
+            images = [sheet(path) for path in spec['paths']]
+            return [_scale(image, scaled_size(image.get_size()), smooth) for image in images]
+
+        source = sheet(spec['path'])
+        if 'rects' in spec:
+            rects = spec['rects']
+        elif 'frame' in spec:
+            frame_w, frame_h = spec['frame']
+            rects = [(i * frame_w, 0, frame_w, frame_h) for i in range(source.get_width() // frame_w)]
+        else:
+            rects = [source.get_rect()]
+        return [_slice(source, rect, scaled_size(pygame.Rect(rect).size), smooth) for rect in rects]
+
+    def __contains__(self, sprite_name):
+        return sprite_name in self._frames
+
+    def frames(self, sprite_name):
+        """Get every frame of a sprite
+
+        Args:
+            sprite_name: Sprite name from the definition
+
+        Returns:
+            Tuple of subsurfaces of the atlas (shared - do not modify)
+
+        Raises:
+            KeyError: If the sprite is not in the atlas
+        """
+        return self._frames[sprite_name]
+
+    def animation_set(self, sprite_name):
+        """Get a sprite's named animations
+
+        Args:
+            sprite_name: Sprite name from the definition
+
+        Returns:
+            dict of animation name -> list of frames
+
+        Raises:
+            KeyError: If the sprite is not in the atlas
+        """
+        frames = self._frames[sprite_name]
+        return {anim: [frames[i] for i in indices] for anim, indices in self.animations[sprite_name].items()}
+
+
+def load_atlas_definition(name):
+    """Read an atlas definition file
+
+    Args:
+        name: Atlas name (file name in ATLAS_DIR without .json)
+
+    Returns:
+        dict definition for SpriteAtlas
+    """
+    with open(os.path.join(ATLAS_DIR, f'{name}.json')) as f:
+        return json.load(f)
+
+
+def atlas_source_paths(name):
+    """Get every image an atlas is built from (e.g. to preload them)
+
+    Args:
+        name: Atlas name (file name in ATLAS_DIR without .json)
+
+    Returns:
+        List of image paths as written in the definition
+    """
+    paths = []
+    for spec in load_atlas_definition(name)['sprites'].values():
+        paths.extend(spec['paths'] if 'paths' in spec else [spec['path']])
+    return paths
@@ -1,42 +1,204 @@
 """Audio utility functions for music and sound effects"""
 
+import io
+
 import pygame
 
-# Global music tracking
-current_track = None
+from game.log import log
 
 
-def play_music(track):
-    """Play background music, avoiding reload if same track is already playing
-    
-    Args:
-        track: Path to music file (relative to project root)
+# Track streamed for each music state (states sharing a track keep it playing)
+MUSIC_TRACKS = {
+    'outside': "assets/sounds/outside_music.mp3",
+    'inside': "assets/sounds/inside_music.mp3",
+    'caught': "assets/sounds/player_caught.mp3",
+    'game_over': "assets/sounds/game-over.mp3",
+    'goal_reached': "assets/sounds/children_singing.mp3",
+    'ending': "assets/sounds/children_singing.mp3",
+}
+
+# States likely to follow each state - their tracks are opened ahead of time
+LIKELY_NEXT_STATES = {
+    'outside': ('inside', 'goal_reached'),
+    'inside': ('caught', 'outside', 'game_over'),
+    'caught': ('outside', 'game_over'),
+    'game_over': ('outside',),
+    'goal_reached': ('inside', 'ending'),
+    'ending': (),
+}
+
+MUSIC_CROSSFADE_TIME = 0.6  # Seconds to fade the old track out and the new one in
+
+
+class AudioManager:
+    """Music driven by game state instead of per-frame play calls
+
+    Scenes call set_music_state() when the situation changes (entering a
+    house, getting caught...); the same state again is a no-op. A new track
+    replaces the old one over MUSIC_CROSSFADE_TIME - pygame streams a single
+    music track, so the old one fades out and the new one fades in on a timer
+    advanced by update(). While nothing is fading, update() reads the tracks
+    of the likely next states into memory one per frame, so a transition
+    streams from memory instead of opening the file mid-game.
     """
-    global current_track
-    if current_track == track:
-        return  # Don't reload if already playing this track
-    
-    try:
-        current_track = track
-        pygame.mixer.music.load(track)
-        pygame.mixer.music.play(-1)  # Loop indefinitely
-        print(f"🎵 Now playing: {track}")
-    except pygame.error as e:
-        print(f"⚠️ Could not load music '{track}': {e}")
+
+    def __init__(self, crossfade_time=MUSIC_CROSSFADE_TIME):
+        """Create a silent manager
+
+        Args:
+            crossfade_time: Seconds a track change takes
+        """
+        self.crossfade_time = crossfade_time
+        self.state = None
+        self.track = None  # Track currently streaming
+        self.volume = 1.0  # Music volume before fading
+        self._pending_track = None  # Track to start once the current one has faded out
+        self._fade = None  # 'out', 'in' or None
+        self._fade_timer = 0.0
+        self._opened = {}  # path -> file bytes of the current and likely next tracks
+        self._to_open = []  # Paths still to read, one per update()
+
+    def set_music_state(self, state):
+        """Switch the music to a state's track (no-op if already in that state)
+
+        Args:
+            state: Key of MUSIC_TRACKS
+
+        Raises:
+            KeyError: If the state has no track
+        """
+        if state == self.state:
+            return
+        track = MUSIC_TRACKS[state]
+        self.state = state
+        self._plan_preopen(state)
+
+        if track == (self._pending_track or self.track):
+            # Same music - cancel a fade out towards it, or keep playing
+            if self._pending_track:
+                self._pending_track = None
+                self._begin_fade('in')
+            return
+
+        if self.track is None or not pygame.mixer.get_init() or not pygame.mixer.music.get_busy():
+            self._start(track)
+        else:
+            self._pending_track = track
+            if self._fade != 'out':
+                self._begin_fade('out')
+
+    def update(self, dt):
+        """Advance a crossfade, or open one likely next track
+
+        Args:
+            dt: Delta time in seconds
+        """
+        if self._fade is None:
+            if self._to_open:
+                self._open(self._to_open.pop(0))
+            return
+
+        self._fade_timer += dt
+        half = self.crossfade_time / 2
+        progress = min(1.0, self._fade_timer / half) if half > 0 else 1.0
+        if self._fade == 'out':
+            self._apply_volume(1.0 - progress)
+            if progress >= 1.0:
+                track, self._pending_track = self._pending_track, None
+                self._start(track)
+        else:
+            self._apply_volume(progress)
+            if progress >= 1.0:
+                self._fade = None
+
+    def stop(self):
+        """Stop the music and forget the state"""
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        self.state = None
+        self.track = None
+        self._pending_track = None
+        self._fade = None
+
+    def set_volume(self, volume):
+        """Set the music volume
+
+        Args:
+            volume: Float between 0.0 and 1.0
+        """
+        self.volume = volume
+        if self._fade is None:
+            self._apply_volume(1.0)
+
+    def _begin_fade(self, direction):
+        """Start fading 'out' or 'in', continuing from the current level"""
+        if self._fade is not None and self._fade != direction:
+            # Reverse mid-fade without jumping
+            half = self.crossfade_time / 2
+            self._fade_timer = max(0.0, half - self._fade_timer)
+        else:
+            self._fade_timer = 0.0
+        self._fade = direction
+
+    def _start(self, track):
+        """Start streaming a track from silence and fade it in"""
+        self.track = track
+        data = self._opened.get(track)
+        try:
+            if data is not None:
+                pygame.mixer.music.load(io.BytesIO(data), track.rsplit('.', 1)[-1])
+            else:
+                pygame.mixer.music.load(track)
+            self._apply_volume(0.0)
+            pygame.mixer.music.play(-1)  # Loop indefinitely
+            log.info('audio', "🎵 Now playing: %s", track)
+        except pygame.error as e:
+            log.warning('audio', "⚠️ Could not load music '%s': %s", track, e)
+            self._fade = None
+            return
+        self._fade = None
+        self._begin_fade('in')
+
+    def _apply_volume(self, level):
+        """Set the mixer volume to a fraction of the music volume"""
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self.volume * level)
+
+    def _plan_preopen(self, state):
+        """Keep the tracks of a state and its likely successors, queue missing ones"""
+        wanted = [MUSIC_TRACKS[state]] + [MUSIC_TRACKS[s] for s in LIKELY_NEXT_STATES.get(state, ())]
+        for path in list(self._opened):
+            if path not in wanted:
+                del self._opened[path]
+        self._to_open = [path for path in dict.fromkeys(wanted) if path not in self._opened]
+
+    def _open(self, path):
+        """Read a track into memory"""
+        try:
+            with open(path, 'rb') as f:
+                self._opened[path] = f.read()
+        except OSError as e:
+            log.warning('audio', "⚠️ Could not open music '%s': %s", path, e)
+
+
+# Shared instance driven by the level
+audio = AudioManager()
+
+
+def set_music_state(state):
+    """Switch the music to a state's track (see AudioManager.set_music_state)"""
+    audio.set_music_state(state)
 
 
 def stop_music():
     """Stop currently playing music"""
-    global current_track
-    pygame.mixer.music.stop()
-    current_track = None
+    audio.stop()
 
 
 def set_music_volume(volume):
     """Set music volume
-    
+
     Args:
         volume: Float between 0.0 and 1.0
     """
-    pygame.mixer.music.set_volume(volume)
-
+    audio.set_volume(volume)
@@ -0,0 +1,159 @@
+"""Binary space partitioning generator for interior layouts"""
+
+import random
+
+import pygame
+
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+BSP_LAYOUT_PREFIX = 'bsp'
+WALL_THICKNESS = 20
+BSP_MAX_DEPTH = 3  # At most 2^3 rooms
+BSP_MIN_ROOM_WIDTH = 280
+BSP_MIN_ROOM_HEIGHT = 220
+BSP_SPLIT_ATTEMPTS = 6
+DOOR_GAP = 120  # Opening left in every dividing wall
+ROOM_AREA_MARGIN = 10  # Spawn areas stay this far from a room's walls
+
+# Same front door and player spawn as the hand-made layouts
+BSP_DOOR = (640, 695, 50, 30)
+BSP_PLAYER_SPAWN = (630, 550)
+# Dividing walls never cross the space between the spawn point and the door
+SPAWN_CLEARANCE = pygame.Rect(590, 520, 150, 180)
+
+
+def chunk_seed(chunk_x, chunk_y):
+    """Get a stable layout seed for a chunk coordinate
+
+    Args:
+        chunk_x: Chunk X coordinate
+        chunk_y: Chunk Y coordinate
+
+    Returns:
+        32-bit int seed
+    """
+    return ((chunk_x * 73856093) ^ (chunk_y * 19349663)) & 0xFFFFFFFF
+
+
+def bsp_layout_name(chunk_x, chunk_y):
+    """Get the layout name of the generated interior for a chunk"""
+    return f"{BSP_LAYOUT_PREFIX}_{chunk_x}_{chunk_y}"
+
+
+def parse_bsp_layout_name(name):
+    """Get the chunk coordinate back from a generated layout name, or None"""
+    parts = name.split('_')
+    if len(parts) != 3 or parts[0] != BSP_LAYOUT_PREFIX:
+        return None
+    try:
+        return (int(parts[1]), int(parts[2]))
+    except ValueError:
+        return None
+
+
+def _choose_split(rng, node, blocked):
+    """Pick where to divide a node, or None if it should stay one room
+
+    Args:
+        rng: random.Random to draw from
+        node: (x, y, w, h) space to divide
+        blocked: List of pygame.Rect no dividing wall may cross
+
+    Returns:
+        (vertical, position) or None
+    """
+    x, y, w, h = node
+    can_split_x = w >= 2 * BSP_MIN_ROOM_WIDTH + WALL_THICKNESS
+    can_split_y = h >= 2 * BSP_MIN_ROOM_HEIGHT + WALL_THICKNESS
+    if not (can_split_x or can_split_y):
+        return None
+
+    # Cut across the longer side, relative to the minimum room shape
+    if can_split_x and can_split_y:
+        vertical = w / BSP_MIN_ROOM_WIDTH >= h / BSP_MIN_ROOM_HEIGHT
+    else:
+        vertical = can_split_x
+
+    for _ in range(BSP_SPLIT_ATTEMPTS):
+        if vertical:
+            pos = rng.randint(x + BSP_MIN_ROOM_WIDTH, x + w - BSP_MIN_ROOM_WIDTH - WALL_THICKNESS)
+            wall = pygame.Rect(pos, y, WALL_THICKNESS, h)
+        else:
+            pos = rng.randint(y + BSP_MIN_ROOM_HEIGHT, y + h - BSP_MIN_ROOM_HEIGHT - WALL_THICKNESS)
+            wall = pygame.Rect(x, pos, w, WALL_THICKNESS)
+        if wall.collidelist(blocked) == -1:
+            return (vertical, pos)
+    return None
+
+
+def generate_bsp_layout(seed):
+    """Generate an interior layout by recursively dividing the room
+
+    Every dividing wall gets a door gap, and later walls never close an
+    earlier gap, so all rooms stay connected. The result has the same format
+    as the layout files in assets/layouts.
+
+    Args:
+        seed: Seed for the layout (the same seed gives the same layout)
+
+    Returns:
+        dict with 'walls', 'enemy_areas', 'tree_areas', 'door' and 'player_spawn'
+    """
+    rng = random.Random(seed)
+    t = WALL_THICKNESS
+
+    # Border walls
+    walls = [
+        [0, 0, SCREEN_WIDTH, t], [0, 0, t, SCREEN_HEIGHT],
+        [0, SCREEN_HEIGHT - t, SCREEN_WIDTH, t], [SCREEN_WIDTH - t, 0, t, SCREEN_HEIGHT]
+    ]
+    blocked = [SPAWN_CLEARANCE]
+    rooms = []
+
+    stack = [((t, t, SCREEN_WIDTH - 2 * t, SCREEN_HEIGHT - 2 * t), 0)]
+    while stack:
+        node, depth = stack.pop()
+        split = _choose_split(rng, node, blocked) if depth < BSP_MAX_DEPTH else None
+        if split is None:
+            rooms.append(node)
+            continue
+
+        x, y, w, h = node
+        vertical, pos = split
+        if vertical:
+            # Wall from top to bottom with a gap somewhere along it
+            gap = rng.randint(y, y + h - DOOR_GAP)
+            walls.append([pos, y, t, gap - y])
+            walls.append([pos, gap + DOOR_GAP, t, y + h - gap - DOOR_GAP])
+            blocked.append(pygame.Rect(pos - 1, gap, t + 2, DOOR_GAP))
+            stack.append(((x, y, pos - x, h), depth + 1))
+            stack.append(((pos + t, y, x + w - pos - t, h), depth + 1))
+        else:
+            # Wall from left to right with a gap somewhere along it
+            gap = rng.randint(x, x + w - DOOR_GAP)
+            walls.append([x, pos, gap - x, t])
+            walls.append([gap + DOOR_GAP, pos, x + w - gap - DOOR_GAP, t])
+            blocked.append(pygame.Rect(gap, pos - 1, DOOR_GAP, t + 2))
+            stack.append(((x, y, w, pos - y), depth + 1))
+            stack.append(((x, pos + t, w, y + h - pos - t), depth + 1))
+
+    # Every room can hold trees; enemies patrol every room but the entrance
+    m = ROOM_AREA_MARGIN
+    enemy_areas = []
+    tree_areas = []
+    for (x, y, w, h) in rooms:
+        area = [x + m, y + m, w - 2 * m, h - 2 * m]
+        tree_areas.append(area)
+        if not pygame.Rect(x, y, w, h).collidepoint(BSP_PLAYER_SPAWN):
+            enemy_areas.append(area)
+    if not enemy_areas:
+        enemy_areas = tree_areas[:1]
+
+    return {
+        'walls': [wall for wall in walls if wall[2] > 0 and wall[3] > 0],
+        'enemy_areas': enemy_areas,
+        'tree_areas': tree_areas,
+        'door': list(BSP_DOOR),
+        'player_spawn': list(BSP_PLAYER_SPAWN)
+    }
@@ -0,0 +1,156 @@
+"""Interior layout files compiled once into shared, read-only layouts"""
+
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from game import log, track_surface, view_rect
+from game.render_target import VIEW_WIDTH, VIEW_HEIGHT
+from game_objects.wall import Wall
+from utils.placement import OccupancyGrid
+from utils.bsp_layout import generate_bsp_layout, chunk_seed, bsp_layout_name, parse_bsp_layout_name
+
+
+LAYOUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'layouts')
+FLOOR_COLOR = (152, 116, 86)  # Brown/tan floor color
+DOOR_COLOR = (0, 0, 255)
+DOOR_INTERACT_SIZE = 100
+MAX_CACHED_GENERATED_LAYOUTS = 16  # Generated layouts kept compiled (LRU)
+
+# Module-level caches: layout name -> CompiledLayout
+_compiled_layouts = {}  # Layout files (few, kept forever)
+_generated_layouts = OrderedDict()  # Generated layouts, can be rebuilt from their name
+
+
+class CompiledLayout:
+    """Interior layout with all of its static geometry precomputed
+
+    Compiled layouts are shared by every interior built from them, so they
+    are read-only: attributes can't be reassigned, the arrays are not
+    writeable and the Wall objects must not be moved. The background surface
+    must not be drawn on; it is baked on first use, since building a
+    full-screen surface costs more than compiling everything else.
+    """
+
+    __slots__ = ('name', 'walls', 'wall_rects', 'wall_array', 'wall_occupancy',
+                 'enemy_areas', 'tree_areas', 'door', 'door_interaction_rect',
+                 'player_spawn', '_background')
+
+    def __init__(self, name, data):
+        """Compile a layout from its raw data
+
+        Args:
+            name: Layout name
+            data: dict with 'walls', 'enemy_areas' and 'tree_areas' lists of
+                [x, y, w, h], plus 'door' [x, y, w, h] and 'player_spawn' [x, y]
+        """
+        set_attr = object.__setattr__
+        set_attr(self, 'name', name)
+
+        # Walls as one (n, 4) int array; Wall objects and Rects built once and shared
+        wall_array = np.asarray(data['walls'], dtype=np.int32).reshape(-1, 4)
+        wall_array.flags.writeable = False
+        set_attr(self, 'wall_array', wall_array)
+        set_attr(self, 'walls', tuple(Wall(*map(int, row)) for row in wall_array))
+        set_attr(self, 'wall_rects', tuple(wall.rect for wall in self.walls))
+
+        # Occupancy bitmap of the walls, copied into each interior's placement grid
+        grid = OccupancyGrid()
+        for rect in self.wall_rects:
+            grid.stamp(rect)
+        grid.occupied.flags.writeable = False
+        set_attr(self, 'wall_occupancy', grid.occupied)
+
+        set_attr(self, 'enemy_areas', tuple(tuple(area) for area in data['enemy_areas']))
+        set_attr(self, 'tree_areas', tuple(tuple(area) for area in data['tree_areas']))
+        set_attr(self, 'door', pygame.Rect(data['door']))
+        set_attr(self, 'door_interaction_rect', self.door.inflate(DOOR_INTERACT_SIZE, DOOR_INTERACT_SIZE))
+        set_attr(self, 'player_spawn', tuple(data['player_spawn']))
+        set_attr(self, '_background', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"CompiledLayout is read-only (tried to set '{name}')")
+
+    @property
+    def background(self):
+        """Floor, walls and door drawn into one surface (baked on first use)"""
+        if self._background is None:
+            object.__setattr__(self, '_background', self._bake_background())
+        return self._background
+
+    def _bake_background(self):
+        """Draw the floor, walls and door into one surface (world render target size)"""
+        background = pygame.Surface((VIEW_WIDTH, VIEW_HEIGHT))
+        if pygame.display.get_surface():
+            background = background.convert()
+        track_surface(background, f"layout {self.name}")
+        background.fill(FLOOR_COLOR)
+        for wall in self.walls:
+            wall.render(background)
+        pygame.draw.rect(background, DOOR_COLOR, view_rect(self.door))
+        return background
+
+
+def list_layouts():
+    """Get the names of every layout file, sorted
+
+    Returns:
+        List of layout names (file names without .json)
+    """
+    return sorted(
+        os.path.splitext(file_name)[0]
+        for file_name in os.listdir(LAYOUT_DIR)
+        if file_name.endswith('.json')
+    )
+
+
+def load_layout(name):
+    """Get a compiled layout, loading and compiling its file on first use
+
+    Args:
+        name: Layout name (file name in LAYOUT_DIR without .json, or a
+            generated layout name from bsp_layout_name)
+
+    Returns:
+        CompiledLayout (shared - do not modify)
+    """
+    chunk = parse_bsp_layout_name(name)
+    if chunk is not None:
+        return load_bsp_layout(*chunk)
+
+    layout = _compiled_layouts.get(name)
+    if layout is None:
+        with open(os.path.join(LAYOUT_DIR, f'{name}.json')) as f:
+            layout = CompiledLayout(name, json.load(f))
+        _compiled_layouts[name] = layout
+        log.debug('assets', "🗺️ Compiled interior layout '%s': %s walls", name, len(layout.walls))
+    return layout
+
+
+def load_bsp_layout(chunk_x, chunk_y):
+    """Get the compiled generated layout for a chunk's house
+
+    The layout is generated from the chunk coordinate, so it is never
+    stored: evicted layouts are simply generated again.
+
+    Args:
+        chunk_x: Chunk X coordinate
+        chunk_y: Chunk Y coordinate
+
+    Returns:
+        CompiledLayout (shared - do not modify)
+    """
+    name = bsp_layout_name(chunk_x, chunk_y)
+    layout = _generated_layouts.get(name)
+    if layout is not None:
+        _generated_layouts.move_to_end(name)
+        return layout
+
+    layout = CompiledLayout(name, generate_bsp_layout(chunk_seed(chunk_x, chunk_y)))
+    _generated_layouts[name] = layout
+    if len(_generated_layouts) > MAX_CACHED_GENERATED_LAYOUTS:
+        _generated_layouts.popitem(last=False)
+    return layout
@@ -0,0 +1,384 @@
+"""Navigation grid, cached A* paths and shared flow fields for enemy patrols"""
+
+import bisect
+import heapq
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+NAV_CELL_SIZE = 16  # Pixels per navigation cell
+MAX_CACHED_FLOW_FIELDS = 32  # Flow fields kept per grid (one per target cell)
+
+# 8-way neighbours as (d_col, d_row, cost)
+_NEIGHBOURS = [
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)),
+    (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2)),
+]
+
+
+class NavGrid:
+    """Walkability grid for an agent of a fixed collision size
+
+    A cell is walkable when the agent's collision rect, centered anywhere in
+    that cell, stays clear of every obstacle. Paths and flow fields are
+    expressed in agent-center coordinates (i.e. ``enemy.rect.center``).
+    """
+
+    def __init__(self, obstacle_rects, agent_width, agent_height,
+                 width=SCREEN_WIDTH, height=SCREEN_HEIGHT, cell_size=NAV_CELL_SIZE):
+        """Build the grid from static obstacles
+
+        Args:
+            obstacle_rects: Iterable of pygame.Rect (walls, tree bases, ...)
+            agent_width: Width of the agent's collision rect
+            agent_height: Height of the agent's collision rect
+            width: World width in pixels
+            height: World height in pixels
+            cell_size: Size of one navigation cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cols = width // cell_size
+        self.rows = height // cell_size
+
+        # Cell centers in world space
+        centers_x = np.arange(self.cols) * cell_size + cell_size / 2
+        centers_y = np.arange(self.rows) * cell_size + cell_size / 2
+
+        # Agent half extents, padded by half a cell so that any point inside
+        # a walkable cell (not just its center) is collision free
+        half_w = agent_width / 2 + cell_size / 2
+        half_h = agent_height / 2 + cell_size / 2
+
+        # Keep the agent fully inside the world
+        walkable = np.ones((self.rows, self.cols), dtype=bool)
+        walkable[:, (centers_x - half_w < 0) | (centers_x + half_w > width)] = False
+        walkable[(centers_y - half_h < 0) | (centers_y + half_h > height), :] = False
+
+        for rect in obstacle_rects:
+            cols_hit = (centers_x + half_w > rect.left) & (centers_x - half_w < rect.right)
+            rows_hit = (centers_y + half_h > rect.top) & (centers_y - half_h < rect.bottom)
+            walkable[np.ix_(rows_hit, cols_hit)] = False
+
+        self.walkable = walkable
+
+        # Caches shared by every agent navigating this grid
+        self._path_cache = {}
+        self._flow_cache = OrderedDict()
+
+    def cell_at(self, x, y):
+        """Get the (col, row) cell containing a world point, clamped to the grid"""
+        col = min(max(int(x) // self.cell_size, 0), self.cols - 1)
+        row = min(max(int(y) // self.cell_size, 0), self.rows - 1)
+        return (col, row)
+
+    def cell_center(self, cell):
+        """Get the world-space center of a (col, row) cell"""
+        col, row = cell
+        half = self.cell_size // 2
+        return (col * self.cell_size + half, row * self.cell_size + half)
+
+    def is_walkable(self, cell):
+        """Check if a (col, row) cell is inside the grid and walkable"""
+        col, row = cell
+        return 0 <= col < self.cols and 0 <= row < self.rows and bool(self.walkable[row, col])
+
+    def nearest_walkable(self, x, y, max_radius=8):
+        """Find the walkable cell closest to a world point
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+            max_radius: Maximum search radius in cells
+
+        Returns:
+            (col, row) tuple or None if nothing walkable is nearby
+        """
+        col, row = self.cell_at(x, y)
+        if self.walkable[row, col]:
+            return (col, row)
+
+        for radius in range(1, max_radius + 1):
+            best = None
+            best_dist = None
+            for d_row in range(-radius, radius + 1):
+                for d_col in range(-radius, radius + 1):
+                    if max(abs(d_col), abs(d_row)) != radius:
+                        continue
+                    cell = (col + d_col, row + d_row)
+                    if self.is_walkable(cell):
+                        dist = d_col * d_col + d_row * d_row
+                        if best is None or dist < best_dist:
+                            best = cell
+                            best_dist = dist
+            if best is not None:
+                return best
+        return None
+
+    def _neighbours(self, cell):
+        """Yield walkable (neighbour, cost) pairs without cutting corners"""
+        col, row = cell
+        walkable = self.walkable
+        for d_col, d_row, cost in _NEIGHBOURS:
+            n_col = col + d_col
+            n_row = row + d_row
+            if not (0 <= n_col < self.cols and 0 <= n_row < self.rows):
+                continue
+            if not walkable[n_row, n_col]:
+                continue
+            if d_col and d_row and not (walkable[row, n_col] and walkable[n_row, col]):
+                continue
+            yield (n_col, n_row), cost
+
+    def find_path(self, start, goal):
+        """Find the shortest cell path between two cells with A*
+
+        Results are cached per (start, goal) pair for the lifetime of the grid.
+
+        Args:
+            start: (col, row) start cell
+            goal: (col, row) goal cell
+
+        Returns:
+            Tuple of (col, row) cells from start to goal, or None if unreachable
+        """
+        key = (start, goal)
+        if key in self._path_cache:
+            return self._path_cache[key]
+
+        path = None
+        if self.is_walkable(start) and self.is_walkable(goal):
+            path = self._a_star(start, goal)
+
+        self._path_cache[key] = path
+        return path
+
+    def _a_star(self, start, goal):
+        """Run A* with an octile distance heuristic"""
+        goal_col, goal_row = goal
+
+        def heuristic(cell):
+            d_col = abs(cell[0] - goal_col)
+            d_row = abs(cell[1] - goal_row)
+            return max(d_col, d_row) + (math.sqrt(2) - 1) * min(d_col, d_row)
+
+        open_heap = [(heuristic(start), 0.0, start)]
+        came_from = {start: None}
+        cost_so_far = {start: 0.0}
+
+        while open_heap:
+            _, cost, cell = heapq.heappop(open_heap)
+            if cell == goal:
+                path = []
+                while cell is not None:
+                    path.append(cell)
+                    cell = came_from[cell]
+                path.reverse()
+                return tuple(path)
+            if cost > cost_so_far[cell]:
+                continue
+            for neighbour, step in self._neighbours(cell):
+                new_cost = cost + step
+                if new_cost < cost_so_far.get(neighbour, float('inf')):
+                    cost_so_far[neighbour] = new_cost
+                    came_from[neighbour] = cell
+                    heapq.heappush(open_heap, (new_cost + heuristic(neighbour), new_cost, neighbour))
+        return None
+
+    def flow_field(self, target_cell):
+        """Get the flow field leading every walkable cell toward a target cell
+
+        Flow fields are shared: every agent heading for the same target cell
+        (patrols meeting at a waypoint) reads the same cached field.
+
+        Args:
+            target_cell: (col, row) target cell
+
+        Returns:
+            (rows, cols, 2) float array of unit steering vectors; zero at the
+            target and in cells that cannot reach it
+        """
+        field = self._flow_cache.get(target_cell)
+        if field is not None:
+            self._flow_cache.move_to_end(target_cell)
+            return field
+
+        field = self._build_flow_field(target_cell)
+        self._flow_cache[target_cell] = field
+        if len(self._flow_cache) > MAX_CACHED_FLOW_FIELDS:
+            self._flow_cache.popitem(last=False)
+        return field
+
+    def _build_flow_field(self, target_cell):
+        """Run Dijkstra outward from the target and point each cell downhill"""
+        field = np.zeros((self.rows, self.cols, 2), dtype=np.float32)
+        if not self.is_walkable(target_cell):
+            return field
+
+        dist = {target_cell: 0.0}
+        heap = [(0.0, target_cell)]
+        while heap:
+            cost, cell = heapq.heappop(heap)
+            if cost > dist[cell]:
+                continue
+            for neighbour, step in self._neighbours(cell):
+                new_cost = cost + step
+                if new_cost < dist.get(neighbour, float('inf')):
+                    dist[neighbour] = new_cost
+                    heapq.heappush(heap, (new_cost, neighbour))
+
+        for cell, cost in dist.items():
+            if cell == target_cell:
+                continue
+            best = None
+            best_cost = cost
+            for neighbour, step in self._neighbours(cell):
+                neighbour_cost = dist.get(neighbour)
+                if neighbour_cost is not None and neighbour_cost + step <= best_cost + 1e-6 \
+                        and (best is None or neighbour_cost < dist[best]):
+                    best = neighbour
+            if best is not None:
+                d_col = best[0] - cell[0]
+                d_row = best[1] - cell[1]
+                length = math.sqrt(d_col * d_col + d_row * d_row)
+                field[cell[1], cell[0]] = (d_col / length, d_row / length)
+        return field
+
+    def steer(self, position, target):
+        """Get a unit steering vector from a position toward a target point
+
+        Uses the shared flow field for the target's cell, and steers straight
+        at the target once inside that cell.
+
+        Args:
+            position: (x, y) current agent center
+            target: (x, y) target agent center
+
+        Returns:
+            (dx, dy) unit vector, or (0, 0) if the target is reached/unreachable
+        """
+        target_cell = self.cell_at(*target)
+        cell = self.cell_at(*position)
+        if cell != target_cell:
+            dx, dy = self.flow_field(target_cell)[cell[1], cell[0]]
+            if dx or dy:
+                return (float(dx), float(dy))
+
+        dx = target[0] - position[0]
+        dy = target[1] - position[1]
+        length = math.sqrt(dx * dx + dy * dy)
+        if length < 1:
+            return (0.0, 0.0)
+        return (dx / length, dy / length)
+
+
+class PatrolRoute:
+    """Closed loop of waypoints joined by cached A* paths"""
+
+    def __init__(self, nav_grid, waypoints):
+        """Build the route polyline
+
+        Args:
+            nav_grid: NavGrid the route lives on
+            waypoints: List of (x, y) agent-center points, visited in order
+        """
+        cells = []
+        for x, y in waypoints:
+            cell = nav_grid.nearest_walkable(x, y)
+            if cell is not None and (not cells or cells[-1] != cell):
+                cells.append(cell)
+
+        # Keep only waypoints connected to the first one
+        if cells:
+            cells = [cells[0]] + [c for c in cells[1:] if nav_grid.find_path(cells[0], c)]
+
+        self.waypoints = [nav_grid.cell_center(cell) for cell in cells]
+
+        # Polyline through every path cell, closing the loop
+        points = []
+        waypoint_points = []  # Index into points of each waypoint
+        for i, cell in enumerate(cells):
+            waypoint_points.append(len(points))
+            path = nav_grid.find_path(cell, cells[(i + 1) % len(cells)]) or (cell,)
+            points.extend(nav_grid.cell_center(c) for c in path[:-1])
+        if cells:
+            points.append(nav_grid.cell_center(cells[0]))
+        self.points = points
+
+        # Cumulative arc length at each polyline point
+        self.distances = [0.0]
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            self.distances.append(self.distances[-1] + math.hypot(x1 - x0, y1 - y0))
+        self.length = self.distances[-1]
+        self.waypoint_distances = [self.distances[i] for i in waypoint_points]
+
+    def __len__(self):
+        return len(self.waypoints)
+
+    def position_at(self, distance):
+        """Get the point a given arc length along the loop
+
+        Args:
+            distance: Distance travelled from the first waypoint (wraps around)
+
+        Returns:
+            (x, y) agent-center point
+        """
+        if self.length <= 0:
+            return self.points[0]
+
+        distance %= self.length
+        i = bisect.bisect_right(self.distances, distance) - 1
+        i = min(i, len(self.points) - 2)
+        segment = self.distances[i + 1] - self.distances[i]
+        t = (distance - self.distances[i]) / segment if segment else 0.0
+        (x0, y0), (x1, y1) = self.points[i], self.points[i + 1]
+        return (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t)
+
+    def project(self, point):
+        """Get the arc length of the loop point closest to a world point
+
+        Args:
+            point: (x, y) agent-center point
+
+        Returns:
+            Distance along the loop from the first waypoint
+        """
+        if len(self.points) < 2:
+            return 0.0
+
+        px, py = point
+        best_distance = 0.0
+        best_sq = None
+        for i, ((x0, y0), (x1, y1)) in enumerate(zip(self.points, self.points[1:])):
+            seg_x = x1 - x0
+            seg_y = y1 - y0
+            seg_sq = seg_x * seg_x + seg_y * seg_y
+            t = ((px - x0) * seg_x + (py - y0) * seg_y) / seg_sq if seg_sq else 0.0
+            t = min(max(t, 0.0), 1.0)
+            dx = x0 + seg_x * t - px
+            dy = y0 + seg_y * t - py
+            dist_sq = dx * dx + dy * dy
+            if best_sq is None or dist_sq < best_sq:
+                best_sq = dist_sq
+                best_distance = self.distances[i] + math.sqrt(seg_sq) * t
+        return best_distance
+
+    def next_waypoint_index(self, distance):
+        """Get the index of the waypoint an agent at this arc length heads for
+
+        Args:
+            distance: Distance travelled from the first waypoint (wraps around)
+
+        Returns:
+            Waypoint index
+        """
+        if self.length <= 0:
+            return 0
+        distance %= self.length
+        i = bisect.bisect_right(self.waypoint_distances, distance)
+        return i % len(self.waypoint_distances)
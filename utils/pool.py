@@ -0,0 +1,59 @@
+"""Free-list object pools for game objects that are created and dropped often"""
+
+
+POOL_MAX_SIZE = 64  # Free objects kept per pool
+
+
+class ObjectPool:
+    """Pool of reusable objects of one type
+
+    Objects handed out by ``acquire`` are either fresh or recycled; recycled
+    ones get ``reset(*args, **kwargs)`` with the same arguments the
+    constructor takes, so both paths give an object in the same state.
+    """
+
+    def __init__(self, factory, max_size=POOL_MAX_SIZE):
+        """Create an empty pool
+
+        Args:
+            factory: Class (or callable) building a new object
+            max_size: Most free objects to keep around
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self._free = []
+
+        # Stats
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        """Get an object in its initial state
+
+        Args:
+            *args: Constructor / reset arguments
+            **kwargs: Constructor / reset keyword arguments
+
+        Returns:
+            Pooled object
+        """
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args, **kwargs)
+
+    def release(self, obj):
+        """Give an object back to the pool (it must not be used afterwards)"""
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+
+    def release_all(self, objs):
+        """Give several objects back to the pool"""
+        for obj in objs:
+            self.release(obj)
+
+    def __len__(self):
+        return len(self._free)
@@ -0,0 +1,173 @@
+"""Walkability bitmap and flood fill for checking what the player can reach"""
+
+import numpy as np
+import pygame
+
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.placement import OccupancyGrid
+
+
+REACH_CELL_SIZE = 8  # Pixels per walkability cell
+MAX_CACHED_REACHABILITY = 32  # Cached validation results, keyed by (layout, seed)
+
+# Module-level cache: (layout_key, seed) -> validation result dict
+_reachability_cache = {}
+
+
+def flood_fill(walkable, seed):
+    """Flood fill a bitmap from a seed cell (4-connected)
+
+    Instead of growing one cell per step, each pass marks whole horizontal
+    runs, then whole vertical runs, that touch the reached set. The number of
+    passes is the number of turns on the longest path, not its length.
+
+    Args:
+        walkable: (rows, cols) bool array
+        seed: (col, row) start cell
+
+    Returns:
+        (rows, cols) bool array of reached cells
+    """
+    reached = np.zeros_like(walkable)
+    col, row = seed
+    if not walkable[row, col]:
+        return reached
+    reached[row, col] = True
+
+    # Label maximal runs of walkable cells along rows and along columns (0 = blocked)
+    row_labels = _run_labels(walkable)
+    col_labels = _run_labels(walkable.T).T
+    row_hit = np.zeros(row_labels.max() + 1, dtype=bool)
+    col_hit = np.zeros(col_labels.max() + 1, dtype=bool)
+
+    count = 1
+    while True:
+        row_hit[row_labels[reached]] = True
+        row_hit[0] = False
+        reached = row_hit[row_labels]
+
+        col_hit[col_labels[reached]] = True
+        col_hit[0] = False
+        reached = col_hit[col_labels]
+
+        new_count = int(np.count_nonzero(reached))
+        if new_count == count:
+            return reached
+        count = new_count
+
+
+def _run_labels(walkable):
+    """Give every horizontal run of walkable cells a unique positive label"""
+    starts = walkable.copy()
+    starts[:, 1:] &= ~walkable[:, :-1]
+    return np.cumsum(starts).reshape(walkable.shape) * walkable
+
+
+class ReachabilityMap:
+    """Positions an agent's collision rect can reach from a start point
+
+    The bitmap holds one bit per candidate top-left position of the collision
+    rect, so checks are exact up to the cell size (and conservative).
+    """
+
+    def __init__(self, obstacle_rects, agent_width, agent_height, start,
+                 width=SCREEN_WIDTH, height=SCREEN_HEIGHT, cell_size=REACH_CELL_SIZE):
+        """Build the walkability bitmap and flood fill it
+
+        Args:
+            obstacle_rects: Iterable of pygame.Rect blocking the agent
+            agent_width: Width of the agent's collision rect
+            agent_height: Height of the agent's collision rect
+            start: (x, y) top-left of the agent's collision rect at spawn
+            width: World width in pixels
+            height: World height in pixels
+            cell_size: Size of one cell in pixels
+        """
+        self.cell_size = cell_size
+        grid = OccupancyGrid(width, height, cell_size)
+        for rect in obstacle_rects:
+            grid.stamp(rect)
+        self.walkable = grid.free_positions(pygame.Rect(0, 0, agent_width, agent_height))
+
+        seed = self._nearest_walkable(start)
+        self.start_blocked = seed is None
+        if self.start_blocked:
+            self.reached = np.zeros_like(self.walkable)
+        else:
+            self.reached = flood_fill(self.walkable, seed)
+
+        # Summed-area table for O(1) "is anything reached in this box" queries
+        self._integral = np.zeros((self.reached.shape[0] + 1, self.reached.shape[1] + 1), dtype=np.int32)
+        self._integral[1:, 1:] = self.reached.cumsum(0, dtype=np.int32).cumsum(1, dtype=np.int32)
+
+    def _nearest_walkable(self, start, max_radius=3):
+        """Get the walkable cell closest to a start point, or None"""
+        rows, cols = self.walkable.shape
+        col = int(start[0]) // self.cell_size
+        row = int(start[1]) // self.cell_size
+        for radius in range(max_radius + 1):
+            for d_row in range(-radius, radius + 1):
+                for d_col in range(-radius, radius + 1):
+                    c = col + d_col
+                    r = row + d_row
+                    if 0 <= c < cols and 0 <= r < rows and self.walkable[r, c]:
+                        return (c, r)
+        return None
+
+    def can_touch(self, target_rect, reach_rect):
+        """Check if the agent can get somewhere a rect it carries overlaps a target
+
+        Args:
+            target_rect: pygame.Rect to touch (door bubble, present bubble, ...)
+            reach_rect: pygame.Rect relative to the collision rect's top-left
+                that has to overlap the target (the collision rect itself is
+                (0, 0, w, h); a larger interaction rect can be used instead)
+
+        Returns:
+            True if some reached position touches the target
+        """
+        cs = self.cell_size
+        rows, cols = self.reached.shape
+
+        # Positions p with p + reach_rect overlapping target_rect (open interval)
+        col_lo = max((target_rect.left - reach_rect.right) // cs + 1, 0)
+        col_hi = min(-(-(target_rect.right - reach_rect.left) // cs) - 1, cols - 1)
+        row_lo = max((target_rect.top - reach_rect.bottom) // cs + 1, 0)
+        row_hi = min(-(-(target_rect.bottom - reach_rect.top) // cs) - 1, rows - 1)
+        if col_lo > col_hi or row_lo > row_hi:
+            return False
+
+        integral = self._integral
+        total = (integral[row_hi + 1, col_hi + 1] - integral[row_lo, col_hi + 1]
+                 - integral[row_hi + 1, col_lo] + integral[row_lo, col_lo])
+        return total > 0
+
+
+def get_cached_reachability(layout_key, seed):
+    """Get the cached validation result for a layout and seed
+
+    Args:
+        layout_key: Hashable id of the room layout
+        seed: Generation seed, or None (never cached)
+
+    Returns:
+        The dict passed to cache_reachability, or None
+    """
+    if seed is None:
+        return None
+    return _reachability_cache.get((layout_key, seed))
+
+
+def cache_reachability(layout_key, seed, result):
+    """Cache a validation result for a layout and seed
+
+    Args:
+        layout_key: Hashable id of the room layout
+        seed: Generation seed, or None (never cached)
+        result: dict with at least a 'reachability' ReachabilityMap
+    """
+    if seed is None:
+        return
+    if len(_reachability_cache) >= MAX_CACHED_REACHABILITY:
+        _reachability_cache.pop(next(iter(_reachability_cache)))
+    _reachability_cache[(layout_key, seed)] = result
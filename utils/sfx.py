@@ -0,0 +1,170 @@
+"""Sound effect bank - SFX decoded once and played through a prioritized channel pool"""
+
+import os
+
+import pygame
+
+from game.log import log
+
+
+# Sound effects: name -> (path, default priority). Higher priority sounds
+# steal channels from lower ones when every channel is busy.
+SFX_SOUNDS = {
+    'present_collected': ("assets/sounds/present_collected.mp3", 5),
+}
+
+SFX_CHANNELS = 8  # Mixer channels in the pool
+SFX_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache', 'sfx')
+
+
+class SoundBank:
+    """Every sound effect decoded up front and a fixed pool of channels
+
+    load() decodes each sound once into a pygame Sound (raw PCM in the
+    mixer's format) and saves the PCM in SFX_CACHE_DIR, so later launches
+    build the Sound straight from the buffer instead of decoding the MP3
+    again. play() never allocates: it picks an idle channel, or
+    steals the one playing the lowest-priority (then oldest) sound if the new
+    sound's priority is at least as high, or drops the new sound.
+    """
+
+    def __init__(self, sounds=SFX_SOUNDS, num_channels=SFX_CHANNELS, cache_dir=SFX_CACHE_DIR):
+        """Create an empty bank (nothing is decoded until load())
+
+        Args:
+            sounds: dict name -> (path, default priority)
+            num_channels: Mixer channels in the pool
+            cache_dir: Directory for decoded PCM, or None to always decode
+        """
+        self.sounds = dict(sounds)
+        self.num_channels = num_channels
+        self.cache_dir = cache_dir
+        self.loaded = False
+        self._buffers = {}  # name -> pygame.mixer.Sound
+        self._channels = []
+        self._channel_priority = []  # Priority of the sound each channel last played
+        self._channel_started = []  # Play counter when each channel last started
+        self.plays = 0
+        self.steals = 0
+        self.drops = 0
+        self.cache_hits = 0
+        self.decodes = 0
+
+    def load(self):
+        """Decode every sound and set up the channel pool (no-op after the first call)"""
+        if self.loaded:
+            return
+        if not pygame.mixer.get_init():
+            log.warning('audio', "⚠️ Sound effects disabled - mixer not initialized")
+            return
+        self.loaded = True
+
+        if pygame.mixer.get_num_channels() < self.num_channels:
+            pygame.mixer.set_num_channels(self.num_channels)
+        self._channels = [pygame.mixer.Channel(i) for i in range(self.num_channels)]
+        self._channel_priority = [0] * self.num_channels
+        self._channel_started = [0] * self.num_channels
+
+        for name, (path, _) in self.sounds.items():
+            sound = self._load_sound(name, path)
+            if sound is not None:
+                self._buffers[name] = sound
+        log.info('audio', "🔊 Sound bank: %s/%s sounds, %s from cache, %s decoded",
+                 len(self._buffers), len(self.sounds), self.cache_hits, self.decodes)
+
+    def play(self, name, priority=None, volume=1.0):
+        """Play a sound effect on a pooled channel
+
+        Args:
+            name: Sound name from SFX_SOUNDS
+            priority: Priority for this play, or None for the sound's default
+            volume: Float between 0.0 and 1.0
+
+        Returns:
+            pygame.mixer.Channel it plays on, or None if it was dropped
+        """
+        sound = self._buffers.get(name)
+        if sound is None:
+            return None
+        if priority is None:
+            priority = self.sounds[name][1]
+
+        index = self._free_channel()
+        if index is None:
+            # Every channel busy - steal the least important, oldest sound
+            index = min(range(self.num_channels),
+                        key=lambda i: (self._channel_priority[i], self._channel_started[i]))
+            if self._channel_priority[index] > priority:
+                self.drops += 1
+                return None
+            self.steals += 1
+
+        self.plays += 1
+        channel = self._channels[index]
+        channel.play(sound)
+        channel.set_volume(volume)
+        self._channel_priority[index] = priority
+        self._channel_started[index] = self.plays
+        return channel
+
+    def stop_all(self):
+        """Stop every pooled channel"""
+        for channel in self._channels:
+            channel.stop()
+
+    def report_lines(self):
+        """Get the bank statistics as lines of text"""
+        busy = self.num_channels - sum(1 for c in self._channels if not c.get_busy())
+        return [f"🔊 Sound bank: {len(self._buffers)} sounds, {busy}/{self.num_channels} channels busy, "
+                f"{self.plays} plays, {self.steals} stolen, {self.drops} dropped"]
+
+    def _free_channel(self):
+        """Get the index of an idle pooled channel, or None"""
+        for i, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                return i
+        return None
+
+    def _cache_path(self, name):
+        """Get the PCM cache file for a sound in the current mixer format"""
+        frequency, size, channels = pygame.mixer.get_init()
+        return os.path.join(self.cache_dir, f'{name}-{frequency}-{size}-{channels}.pcm')
+
+    def _load_sound(self, name, path):
+        """Build a sound from cached PCM if it is newer than the source, else decode it"""
+        cache_path = self._cache_path(name) if self.cache_dir else None
+        try:
+            if cache_path and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                with open(cache_path, 'rb') as f:
+                    sound = pygame.mixer.Sound(buffer=f.read())
+                self.cache_hits += 1
+                return sound
+        except OSError:
+            pass  # No cache yet (or the source is missing - decoding reports it)
+
+        try:
+            sound = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError) as e:
+            log.warning('audio', "⚠️ Could not load sound '%s': %s", name, e)
+            return None
+        self.decodes += 1
+
+        if cache_path:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write then rename so an interrupted write never leaves a bad cache
+                with open(cache_path + '.tmp', 'wb') as f:
+                    f.write(sound.get_raw())
+                os.replace(cache_path + '.tmp', cache_path)
+            except OSError as e:
+                log.warning('audio', "⚠️ Could not cache sound '%s': %s", name, e)
+        return sound
+
+
+# Shared instance, loaded at startup
+sfx = SoundBank()
+
+
+def play_sfx(name, priority=None, volume=1.0):
+    """Play a sound effect through the shared bank (see SoundBank.play)"""
+    return sfx.play(name, priority, volume)
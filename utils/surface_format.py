@@ -0,0 +1,78 @@
+"""Surface normalization - opaque art without alpha, exact colorkeys and RLE for sparse sprites"""
+
+import pygame
+
+
+RLE_SPARSE_FRACTION = 0.25  # Fully transparent pixel fraction from which sprites are RLE encoded
+
+# Colorkeys tried in order; a key is only used if no visible pixel has that color
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (1, 254, 1), (254, 1, 254), (3, 1, 2))
+
+
+def _unused_colorkey(surface, visible):
+    """Get a candidate colorkey no visible pixel of a surface uses, or None"""
+    for key in COLORKEY_CANDIDATES:
+        if not pygame.mask.from_threshold(surface, key, (1, 1, 1, 255)).overlap(visible, (0, 0)):
+            return key
+    return None
+
+
+def normalize_surface(surface):
+    """Convert art to the cheapest display format that draws it exactly
+
+    - No transparent pixels: convert() - no per-pixel alpha to blend
+    - Only fully transparent and fully opaque pixels: convert() with a
+      colorkey no visible pixel uses, RLE encoded
+    - Soft edges: convert_alpha(), RLE encoded if at least
+      RLE_SPARSE_FRACTION of it is empty
+
+    Subsurfaces (atlas frames) share their parent's pixels, so they are only
+    given RLE when sparse. Nothing changes before the display exists.
+
+    Args:
+        surface: Art that will not be drawn on afterwards (RLE surfaces are
+            slow to modify)
+
+    Returns:
+        Normalized pygame.Surface (the same one if nothing had to change)
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return surface
+
+    if not surface.get_flags() & pygame.SRCALPHA:
+        if surface.get_parent() is None:
+            surface = surface.convert()
+        colorkey = surface.get_colorkey()
+        if colorkey is not None:
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        return surface
+
+    pixels = surface.get_width() * surface.get_height()
+    if pixels == 0:
+        return surface
+    visible = pygame.mask.from_surface(surface, 0)  # Alpha above 0
+    opaque = pygame.mask.from_surface(surface, 254)  # Alpha 255
+    sparse = pixels - visible.count() >= pixels * RLE_SPARSE_FRACTION
+
+    if surface.get_parent() is not None:
+        if sparse:
+            surface.set_alpha(255, pygame.RLEACCEL)
+        return surface
+
+    if opaque.count() == pixels:
+        return surface.convert()
+
+    if display.get_bitsize() >= 24 and opaque.count() == visible.count():
+        key = _unused_colorkey(surface, visible)
+        if key is not None:
+            keyed = surface.convert()
+            visible.invert()
+            visible.to_surface(keyed, setcolor=key, unsetcolor=None)
+            keyed.set_colorkey(key, pygame.RLEACCEL)
+            return keyed
+
+    surface = surface.convert_alpha()
+    if sparse:
+        surface.set_alpha(255, pygame.RLEACCEL)
+    return surface
@@ -0,0 +1,99 @@
+"""Font registry and cache of rendered text surfaces"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+MAX_CACHED_TEXT = 256  # Rendered strings kept (least recently used dropped first)
+
+_fonts = {}  # (face, size) -> pygame.font.Font
+
+
+def get_font(size, face=None):
+    """Get a font, creating each (face, size) only once
+
+    Args:
+        size: Point size
+        face: Font file path, or None for pygame's default font
+
+    Returns:
+        pygame.font.Font (shared - do not change its style)
+    """
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(face, size)
+    return font
+
+
+class TextCache:
+    """LRU cache of rendered text keyed by (face, size, text, color, antialias)
+
+    Most HUD text is the same string every frame; only strings that change
+    (counters, coordinates) are rendered again.
+    """
+
+    def __init__(self, max_entries=MAX_CACHED_TEXT):
+        """Create an empty cache
+
+        Args:
+            max_entries: Rendered surfaces kept
+        """
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()  # key -> rendered surface, least recently used first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, size, color, antialias=True, face=None):
+        """Get a rendered string, rendering it on first use only
+
+        Args:
+            text: String to render
+            size: Font size
+            color: Text color
+            antialias: Smooth edges
+            face: Font file path, or None for pygame's default font
+
+        Returns:
+            pygame.Surface (shared - do not draw on it)
+        """
+        key = (face, size, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = get_font(size, face).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every rendered surface (statistics are kept)"""
+        self._surfaces.clear()
+
+    def hit_rate(self):
+        """Get the fraction of lookups served from the cache (0 before any lookup)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report_lines(self):
+        """Get the cache statistics as lines of text"""
+        return [f"🔤 Text cache: {len(self._surfaces)}/{self.max_entries} strings, "
+                f"{len(_fonts)} fonts, {self.hits} hits / {self.misses} misses "
+                f"({self.hit_rate():.1%} hit rate), {self.evictions} evicted"]
+
+
+# Shared instance used by every scene and UI element
+text_cache = TextCache()
+
+
+def render_text(text, size, color, antialias=True, face=None):
+    """Render text through the shared cache (see TextCache.render)"""
+    return text_cache.render(text, size, color, antialias, face)
@@ -0,0 +1,73 @@
+"""Tiled map layers - full-screen layers split into tiles, empty tiles dropped"""
+
+import pygame
+
+from game.render_target import view_size
+from utils.surface_format import normalize_surface
+
+
+MAP_TILE_SIZE = 64  # Tile edge in world pixels (scaled to the render target like the maps)
+
+
+class TiledLayer:
+    """A map layer cut into fixed-size tiles at load time
+
+    Tiles with no visible pixels are dropped, fully opaque tiles are
+    converted without alpha (the fast blit path) and the partly transparent
+    ones are normalized (exact colorkey, or per-pixel alpha, RLE encoded when
+    sparse - see normalize_surface). Drawing the layer is a single
+    Surface.blits call over the remaining tiles, so a mostly empty overlay
+    only touches the pixels it actually covers.
+    """
+
+    def __init__(self, surface, tile_size=None):
+        """Split a layer into tiles
+
+        Args:
+            surface: Layer surface (view resolution); not kept after splitting
+            tile_size: Tile edge in surface pixels, or None for MAP_TILE_SIZE
+                scaled to the render target
+        """
+        if tile_size is None:
+            tile_size = view_size(MAP_TILE_SIZE, MAP_TILE_SIZE)[0]
+        self.size = surface.get_size()
+        self.tile_size = tile_size
+        self.opaque_tiles = 0
+        self.alpha_tiles = 0
+        self.dropped_tiles = 0
+
+        # One alpha copy for the whole layer (255 everywhere for opaque surfaces)
+        if surface.get_colorkey() is not None:
+            surface = surface.convert_alpha() if pygame.display.get_surface() else surface
+        alpha = pygame.surfarray.array_alpha(surface)
+        convert = pygame.display.get_surface() is not None
+
+        self.blit_sequence = []
+        width, height = self.size
+        for y in range(0, height, tile_size):
+            for x in range(0, width, tile_size):
+                rect = pygame.Rect(x, y, min(tile_size, width - x), min(tile_size, height - y))
+                tile_alpha = alpha[rect.left:rect.right, rect.top:rect.bottom]
+                if not tile_alpha.any():
+                    self.dropped_tiles += 1
+                    continue
+                tile = surface.subsurface(rect)
+                if tile_alpha.min() == 255:
+                    tile = tile.convert() if convert else tile.copy()
+                    self.opaque_tiles += 1
+                else:
+                    tile = normalize_surface(tile.copy())
+                    self.alpha_tiles += 1
+                self.blit_sequence.append((tile, rect.topleft))
+
+    def __len__(self):
+        return len(self.blit_sequence)
+
+    def render(self, screen):
+        """Draw every kept tile
+
+        Args:
+            screen: Surface to draw on (view resolution, layer at (0, 0))
+        """
+        if self.blit_sequence:
+            screen.blits(self.blit_sequence, doreturn=False)